@@ -0,0 +1,78 @@
+"""
+Пропускная способность ApiClient и AsyncApiClient на локальной замене API расписания.
+
+Запуск:
+    python -m benchmarks.api_throughput --events 2000 --concurrency 1 8 32
+
+Сервер по умолчанию запускается в том же процессе и делит с клиентом GIL. Для замера без этого
+влияния сервер запускается отдельно (python -m src.stubs.schedule_api) и передается через --api-url.
+"""
+import contextlib
+import argparse
+import time
+
+import requests
+
+from src.api.api_client import ApiClient
+from src.api.async_api_client import AsyncApiClient
+from src.config.config import config
+from src.data.test_data import TestData
+from src.stubs.schedule_api import ScheduleApiServer
+
+
+def make_events(count: int) -> list:
+    """
+    События по 10 минут, разложенные по дням, чтобы не пересекаться.
+    """
+    slots = []
+    for index in range(count):
+        day, slot = divmod(index, 60)
+        hour, minute = divmod(slot * 10, 60)
+        slots.append((f"bench_{index}", f"2030-01-{1 + day % 28:02d}",
+                      f"{8 + hour:02d}:{minute:02d}", f"{8 + hour:02d}:{minute + 9:02d}"))
+    return TestData.get_personal_events(slots)
+
+
+def run_sequential(events: list) -> float:
+    client = ApiClient(session=requests.Session())
+    start = time.perf_counter()
+    for event in events:
+        client.post("/createPersonal", data=event)
+    return time.perf_counter() - start
+
+
+def run_concurrent(events: list, concurrency: int) -> float:
+    client = AsyncApiClient(concurrency=concurrency)
+    try:
+        start = time.perf_counter()
+        client.run_batch([("post", "/createPersonal", event) for event in events])
+        return time.perf_counter() - start
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--api-url", help="адрес уже запущенного API; по умолчанию локальный сервер в этом процессе")
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+
+    with contextlib.ExitStack() as stack:
+        if args.api_url:
+            config.API_URL = args.api_url
+        else:
+            config.API_URL = stack.enter_context(ScheduleApiServer()).api_url
+
+        elapsed = run_sequential(events)
+        print(f"{'ApiClient':<28} {args.events / elapsed:>8.0f} запросов/с")
+
+        for concurrency in args.concurrency:
+            elapsed = run_concurrent(events, concurrency)
+            print(f"{f'AsyncApiClient x{concurrency}':<28} {args.events / elapsed:>8.0f} запросов/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Выбор даты в выпадающем списке дней: число обращений к chromedriver и время для поопционного
+чтения значений (get_attribute на каждую опцию и разбор даты через pytz) и для чтения всех
+значений одним execute_script с запоминанием преобразования UTC -> Москва (BasePage.select_option_by_date).
+
+Без браузера (--conversion-only) замеряется только стоимость преобразования одной опции.
+
+Запуск:
+    python -m benchmarks.day_dropdown --options 14 60 365
+    python -m benchmarks.day_dropdown --conversion-only
+"""
+import argparse
+import tempfile
+import time
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytz
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+
+from benchmarks.schedule_extraction import CommandCounter
+from src.pages.base_page import BasePage
+from src.utils.calendar_time import utc_option_date
+from src.utils.driver_factory import create_driver
+
+MOSCOW = "Europe/Moscow"
+SELECT_LOCATOR = (By.CSS_SELECTOR, "select")
+
+
+def option_values(count: int) -> list:
+    """
+    Значения опций, как в кабинете: полночь по Москве в UTC, начиная с сегодняшнего дня.
+    """
+    today = datetime.now(pytz.timezone(MOSCOW)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return [(today + timedelta(days=day)).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            for day in range(count)]
+
+
+def legacy_option_date(value: str) -> str:
+    """
+    Преобразование значения опции, как до запоминания: разбор ISO и pytz на каждую опцию.
+    """
+    utc_date = datetime.fromisoformat(value.replace("Z", "")).replace(tzinfo=timezone.utc)
+    return utc_date.astimezone(pytz.timezone(MOSCOW)).strftime("%Y-%m-%d")
+
+
+def legacy_select(page: BasePage, date: str) -> bool:
+    """
+    Выбор даты обходом опций: get_attribute("value") на каждую опцию.
+    """
+    for option in Select(page.wait_for_element_clickable(SELECT_LOCATOR)).options:
+        if legacy_option_date(option.get_attribute("value")) == date:
+            option.click()
+            return True
+    return False
+
+
+def conversion_cost(values: list, repeat: int = 200) -> tuple:
+    """
+    Среднее время преобразования одной опции, мкс: поопционный разбор и запомненное преобразование.
+    """
+    utc_option_date.cache_clear()
+    results = []
+    for convert in (legacy_option_date, lambda value: utc_option_date(value, MOSCOW)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for value in values:
+                convert(value)
+        results.append((time.perf_counter() - start) * 1e6 / (repeat * len(values)))
+    return tuple(results)
+
+
+def measure(driver, select) -> tuple:
+    with CommandCounter(driver) as counter:
+        start = time.perf_counter()
+        assert select(), "Дата не выбрана"
+        return counter.total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--options", type=int, nargs="+", default=[14, 60, 365])
+    parser.add_argument("--profile", default="headless")
+    parser.add_argument("--conversion-only", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'options':>8} {'legacy, us/option':>18} {'cached, us/option':>18}")
+    for count in args.options:
+        legacy, cached = conversion_cost(option_values(count))
+        print(f"{count:>8} {legacy:>18.2f} {cached:>18.2f}")
+    if args.conversion_only:
+        return
+
+    driver = create_driver(args.profile)
+    try:
+        page = BasePage(driver)
+        print(f"\n{'options':>8} {'legacy calls':>13} {'legacy, s':>10} {'bulk calls':>11} {'bulk, s':>8}")
+        with tempfile.TemporaryDirectory() as directory:
+            for count in args.options:
+                values = option_values(count)
+                options = "".join(f'<option value="{value}">{index}</option>' for index, value in enumerate(values))
+                path = Path(directory, f"select_{count}.html")
+                path.write_text(f"<html><body><select>{options}</select></body></html>", encoding="utf-8")
+                driver.get(path.as_uri())
+
+                # Последняя дата - худший случай для обхода
+                date = legacy_option_date(values[-1])
+                legacy_calls, legacy_time = measure(driver, lambda: legacy_select(page, date))
+                bulk_calls, bulk_time = measure(driver, lambda: page.select_option_by_date(SELECT_LOCATOR, date))
+                print(f"{count:>8} {legacy_calls:>13} {legacy_time:>10.3f} {bulk_calls:>11} {bulk_time:>8.3f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Сравнение профилей браузера: время открытия страницы расписания и пиковое потребление памяти.
+
+Запуск:
+    python -m benchmarks.driver_profiles --profiles full headless lite --repeat 5
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from functools import partial
+
+from src.data.test_data import TestData
+from src.pages.schedule_page import SchedulePage
+from src.utils.browser_pool import AuthorizedBrowserPool
+from src.utils.driver_factory import PROFILES, create_driver
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class RssSampler:
+    """
+    Фоновый замер суммарного RSS процесса chromedriver и всех его потомков (процессов браузера).
+    Требует psutil; без него пиковое значение не измеряется.
+    """
+
+    def __init__(self, pid: int, interval: float = 0.05):
+        self._pid = pid
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak_bytes = 0
+
+    def __enter__(self):
+        if psutil is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self):
+        root = psutil.Process(self._pid)
+        while not self._stop.is_set():
+            try:
+                processes = [root] + root.children(recursive=True)
+                total = 0
+                for process in processes:
+                    try:
+                        total += process.memory_info().rss
+                    except psutil.Error:
+                        continue
+                self.peak_bytes = max(self.peak_bytes, total)
+            except psutil.Error:
+                return
+            self._stop.wait(self._interval)
+
+
+def benchmark_profile(profile_name: str, repeat: int) -> dict:
+    """
+    Авторизует браузер с профилем и замеряет время SchedulePage.open() repeat раз.
+    """
+    pool = AuthorizedBrowserPool(
+        driver_factory=partial(create_driver, profile_name),
+        token=TestData.GLOBAL_TOKEN,
+        email=TestData.VALID_EMAIL,
+        password=TestData.VALID_PASSWORD
+    )
+    try:
+        start = time.perf_counter()
+        driver = pool.acquire()
+        startup = time.perf_counter() - start
+
+        schedule_page = SchedulePage(driver)
+        open_times, ready_times = [], []
+
+        with RssSampler(driver.service.process.pid) as sampler:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                schedule_page.open()
+                open_times.append(time.perf_counter() - start)
+                schedule_page.is_add_event_in()
+                ready_times.append(time.perf_counter() - start)
+
+        return {
+            "profile": profile_name,
+            "startup": startup,
+            "open_median": statistics.median(open_times),
+            "ready_median": statistics.median(ready_times),
+            "ready_max": max(ready_times),
+            "peak_rss_mb": sampler.peak_bytes / 2 ** 20 if psutil is not None else None,
+        }
+    finally:
+        pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", default=sorted(PROFILES), choices=sorted(PROFILES))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if psutil is None:
+        print("psutil не установлен: пиковый RSS не измеряется (pip install psutil)")
+
+    print(f"{'profile':<10} {'startup, s':>11} {'open, s':>9} {'ready, s':>9} {'ready max':>10} {'peak RSS, MB':>13}")
+    for profile_name in args.profiles:
+        result = benchmark_profile(profile_name, args.repeat)
+        rss = f"{result['peak_rss_mb']:.0f}" if result["peak_rss_mb"] is not None else "-"
+        print(f"{result['profile']:<10} {result['startup']:>11.2f} {result['open_median']:>9.2f} "
+              f"{result['ready_median']:>9.2f} {result['ready_max']:>10.2f} {rss:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Время поиска локаторов реестра (src/pages/locators.py) на сохраненном снимке страницы.
+
+Снимок - HTML страницы, например источник страницы из вложений Allure упавшего теста
+или страницы-замены из src/stubs/ui. Для каждого локатора измеряется время поиска в браузере
+(среднее по --repeat повторам, без обращений к chromedriver) и время find_elements через WebDriver.
+Для локаторов, замененных CSS-селекторами, так же измеряется исходный XPath и сверяется,
+что оба находят одинаковое число элементов. Локаторы без совпадений на снимке помечаются missing,
+при расхождении с исходным XPath замер завершается с кодом 1.
+
+Запуск:
+    python -m benchmarks.locator_resolution src/stubs/ui/login.html --prefix login
+    python -m benchmarks.locator_resolution src/stubs/ui/schedule.html --prefix schedule \\
+        --click schedule.add_event_button schedule.personal_event_tab
+"""
+import argparse
+import sys
+import time
+
+from pathlib import Path
+
+from src.pages.base_page import BasePage
+from src.pages.locators import LOCATORS
+from src.utils.driver_factory import create_driver
+from src.utils.wait_engine import WaitEngine
+
+# [[стратегия (xpath или css), выражение], ...], число повторов -> [[совпадений, мкс на поиск], ...]
+RESOLVE_SCRIPT = """
+    var repeat = arguments[1];
+    return arguments[0].map(function (locator) {
+        var kind = locator[0], value = locator[1];
+        var resolve = kind === 'xpath'
+            ? function () {
+                return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null)
+                    .snapshotLength;
+            }
+            : function () { return document.querySelectorAll(value).length; };
+        var count = resolve();
+        var start = performance.now();
+        for (var i = 0; i < repeat; i++) {
+            resolve();
+        }
+        return [count, (performance.now() - start) * 1000 / repeat];
+    });
+"""
+
+
+def resolve_in_browser(driver, locators, repeat: int) -> list:
+    """
+    Число совпадений и среднее время поиска в браузере, мкс, для каждого локатора.
+    Локаторы, которые нельзя искать скриптом (текст ссылки), возвращают None.
+    """
+    script_locators = [WaitEngine._script_locator(locator) for locator in locators]
+    measurable = [list(locator) for locator in script_locators if locator is not None]
+    results = iter(driver.execute_script(RESOLVE_SCRIPT, measurable, repeat))
+    return [next(results) if locator is not None else None for locator in script_locators]
+
+
+def roundtrip(driver, locator, repeat: int) -> float:
+    """
+    Среднее время find_elements через WebDriver, мс.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        driver.find_elements(*locator)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("snapshot", type=Path, help="HTML снимок страницы")
+    parser.add_argument("--prefix", default="", help="измерять только локаторы с таким префиксом имени")
+    parser.add_argument("--click", nargs="*", default=[], help="локаторы, по которым кликнуть перед замером")
+    parser.add_argument("--repeat", type=int, default=200, help="повторов поиска в браузере")
+    parser.add_argument("--roundtrips", type=int, default=20, help="повторов find_elements через WebDriver")
+    parser.add_argument("--profile", default="headless")
+    args = parser.parse_args()
+
+    entries = [entry for entry in LOCATORS if entry.name.startswith(args.prefix)]
+    driver = create_driver(args.profile)
+    try:
+        driver.get(args.snapshot.resolve().as_uri())
+        page = BasePage(driver)
+        for name in args.click:
+            page.click(LOCATORS.get(name))
+
+        current = resolve_in_browser(driver, [entry.locator for entry in entries], args.repeat)
+        legacy = resolve_in_browser(driver, [("xpath", entry.xpath) for entry in entries if entry.xpath],
+                                    args.repeat)
+        legacy_results = iter(legacy)
+
+        mismatches = 0
+        print(f"{'locator':<34} {'matches':>7} {'in page, us':>12} {'xpath, us':>10} {'speedup':>8} "
+              f"{'webdriver, ms':>14}  status")
+        for entry, result in zip(entries, current):
+            count, micros = result if result is not None else ("-", None)
+            legacy_count, legacy_micros = next(legacy_results) if entry.xpath else (None, None)
+
+            status = "ok"
+            if count == 0:
+                status = "missing"
+            if legacy_count is not None and legacy_count != count:
+                status = f"MISMATCH (xpath: {legacy_count})"
+                mismatches += 1
+
+            in_page = f"{micros:.1f}" if micros is not None else "-"
+            xpath = f"{legacy_micros:.1f}" if legacy_micros is not None else "-"
+            speedup = f"{legacy_micros / micros:.1f}x" if legacy_micros and micros else "-"
+            webdriver = roundtrip(driver, entry.locator, args.roundtrips)
+            print(f"{entry.name:<34} {count:>7} {in_page:>12} {xpath:>10} {speedup:>8} {webdriver:>14.2f}  {status}")
+    finally:
+        driver.quit()
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
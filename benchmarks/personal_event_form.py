@@ -0,0 +1,88 @@
+"""
+Заполнение формы личного события: число обращений к chromedriver и время для пошаговых методов
+страницы, каждый из которых ищет свой элемент от корня документа, для create_personal_event,
+который находит окно один раз и переиспользует найденные поля (FormContext), и для create_personal_event
+в режиме fill_mode="script", который заполняет все поля одним вызовом execute_script.
+
+Форма открывается на локальной замене страницы расписания (src/stubs/ui/schedule.html).
+
+Запуск:
+    python -m benchmarks.personal_event_form --repeat 10
+"""
+import argparse
+import time
+
+from collections import Counter
+
+from benchmarks.schedule_extraction import CommandCounter
+from src.config.config import config
+from src.data.test_data import TestData
+from src.pages.schedule_page import SchedulePage
+from src.stubs.schedule_ui import ScheduleUiServer
+from src.utils.driver_factory import create_driver
+
+
+def fill_step_by_step(page: SchedulePage, title: str, date: str) -> None:
+    page.click_add_event_button()
+    page.switch_to_personal_event_tab()
+    page.enter_personal_event_name(title)
+    page.enter_personal_event_description(TestData.PERSONAL_EVENT_DESCRIPTION)
+    page.click_on_day_dropdown_list()
+    page.click_day_options_from_drop_down_list(date)
+    page.select_time_picker("10:00", "10:30")
+    page.click_create_personal_event_submit_button()
+
+
+def fill_with_form_context(page: SchedulePage, title: str, date: str) -> None:
+    page.create_personal_event(title, TestData.PERSONAL_EVENT_DESCRIPTION, date, "10:00", "10:30")
+
+
+def fill_with_script(page: SchedulePage, title: str, date: str) -> None:
+    page.create_personal_event(title, TestData.PERSONAL_EVENT_DESCRIPTION, date, "10:00", "10:30",
+                               fill_mode="script")
+
+
+def measure(page: SchedulePage, fill, repeat: int) -> tuple:
+    """
+    Среднее число команд WebDriver по видам, среднее число команд и среднее время заполнения формы.
+    """
+    commands, seconds = Counter(), 0.0
+    date = TestData.date()
+    for index in range(repeat):
+        page.open()
+        title = f"{fill.__name__}_{index}"
+        with CommandCounter(page.driver) as counter:
+            start = time.perf_counter()
+            fill(page, title, date)
+            seconds += time.perf_counter() - start
+        commands += counter.commands
+        assert page.is_personal_event_created(title), "Событие не создано"
+
+    average = Counter({name: count / repeat for name, count in commands.items()})
+    return average, sum(average.values()), seconds / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--profile", default="headless")
+    args = parser.parse_args()
+
+    with ScheduleUiServer() as server:
+        config.SCHEDULE_URL = server.schedule_url
+        driver = create_driver(args.profile)
+        try:
+            page = SchedulePage(driver)
+            results = {fill.__name__: measure(page, fill, args.repeat)
+                       for fill in (fill_step_by_step, fill_with_form_context, fill_with_script)}
+        finally:
+            driver.quit()
+
+    print(f"{'flow':<24} {'commands':>9} {'time, s':>8}  by command")
+    for name, (by_command, total, seconds) in results.items():
+        details = ", ".join(f"{command} {count:.1f}" for command, count in by_command.most_common())
+        print(f"{name:<24} {total:>9.1f} {seconds:>8.3f}  {details}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Регрессионные замеры ключевых сценариев на локальных заменах API и страниц кабинета.
+
+Каждый сценарий выполняется --repeat раз (после одного прогрева), для него считаются p50, p95 и max.
+Без --flows замеряются сценарии, для которых есть базовые значения (все сценарии, если их нет ни для одного).
+Результаты сравниваются с базовыми значениями из benchmarks/baselines.json: если p50 или p95
+хуже базового больше чем на --tolerance (и больше чем на --min-delta секунд), замер завершается
+с кодом 1. Сценарий без базового значения тоже завершает замер с кодом 1 (до запуска сценариев),
+если не передан --allow-missing. С --update-baseline измеренные значения записываются как новые базовые.
+Базовые значения записываются вместе с платформой, на которой они сняты; при замере на другой платформе
+выводится предупреждение: такие замеры несравнимы. UI-сценариям нужен Chrome.
+
+Запуск:
+    python -m benchmarks.regression --update-baseline --flows api_cycle
+    python -m benchmarks.regression --repeat 10
+    python -m benchmarks.regression --flows api_cycle --allow-missing
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from src.api.api_client import ApiClient
+from src.config.config import config
+from src.data.test_data import TestData
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.pages.schedule_page import SchedulePage
+from src.stubs.schedule_api import ScheduleApiServer
+from src.stubs.schedule_ui import ScheduleUiServer
+from src.utils.driver_factory import create_driver
+from src.utils.step_profiler import percentile
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+BASELINES_VERSION = 1
+METRICS = ("p50", "p95", "max")
+
+
+class BenchmarkContext:
+    """
+    Локальные замены API и страниц кабинета и браузер, общий для UI-сценариев.
+    """
+
+    def __init__(self, driver_profile: str):
+        self.driver_profile = driver_profile
+        self.api_server = ScheduleApiServer().start()
+        self.ui_server = ScheduleUiServer().start()
+        self._driver = None
+        self._sequence = 0
+
+        config.API_URL = self.api_server.api_url
+        config.BASE_URL = self.ui_server.base_url
+        config.LOGIN_URL = self.ui_server.login_url
+        config.SCHEDULE_URL = self.ui_server.schedule_url
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = create_driver(self.driver_profile)
+        return self._driver
+
+    def next_title(self) -> str:
+        self._sequence += 1
+        return f"bench_{self._sequence}"
+
+    def close(self) -> None:
+        if self._driver is not None:
+            self._driver.quit()
+        self.ui_server.stop()
+        self.api_server.stop()
+
+
+def flow_login(context: BenchmarkContext) -> Callable[[], None]:
+    def run():
+        context.driver.delete_all_cookies()
+        LoginPage(context.driver).login("teacher@example.com", "password")
+        assert MainPage(context.driver).is_user_logged_in(), "Вход не выполнен"
+
+    return run
+
+
+def flow_create_personal_event(context: BenchmarkContext) -> Callable[[], None]:
+    schedule_page = SchedulePage(context.driver)
+
+    def run():
+        schedule_page.open()
+        title = context.next_title()
+        schedule_page.create_personal_event(title, TestData.PERSONAL_EVENT_DESCRIPTION, TestData.date(),
+                                            "10:00", "10:30")
+        assert schedule_page.is_personal_event_created(title), "Событие не создано"
+
+    return run
+
+
+def flow_get_personal_event_from_schedule(context: BenchmarkContext, events: int = 200) -> Callable[[], None]:
+    schedule_page = SchedulePage(context.driver)
+
+    # Последнее событие страницы-замены: события идут по 15 минут с полуночи
+    hour, minute = divmod((events - 1) % 96 * 15, 60)
+    start_time, end_time = f"{hour:02d}:{minute:02d}", f"{hour:02d}:{minute + 14:02d}"
+
+    def run():
+        context.driver.get(f"{config.SCHEDULE_URL}?events={events}")
+        event = schedule_page.get_personal_event_from_schedule(f"bench_{events - 1}", start_time, end_time)
+        assert event is not None, "Событие не найдено"
+
+    return run
+
+
+def flow_api_cycle(context: BenchmarkContext) -> Callable[[], None]:
+    client = ApiClient(session=requests.Session())
+    date = TestData.date()
+
+    def run():
+        title = context.next_title()
+        created = client.post("/createPersonal", data=TestData.get_personal_event(
+            title=title, date=date, start_at="10:00", end_at="10:30"))
+        event = created.json()["data"]
+        event_id = event["payload"]["id"]
+
+        updated = client.post("/updatePersonal", data=TestData.get_personal_event_by_id(
+            title=f"{title}_edited", event_id=event_id, date=date, start_at="11:00", end_at="11:30",
+            old_start_at=event["startAt"]))
+        assert updated.status_code == 200, updated.text
+
+        removed = client.post("/removePersonal", data=TestData.get_personal_event_by_id(
+            title=f"{title}_edited", event_id=event_id, date=date, start_at="11:00", end_at="11:30",
+            is_edit=False))
+        assert removed.status_code == 200, removed.text
+
+    return run
+
+
+FLOWS: Dict[str, Callable[[BenchmarkContext], Callable[[], None]]] = {
+    "login": flow_login,
+    "create_personal_event": flow_create_personal_event,
+    "get_personal_event_from_schedule": flow_get_personal_event_from_schedule,
+    "api_cycle": flow_api_cycle,
+}
+
+
+def measure(run: Callable[[], None], repeat: int, warmup: int = 1) -> dict:
+    """
+    Выполняет сценарий warmup + repeat раз и возвращает p50, p95 и max по замерам.
+    """
+    for _ in range(warmup):
+        run()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "p50": round(percentile(samples, 50), 6),
+        "p95": round(percentile(samples, 95), 6),
+        "max": round(max(samples), 6),
+        "repeat": repeat,
+    }
+
+
+def load_baselines(path: Path) -> dict:
+    if not path.exists():
+        return {"version": BASELINES_VERSION, "flows": {}}
+
+    baselines = json.loads(path.read_text(encoding="utf-8"))
+    if baselines.get("version") != BASELINES_VERSION:
+        raise ValueError(f"Версия файла базовых значений {path} {baselines.get('version')} "
+                         f"не поддерживается (ожидается {BASELINES_VERSION})")
+    return baselines
+
+
+def save_baselines(path: Path, baselines: dict, results: Dict[str, dict]) -> None:
+    recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    for name, result in results.items():
+        baselines["flows"][name] = dict(result, recorded_at=recorded_at, platform=platform.platform())
+    path.write_text(json.dumps(baselines, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def find_regressions(name: str, result: dict, baseline: Optional[dict], tolerance: float, min_delta: float,
+                     metrics: List[str]) -> List[str]:
+    """
+    Метрики сценария, ухудшившиеся относительно базовых значений сверх допуска.
+    """
+    if baseline is None:
+        return []
+
+    regressions = []
+    for metric in metrics:
+        limit = max(baseline[metric] * (1 + tolerance), baseline[metric] + min_delta)
+        if result[metric] > limit:
+            regressions.append(f"{name}: {metric} {result[metric]:.3f} с > {limit:.3f} с "
+                               f"(базовое {baseline[metric]:.3f} с)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS),
+                        help="сценарии; по умолчанию - сценарии с базовыми значениями")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимое ухудшение, доля базового значения")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="допустимое ухудшение в секундах")
+    parser.add_argument("--metrics", nargs="+", default=["p50", "p95"], choices=METRICS,
+                        help="метрики, ухудшение которых считается регрессией")
+    parser.add_argument("--baseline", type=Path, default=BASELINES_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="не считать ошибкой сценарии без базовых значений")
+    parser.add_argument("--driver-profile", default="headless")
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline)
+    if args.flows is None:
+        args.flows = [name for name in FLOWS if name in baselines["flows"]] or list(FLOWS)
+    missing = [name for name in args.flows if name not in baselines["flows"]]
+    if missing and not args.update_baseline and not args.allow_missing:
+        print(f"Нет базовых значений в {args.baseline} для сценариев: {', '.join(missing)}. "
+              f"Запишите их с --update-baseline или запустите с --allow-missing", file=sys.stderr)
+        return 1
+
+    for name in args.flows:
+        recorded_on = baselines["flows"].get(name, {}).get("platform")
+        if recorded_on and recorded_on != platform.platform() and not args.update_baseline:
+            print(f"Предупреждение: базовые значения {name} сняты на {recorded_on}, "
+                  f"замер выполняется на {platform.platform()}", file=sys.stderr)
+
+    results, regressions = {}, []
+
+    context = BenchmarkContext(args.driver_profile)
+    try:
+        print(f"{'flow':<34} {'p50, s':>8} {'p95, s':>8} {'max, s':>8} {'base p50':>9} {'base p95':>9}  status")
+        for name in args.flows:
+            result = results[name] = measure(FLOWS[name](context), args.repeat)
+            baseline = baselines["flows"].get(name)
+            flow_regressions = find_regressions(name, result, baseline, args.tolerance, args.min_delta, args.metrics)
+            regressions += flow_regressions
+
+            base_p50 = f"{baseline['p50']:.3f}" if baseline else "-"
+            base_p95 = f"{baseline['p95']:.3f}" if baseline else "-"
+            status = "REGRESSION" if flow_regressions else ("ok" if baseline else "no baseline")
+            print(f"{name:<34} {result['p50']:>8.3f} {result['p95']:>8.3f} {result['max']:>8.3f} "
+                  f"{base_p50:>9} {base_p95:>9}  {status}")
+    finally:
+        context.close()
+
+    if args.update_baseline:
+        save_baselines(args.baseline, baselines, results)
+        print(f"Базовые значения сохранены в {args.baseline}")
+        return 0
+
+    for regression in regressions:
+        print(f"Регрессия: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
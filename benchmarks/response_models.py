@@ -0,0 +1,111 @@
+"""
+Разбор ответа /getSchedule: время и память для response.json() и для моделей ответов
+(src/api/models.py) на синтетическом расписании из большого числа событий.
+
+Сценарии:
+    response.json()     - разбор тела стандартным json и поиск события по цепочке .get()
+    listing (json)      - ScheduleListing с разбором стандартным json, поиск события по названию
+    listing (orjson)    - то же с разбором через orjson (если установлен)
+    materialize         - модели всех событий расписания
+
+Память - пик и остаток после разбора по tracemalloc (остаток - то, что удерживает результат).
+
+Запуск:
+    python -m benchmarks.response_models --events 1000 10000 50000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from typing import Callable
+
+import requests
+
+from src.api import models
+from src.api.models import ScheduleListing
+
+
+def make_response(count: int) -> requests.Response:
+    """
+    Ответ /getSchedule с count событиями в формате API.
+    """
+    payload = []
+    for index in range(count):
+        day, minute = divmod(index, 96)
+        start = f"2030-01-{1 + day % 28:02d}T{minute // 4:02d}:{minute % 4 * 15:02d}:00+03:00"
+        payload.append({
+            "type": "personal", "startAt": start, "endAt": start,
+            "payload": {"id": index + 1, "title": f"bench_{index}", "description": "Описание события",
+                        "color": "#43B658", "backgroundColor": "#EBFDF2"},
+        })
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": {"payload": payload}}, ensure_ascii=False).encode("utf-8")
+    return response
+
+
+def find_in_json(response: requests.Response, title: str):
+    for event in response.json().get("data").get("payload"):
+        if event.get("payload").get("title") == title:
+            return event
+
+
+def find_in_listing(response: requests.Response, title: str):
+    return ScheduleListing.from_response(response).find_by_title(title)
+
+
+def materialize(response: requests.Response, title: str):
+    """
+    Модели всех событий, как при разборе ответа целиком.
+    """
+    events = list(ScheduleListing.from_response(response))
+    assert any(event.payload.title == title for event in events)
+    return events
+
+
+def measure(parse: Callable, response: requests.Response, title: str, repeat: int) -> tuple:
+    """
+    Среднее время разбора, пик и остаток памяти (МБ).
+    """
+    parse(response, title)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(response, title)
+    seconds = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    result = parse(response, title)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result, "Событие не найдено"
+    return seconds, peak / 2 ** 20, retained / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fast_decoder = models.orjson
+    print(f"{'events':>7} {'flow':<18} {'time, ms':>9} {'peak, MB':>9} {'retained, MB':>13}")
+    for count in args.events:
+        response = make_response(count)
+        title = f"bench_{count - 1}"
+        flows = [("response.json()", find_in_json, None), ("listing (json)", find_in_listing, None)]
+        if fast_decoder is not None:
+            flows.append(("listing (orjson)", find_in_listing, fast_decoder))
+        flows.append(("materialize", materialize, fast_decoder))
+
+        for name, parse, decoder in flows:
+            models.orjson = decoder
+            try:
+                seconds, peak, retained = measure(parse, response, title, args.repeat)
+            finally:
+                models.orjson = fast_decoder
+            print(f"{count:>7} {name:<18} {seconds * 1000:>9.2f} {peak:>9.2f} {retained:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
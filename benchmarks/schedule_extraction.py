@@ -0,0 +1,125 @@
+"""
+Поиск личного события в расписании: число обращений к chromedriver и время
+для поэлементного обхода, для пакетного извлечения одним execute_script
+и для повторного поиска по индексу событий без изменений DOM.
+
+Страница расписания заменяется локальным HTML с заданным числом событий.
+
+Запуск:
+    python -m benchmarks.schedule_extraction --events 50 200 500
+"""
+import argparse
+import tempfile
+import time
+
+from collections import Counter
+from functools import partial
+from pathlib import Path
+
+from selenium.common import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from src.pages.schedule_page import SchedulePage
+from src.utils.driver_factory import create_driver
+
+EVENT_TEMPLATE = """
+<tcc-calendar-event-personal>
+  <div class="long-view" style="background-color: #e0f0ff">
+    <div class="long-view__title">bench_{index}</div>
+    <div class="long-view__time">{start} – {end}</div>
+  </div>
+</tcc-calendar-event-personal>"""
+
+
+class CommandCounter:
+    """
+    Считает команды WebDriver, отправленные драйвером и его элементами.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._execute = driver.execute
+        self.commands = Counter()
+
+    def __enter__(self):
+        def execute(command, params=None):
+            self.commands[command] += 1
+            return self._execute(command, params)
+
+        self._driver.execute = execute
+        return self
+
+    def __exit__(self, *exc):
+        del self._driver.execute
+
+    @property
+    def total(self) -> int:
+        return sum(self.commands.values())
+
+
+def render_schedule(count: int) -> str:
+    events = []
+    for index in range(count):
+        hour, minute = divmod(index % 96 * 15, 60)
+        events.append(EVENT_TEMPLATE.format(index=index, start=f"{hour:02d}:{minute:02d}",
+                                            end=f"{hour:02d}:{minute + 14:02d}"))
+    return f"<html><body>{''.join(events)}</body></html>"
+
+
+def legacy_lookup(page: SchedulePage, event_name: str, start_time: str, end_time: str):
+    """
+    Поиск события обходом элементов, как до пакетного извлечения: три обращения на событие.
+    """
+    for event in page.find_elements(page.PERSONAL_EVENT_CONTAINER):
+        try:
+            long_view_container = event.find_element(By.CSS_SELECTOR, 'div.long-view')
+            event_title = long_view_container.find_element(By.CSS_SELECTOR, '.long-view__title').text
+            event_time = long_view_container.find_element(By.CSS_SELECTOR, '.long-view__time').text
+        except NoSuchElementException:
+            continue
+
+        if event_title == event_name and event_time.split()[0] == start_time and event_time.split()[2] == end_time:
+            return event
+    return None
+
+
+def measure(driver, lookup) -> tuple:
+    with CommandCounter(driver) as counter:
+        start = time.perf_counter()
+        assert lookup() is not None, "Событие не найдено"
+        return counter.total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--profile", default="headless")
+    args = parser.parse_args()
+
+    driver = create_driver(args.profile)
+    try:
+        page = SchedulePage(driver)
+        print(f"{'events':>7} {'legacy calls':>13} {'legacy, s':>10} {'bulk calls':>11} {'bulk, s':>8} "
+              f"{'cached calls':>13} {'cached, s':>10}")
+        with tempfile.TemporaryDirectory() as directory:
+            for count in args.events:
+                path = Path(directory, f"schedule_{count}.html")
+                path.write_text(render_schedule(count), encoding="utf-8")
+                driver.get(path.as_uri())
+
+                # Последнее событие - худший случай для обхода
+                target = page.extract_personal_events()[-1]
+                legacy_calls, legacy_time = measure(
+                    driver, lambda: legacy_lookup(page, target.title, target.start_time, target.end_time))
+                indexed_lookup = partial(page.get_personal_event_from_schedule,
+                                         target.title, target.start_time, target.end_time)
+                bulk_calls, bulk_time = measure(driver, indexed_lookup)
+                cached_calls, cached_time = measure(driver, indexed_lookup)
+                print(f"{count:>7} {legacy_calls:>13} {legacy_time:>10.2f} {bulk_calls:>11} {bulk_time:>8.2f} "
+                      f"{cached_calls:>13} {cached_time:>10.3f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
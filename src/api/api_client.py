@@ -1,5 +1,9 @@
+from typing import Callable, Optional, Type, Union
+
 import requests
 from src.config.config import config
+from src.api.models import ResponseModel
+from src.api.retry import RetryPolicy
 
 
 class ApiClient:
@@ -7,72 +11,114 @@ class ApiClient:
     Клиент для взаимодействия с API.
 
     Предоставляет методы для отправки GET, POST, PUT и DELETE запросов к API.
+    Если передана политика повторов, запросы повторяются при перегрузке API (429, 5xx).
+    Токен можно передать функцией (например, TokenService.get_token): тогда перед каждым запросом
+    берется актуальное значение, и клиент продолжает работать после обновления токена. Cookie
+    с обновленным токеном передается заголовком запроса, а не сессии: сессию используют
+    одновременно потоки AsyncApiClient.
+    Если передана модель ответа (src/api/models.py), методы возвращают разобранную и проверенную модель.
     """
 
-    def __init__(self, session: requests.Session, token=None):
+    def __init__(self, session: requests.Session,
+                 token: Union[str, Callable[[], Optional[str]], None] = None, retry_policy: RetryPolicy = None):
         self.session = session
         self.base_url = config.API_URL
-        self.token = token
-        self.session.headers.update({
-            "Cookie": f'token_global={token}' if token else "",
-            "Content-Type": "application/json"
-        })
+        self._token_source = token if callable(token) else None
+        self.token = None
+        self.retry_policy = retry_policy
+        self.token = token() if callable(token) else token
+        self.session.headers.update({"Cookie": self._cookie(self.token), "Content-Type": "application/json"})
+
+    @staticmethod
+    def _cookie(token: Optional[str]) -> str:
+        return f'{config.AUTH_COOKIE_NAME}={token}' if token else ""
+
+    @staticmethod
+    def _parse(response: requests.Response, model: Optional[Type[ResponseModel]]):
+        return response if model is None else model.from_response(response)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Отправляет запрос с учетом политики повторов.
+        """
+        if self._token_source is not None:
+            self.token = self._token_source()
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Cookie": self._cookie(self.token)}
+
+        url = self.base_url + endpoint
+        if self.retry_policy is None:
+            return self.session.request(method, url, **kwargs)
+
+        return self.retry_policy.execute(method, endpoint, lambda: self.session.request(method, url, **kwargs))
 
-    def get(self, endpoint, params=None):
+    def get(self, endpoint, params=None, model=None, headers=None):
         """
         Отправляет GET запрос к API.
 
         Args:
             endpoint (str): Конечная точка API.
             params (dict, optional): Параметры запроса. Defaults to None.
+            headers (dict, optional): Дополнительные заголовки (например, If-None-Match). Defaults to None.
+            model (Type[ResponseModel], optional): Модель ответа. Defaults to None.
 
         Returns:
-            requests.Response: Ответ от API.
+            requests.Response: Ответ от API или модель ответа, если передан model.
+
+        Raises:
+            ResponseValidationError: ответ не соответствует модели.
         """
-        url = self.base_url + endpoint
-        response = self.session.get(url, params=params)
-        return response
+        response = self._send("GET", endpoint, params=params, headers=headers)
+        return self._parse(response, model)
 
-    def post(self, endpoint, data=None):
+    def post(self, endpoint, data=None, model=None):
         """
         Отправляет POST запрос к API.
 
         Args:
             endpoint (str): Конечная точка API.
             data (dict, optional): Данные для отправки. Defaults to None.
+            model (Type[ResponseModel], optional): Модель ответа. Defaults to None.
 
         Returns:
-            requests.Response: Ответ от API.
+            requests.Response: Ответ от API или модель ответа, если передан model.
+
+        Raises:
+            ResponseValidationError: ответ не соответствует модели.
         """
-        url = self.base_url + endpoint
-        response = self.session.post(url, json=data)
-        return response
+        response = self._send("POST", endpoint, json=data)
+        return self._parse(response, model)
 
-    def put(self, endpoint, data=None):
+    def put(self, endpoint, data=None, model=None):
         """
         Отправляет PUT запрос к API.
 
         Args:
             endpoint (str): Конечная точка API.
             data (dict, optional): Данные для отправки. Defaults to None.
+            model (Type[ResponseModel], optional): Модель ответа. Defaults to None.
 
         Returns:
-            requests.Response: Ответ от API.
+            requests.Response: Ответ от API или модель ответа, если передан model.
+
+        Raises:
+            ResponseValidationError: ответ не соответствует модели.
         """
-        url = self.base_url + endpoint
-        response = self.session.put(url, json=data)
-        return response
+        response = self._send("PUT", endpoint, json=data)
+        return self._parse(response, model)
 
-    def delete(self, endpoint):
+    def delete(self, endpoint, model=None):
         """
         Отправляет DELETE запрос к API.
 
         Args:
             endpoint (str): Конечная точка API.
+            model (Type[ResponseModel], optional): Модель ответа. Defaults to None.
 
         Returns:
-            requests.Response: Ответ от API.
+            requests.Response: Ответ от API или модель ответа, если передан model.
+
+        Raises:
+            ResponseValidationError: ответ не соответствует модели.
         """
-        url = self.base_url + endpoint
-        response = self.session.delete(url,)
-        return response
+        response = self._send("DELETE", endpoint)
+        return self._parse(response, model)
@@ -0,0 +1,138 @@
+import asyncio
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Sequence
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from src.api.api_client import ApiClient
+from src.api.retry import RetryPolicy
+
+
+class AsyncApiClient:
+    """
+    Асинхронный клиент для взаимодействия с API.
+
+    Повторяет методы ApiClient (get, post, put, delete) в виде корутин и позволяет отправлять
+    пачки запросов параллельно. Запросы выполняются синхронным ApiClient в пуле потоков,
+    поэтому вся логика ApiClient (заголовки, авторизация) остается общей. Число одновременных
+    запросов ограничено concurrency, соединения переиспользуются (keep-alive) через пул
+    соединений того же размера.
+    """
+
+    METHODS = ("get", "post", "put", "delete")
+
+    def __init__(self, session: Optional[requests.Session] = None, token=None, concurrency: int = 10,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Args:
+            session: сессия requests; если не передана, создается сессия с пулом соединений размера concurrency
+            token: токен авторизации (cookie token_global) или функция, возвращающая актуальный токен
+            concurrency: максимальное число одновременных запросов
+            retry_policy: политика повторов запросов (см. ApiClient)
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        self.client = ApiClient(session=session, token=token, retry_policy=retry_policy)
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="api-client")
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def session(self) -> requests.Session:
+        return self.client.session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков и закрывает соединения.
+        """
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    async def _call(self, method: str, *args) -> requests.Response:
+        """
+        Выполняет метод синхронного клиента в пуле потоков с учетом лимита одновременных запросов.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Неподдерживаемый метод '{method}'. Доступные методы: {', '.join(self.METHODS)}")
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, getattr(self.client, method), *args)
+
+    async def get(self, endpoint, params=None) -> requests.Response:
+        """
+        Отправляет GET запрос к API.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            params (dict, optional): Параметры запроса. Defaults to None.
+        """
+        return await self._call("get", endpoint, params)
+
+    async def post(self, endpoint, data=None) -> requests.Response:
+        """
+        Отправляет POST запрос к API.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            data (dict, optional): Данные для отправки. Defaults to None.
+        """
+        return await self._call("post", endpoint, data)
+
+    async def put(self, endpoint, data=None) -> requests.Response:
+        """
+        Отправляет PUT запрос к API.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            data (dict, optional): Данные для отправки. Defaults to None.
+        """
+        return await self._call("put", endpoint, data)
+
+    async def delete(self, endpoint) -> requests.Response:
+        """
+        Отправляет DELETE запрос к API.
+
+        Args:
+            endpoint (str): Конечная точка API.
+        """
+        return await self._call("delete", endpoint)
+
+    async def gather(self, calls: Iterable[Sequence], return_exceptions: bool = False) -> List[requests.Response]:
+        """
+        Отправляет пачку запросов параллельно.
+
+        Args:
+            calls: описания запросов в виде (метод, endpoint[, data или params]),
+                например ("post", "/createPersonal", event_data)
+            return_exceptions: вернуть исключения на месте ответов вместо прерывания всей пачки
+
+        Returns:
+            Ответы в том же порядке, что и запросы.
+        """
+        coroutines = [self._call(method, *args) for method, *args in calls]
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    def run_batch(self, calls: Iterable[Sequence], return_exceptions: bool = False) -> List[requests.Response]:
+        """
+        Синхронная обертка над gather() для фикстур и кода вне event loop.
+        """
+        return asyncio.run(self.gather(calls, return_exceptions=return_exceptions))
@@ -0,0 +1,287 @@
+import gzip
+import json
+import os
+import re
+import threading
+
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.config.config import config
+from src.utils.logger_utils import logger
+
+
+class CassetteMismatchError(AssertionError):
+    """
+    Запрос не найден в кассете в строгом режиме воспроизведения.
+    """
+
+
+class Cassette:
+    """
+    Кассета с записанными парами запрос/ответ API.
+
+    Хранится на диске в сжатом JSON и индексируется в памяти по ключу
+    (метод, конечная точка, нормализованное тело запроса). При нормализации изменчивые
+    значения (даты, идентификатор запуска и случайный суффикс в названиях событий) заменяются
+    заглушками, поэтому записанные ответы совпадают с запросами последующих запусков.
+    Одинаковые запросы воспроизводятся в порядке записи; когда записанные ответы закончились, последний
+    ответ повторяется (кроме строгого режима, в котором это ошибка). Запись помечается
+    тестом, во время которого сделан запрос (scope), и при воспроизведении сначала берутся ответы того же
+    теста: порядок тестов может отличаться от записи (например, при другом распределении по воркерам).
+    Изменчивые значения, которые API возвращает из запроса (название, даты), в воспроизводимом
+    ответе подменяются значениями из текущего запроса. Подмены запоминаются до конца теста (scope), поэтому
+    и ответ на запрос без тела (например, расписание с созданным ранее в тесте событием) содержит названия
+    и даты текущего запуска, а одинаковые записанные значения разных тестов подменяются независимо.
+    """
+
+    # 2 - в ключах заменяется время суток, записи помечены тестом (scope)
+    FORMAT_VERSION = 2
+
+    # Изменчивые фрагменты строк в телах запросов и их заглушки
+    VOLATILE_PATTERNS = (
+        (re.compile(r"\d{4}-\d{2}-\d{2}"), "<date>"),
+        (re.compile(r"T\d{2}:\d{2}"), "T<time>"),
+        (re.compile(r"qa-[0-9a-f]{4}\d+_"), "qa-<slot>_"),
+        (re.compile(r"_[0-9a-f]{8}"), "_<uid>"),
+    )
+
+    # Заголовки ответа, которые сохраняются в кассете
+    KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._interactions = []
+        self._index = defaultdict(deque)
+        self._last = {}
+        # Тест (nodeid), запросы которого сейчас записываются или воспроизводятся; None - запросы сессии
+        self.scope = None
+        self._scoped = defaultdict(deque)
+        self._used = set()
+        # Тест -> {записанное изменчивое значение -> значение текущего запуска}
+        self._substitutions = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._interactions)
+
+    @classmethod
+    def normalize(cls, value):
+        """
+        Заменяет изменчивые значения заглушками.
+        """
+        if isinstance(value, dict):
+            return {key: cls.normalize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls.normalize(item) for item in value]
+        if isinstance(value, str):
+            for pattern, placeholder in cls.VOLATILE_PATTERNS:
+                value = pattern.sub(placeholder, value)
+        return value
+
+    @classmethod
+    def volatile_values(cls, text: str) -> list:
+        """
+        Изменчивые значения строки, сгруппированные по шаблону, в порядке появления.
+        """
+        return [pattern.findall(text) for pattern, _ in cls.VOLATILE_PATTERNS]
+
+    @staticmethod
+    def _body_text(body) -> str:
+        if isinstance(body, bytes):
+            return body.decode("utf-8")
+        return body or ""
+
+    @classmethod
+    def key(cls, method: str, url: str, body) -> str:
+        """
+        Ключ индекса: метод, путь относительно Config.API_URL, параметры и нормализованное тело.
+        """
+        parts = urlsplit(url)
+        base_path = urlsplit(config.API_URL).path.rstrip("/")
+        path = parts.path[len(base_path):] if parts.path.startswith(base_path) else parts.path
+        query = sorted(parse_qsl(parts.query))
+
+        body = cls._body_text(body)
+        if body:
+            try:
+                body = json.loads(body)
+            except ValueError:
+                pass
+
+        return json.dumps([method.upper(), path, cls.normalize(query), cls.normalize(body)],
+                          ensure_ascii=False, sort_keys=True)
+
+    def load(self) -> "Cassette":
+        """
+        Загружает кассету с диска и строит индекс.
+        """
+        with gzip.open(self.path, "rt", encoding="utf-8") as source:
+            data = json.load(source)
+
+        for interaction in data["interactions"]:
+            if data.get("version", 1) < self.FORMAT_VERSION:
+                interaction["key"] = json.dumps(self.normalize(json.loads(interaction["key"])),
+                                                ensure_ascii=False, sort_keys=True)
+            self._add(interaction)
+        logger.debug(f"Загружена кассета {self.path}: {len(self)} записей")
+        return self
+
+    def save(self) -> None:
+        """
+        Атомарно сохраняет кассету на диск.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with gzip.open(temp_path, "wt", encoding="utf-8") as target:
+            json.dump({"version": self.FORMAT_VERSION, "interactions": self._interactions},
+                      target, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+        logger.debug(f"Сохранена кассета {self.path}: {len(self)} записей")
+
+    @classmethod
+    def merge(cls, path, sources) -> "Cassette":
+        """
+        Кассета из записей нескольких кассет (например, записанных воркерами запуска с --shards)
+        в порядке sources. Отсутствующие файлы пропускаются.
+        """
+        merged = cls(path)
+        for source in sources:
+            if Path(source).exists():
+                for interaction in cls(source).load()._interactions:
+                    merged._add(interaction)
+        return merged
+
+    def _add(self, interaction: dict) -> None:
+        self._interactions.append(interaction)
+        self._index[interaction["key"]].append(interaction["response"])
+        self._scoped[(interaction.get("scope"), interaction["key"])].append(interaction["response"])
+
+    def _next(self, queue: Optional[deque]) -> Optional[dict]:
+        """
+        Первый еще не воспроизведенный ответ очереди.
+        """
+        while queue:
+            recorded = queue.popleft()
+            if id(recorded) not in self._used:
+                self._used.add(id(recorded))
+                return recorded
+        return None
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """
+        Записывает пару запрос/ответ.
+        """
+        interaction = {
+            "key": self.key(request.method, request.url, request.body),
+            "scope": self.scope,
+            "response": {
+                "request_body": self._body_text(request.body),
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {name: response.headers[name] for name in self.KEPT_HEADERS if name in response.headers},
+                "body": response.text,
+            }
+        }
+        with self._lock:
+            self._add(interaction)
+
+    def play(self, request: requests.PreparedRequest, repeat_last: bool = True) -> Optional[requests.Response]:
+        """
+        Возвращает записанный ответ на запрос или None, если запрос не записан.
+
+        Args:
+            repeat_last: когда записанные ответы на запрос закончились, повторять последний из них;
+                False - вернуть None
+        """
+        key = self.key(request.method, request.url, request.body)
+        with self._lock:
+            recorded = self._next(self._scoped.get((self.scope, key))) or self._next(self._index.get(key))
+            if recorded is not None:
+                self._last[key] = recorded
+            elif repeat_last:
+                recorded = self._last.get(key)
+
+            if recorded is None:
+                return None
+
+            scope_substitutions = self._substitutions[self.scope]
+            recorded_values = self.volatile_values(recorded["request_body"])
+            current_values = self.volatile_values(self._body_text(request.body))
+            for recorded_group, current_group in zip(recorded_values, current_values):
+                for recorded_value, current_value in zip(recorded_group, current_group):
+                    if recorded_value != current_value:
+                        scope_substitutions[recorded_value] = current_value
+            substitutions = dict(scope_substitutions)
+
+        body = recorded["body"]
+        if substitutions:
+            # Один проход: подставленное значение не заменяется повторно
+            pattern = re.compile("|".join(map(re.escape, sorted(substitutions, key=len, reverse=True))))
+            body = pattern.sub(lambda match: substitutions[match.group()], body)
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Транспорт requests, записывающий ответы в кассету или воспроизводящий их из нее.
+
+    Режимы:
+        record - запросы уходят в сеть, ответы записываются (кроме 429 и 5xx, которые обрабатывает политика повторов)
+        replay - ответы берутся из кассеты, незаписанные запросы уходят в сеть
+        strict - ответы берутся только из кассеты, незаписанный запрос или запрос сверх записанного
+            числа раз - ошибка
+    """
+
+    MODES = ("record", "replay", "strict")
+
+    def __init__(self, cassette: Cassette, mode: str, **kwargs):
+        if mode not in self.MODES:
+            raise ValueError(f"Неизвестный режим кассеты '{mode}'. Доступные режимы: {', '.join(self.MODES)}")
+
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.mode = mode
+
+    def send(self, request, **kwargs):
+        if self.mode == "record":
+            response = super().send(request, **kwargs)
+            if response.status_code != 429 and response.status_code < 500:
+                self.cassette.record(request, response)
+            return response
+
+        response = self.cassette.play(request, repeat_last=self.mode != "strict")
+        if response is not None:
+            return response
+
+        if self.mode == "strict":
+            raise CassetteMismatchError(f"Запрос {request.method} {request.url} не найден в кассете {self.cassette.path} "
+                                        f"или все записанные ответы на него уже воспроизведены")
+
+        logger.debug(f"Запрос {request.method} {request.url} не найден в кассете, отправка в сеть")
+        return super().send(request, **kwargs)
+
+
+def mount_cassette(session: requests.Session, cassette: Cassette, mode: str, pool_maxsize: int = 10) -> None:
+    """
+    Подключает кассету к сессии requests для всех HTTP(S)-запросов.
+    """
+    adapter = CassetteAdapter(cassette, mode, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -0,0 +1,384 @@
+import hashlib
+import json
+import os
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import allure
+import requests
+
+from src.api.api_client import ApiClient
+from src.api.async_api_client import AsyncApiClient
+from src.api.models import CreatedEvent
+from src.config.config import config
+from src.data.slot_allocator import EventSlot, SlotAllocator, current_run_id, current_worker
+from src.data.test_data import TestData
+from src.utils.logger_utils import logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+@dataclass(frozen=True)
+class PreparedEvent:
+    """
+    Событие-предусловие, созданное через API: слот календаря, название и ответ /createPersonal.
+    """
+
+    slot: EventSlot
+    title: str
+    event: CreatedEvent
+
+    @property
+    def id(self) -> int:
+        return self.event.id
+
+
+class PersonalEventManager:
+    """
+    Менеджер жизненного цикла личных событий, созданных тестами.
+
+    Создает события (по одному или пачками), запоминает id и startAt каждого созданного события
+    и удаляет их все пачками запросов /removePersonal в конце сессии. Созданные события
+    дублируются в журнал на диске, поэтому события, оставшиеся после аварийно завершенных
+    запусков, удаляются при старте следующего запуска (sweep_orphans). Журналы хранятся отдельно
+    для каждого адреса API, и очистка не трогает журналы работающих процессов.
+
+    Подписчики listeners получают startAt каждого созданного, измененного или удаленного события
+    (например, ScheduleReader отмечает день для обновления кэша).
+    """
+
+    CREATE_ENDPOINT = "/createPersonal"
+    UPDATE_ENDPOINT = "/updatePersonal"
+    REMOVE_ENDPOINT = "/removePersonal"
+
+    def __init__(self, client: ApiClient, async_client: Optional[AsyncApiClient] = None,
+                 journal_dir: Optional[str] = None, batch_size: int = 20):
+        """
+        Args:
+            client: клиент API для одиночных запросов
+            async_client: асинхронный клиент для пачек запросов; без него пачки отправляются последовательно
+            journal_dir: каталог журналов созданных событий (журналы - в подкаталоге адреса API клиента)
+            batch_size: максимальный размер пачки запросов
+        """
+        self.client = client
+        self.async_client = async_client
+        self.batch_size = batch_size
+
+        self.run_id = current_run_id()
+        worker_id, _ = current_worker()
+        api_key = hashlib.sha1(client.base_url.encode("utf-8")).hexdigest()[:12]
+        self.journal_root = Path(journal_dir or config.EVENT_JOURNAL_DIR)
+        self.journal_dir = self.journal_root / api_key
+        self.journal_path = self.journal_dir / f"{self.run_id}-{worker_id}-{os.getpid()}.jsonl"
+
+        # id события -> {"id", "startAt", "title"}
+        self.created: Dict[int, dict] = {}
+        self.stats: Dict[str, dict] = {}
+        self.listeners: List[Callable[[Optional[str]], None]] = []
+
+    def _notify(self, *moments: Optional[str]) -> None:
+        for listener in self.listeners:
+            for moment in moments:
+                listener(moment)
+
+    def _record_stats(self, operation: str, calls: int, started: float) -> None:
+        stats = self.stats.setdefault(operation, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += calls
+        stats["seconds"] += time.perf_counter() - started
+
+    def _send_batch(self, endpoint: str, payloads: List[dict]) -> List[requests.Response]:
+        """
+        Отправляет POST-запросы пачками по batch_size с сохранением порядка ответов.
+        """
+        responses = []
+        for start in range(0, len(payloads), self.batch_size):
+            chunk = payloads[start:start + self.batch_size]
+            if self.async_client is not None:
+                responses.extend(self.async_client.run_batch(
+                    [("post", endpoint, payload) for payload in chunk], return_exceptions=True))
+            else:
+                responses.extend(self.client.post(endpoint, data=payload) for payload in chunk)
+        return responses
+
+    def track(self, response: requests.Response, title: str = "") -> Optional[int]:
+        """
+        Запоминает событие из ответа /createPersonal. Возвращает id события или None, если событие не создано.
+        """
+        try:
+            data = response.json().get("data") or {}
+        except ValueError:
+            return None
+
+        event_id = (data.get("payload") or {}).get("id")
+        if event_id is None:
+            return None
+
+        record = {"id": event_id, "startAt": data.get("startAt"), "title": title}
+        self.created[event_id] = record
+        self._append_journal(record)
+        return event_id
+
+    @allure.step("Создание личного события")
+    def create(self, event: dict) -> requests.Response:
+        """
+        Создает одно событие и запоминает его для последующего удаления.
+
+        Args:
+            event: данные события (см. TestData.get_personal_event)
+        """
+        started = time.perf_counter()
+        response = self.client.post(self.CREATE_ENDPOINT, data=event)
+        self._record_stats("create", 1, started)
+
+        self.track(response, event.get("title", ""))
+        self._notify(event.get("startAt"))
+        return response
+
+    @allure.step("Создание пачки личных событий")
+    def create_many(self, events: Iterable[dict]) -> List[requests.Response]:
+        """
+        Создает события пачками. Ответы возвращаются в порядке событий.
+        """
+        events = list(events)
+        started = time.perf_counter()
+        responses = self._send_batch(self.CREATE_ENDPOINT, events)
+        self._record_stats("create", len(events), started)
+        self._notify(*(event.get("startAt") for event in events))
+
+        for event, response in zip(events, responses):
+            if isinstance(response, requests.Response):
+                self.track(response, event.get("title", ""))
+            else:
+                logger.warning(f"Не удалось создать событие '{event.get('title')}': {response}")
+        return responses
+
+    @allure.step("Создание событий-предусловий через API")
+    def prepare(self, slots: Iterable[EventSlot], name: str = TestData.PERSONAL_EVENT_NAME) -> List[PreparedEvent]:
+        """
+        Создает пачкой по событию в каждом слоте (название - префикс слота и name) для тестов,
+        которым события нужны как предусловие. Страница, открытая до вызова, показывает события
+        после одного refresh_page().
+
+        Raises:
+            ResponseValidationError: событие не создано
+        """
+        slots = list(slots)
+        titles = [slot.title(name) for slot in slots]
+        events = TestData.get_personal_events(
+            (title, slot.date, slot.start_time, slot.end_time) for title, slot in zip(titles, slots))
+
+        prepared = []
+        for slot, title, response in zip(slots, titles, self.create_many(events)):
+            if not isinstance(response, requests.Response):
+                raise response
+            prepared.append(PreparedEvent(slot, title, CreatedEvent.from_response(response)))
+        return prepared
+
+    def forget(self, event_id: int) -> None:
+        """
+        Исключает событие из очистки (например, событие удалено тестом через интерфейс),
+        в том числе из очистки журнала после аварийного завершения запуска.
+        """
+        if self.created.pop(event_id, None) is not None:
+            self._append_journal({"id": event_id, "forgotten": True})
+
+    @allure.step("Редактирование личного события")
+    def update(self, event: dict) -> requests.Response:
+        """
+        Редактирует событие и обновляет запомненное время начала.
+
+        Args:
+            event: данные события с id (см. TestData.get_personal_event_by_id)
+        """
+        started = time.perf_counter()
+        response = self.client.post(self.UPDATE_ENDPOINT, data=event)
+        self._record_stats("update", 1, started)
+        self._notify(event.get("oldStartAt"), event.get("startAt"))
+
+        event_id = event.get("id")
+        if response.ok and event_id in self.created:
+            self.created[event_id]["startAt"] = event.get("startAt")
+            self.created[event_id]["title"] = event.get("title", "")
+            self._append_journal(self.created[event_id])
+        return response
+
+    @allure.step("Удаление личного события")
+    def remove(self, event_id: int, start_at: str) -> requests.Response:
+        """
+        Удаляет одно событие и исключает его из очистки.
+        """
+        started = time.perf_counter()
+        response = self.client.post(self.REMOVE_ENDPOINT, data={"id": event_id, "start_at": start_at})
+        self._record_stats("remove", 1, started)
+        self._notify(start_at)
+
+        if response.ok:
+            self.forget(event_id)
+        return response
+
+    def _remove_records(self, records: List[dict]) -> List[dict]:
+        """
+        Удаляет события пачками. Возвращает записи, которые удалить не удалось.
+        """
+        started = time.perf_counter()
+        responses = self._send_batch(
+            self.REMOVE_ENDPOINT,
+            [{"id": record["id"], "start_at": record["startAt"]} for record in records])
+        self._record_stats("remove", len(records), started)
+        self._notify(*(record["startAt"] for record in records))
+
+        failed = []
+        for record, response in zip(records, responses):
+            if not isinstance(response, requests.Response) or not response.ok:
+                logger.warning(f"Не удалось удалить событие {record}: {response}")
+                failed.append(record)
+        return failed
+
+    @allure.step("Удаление всех созданных событий")
+    def remove_all(self) -> int:
+        """
+        Удаляет все запомненные события. Возвращает число удаленных событий.
+        """
+        records = list(self.created.values())
+        if not records:
+            self._rewrite_journal(self.journal_path, [])
+            return 0
+
+        failed = self._remove_records(records)
+        self.created = {record["id"]: record for record in failed}
+        self._rewrite_journal(self.journal_path, failed)
+        return len(records) - len(failed)
+
+    @allure.step("Удаление событий, оставшихся от прошлых запусков")
+    def sweep_orphans(self, title_prefix: str = SlotAllocator.TITLE_MARKER) -> int:
+        """
+        Удаляет события из журналов завершившихся запусков того же адреса API, названия которых
+        начинаются с title_prefix. Журнал другого запуска очищается, если его процесс завершен
+        или журнал не менялся дольше config.EVENT_JOURNAL_STALE_AFTER секунд.
+        События, которые удалить не удалось, остаются в журнале до следующего запуска
+        (не больше config.EVENT_JOURNAL_MAX_SWEEPS попыток). Пустые каталоги журналов (всех адресов API)
+        удаляются. Возвращает число удаленных событий.
+        """
+        self._remove_empty_journal_dirs()
+        if not self.journal_dir.exists():
+            return 0
+
+        removed = 0
+        for journal in self.journal_dir.glob("*.jsonl"):
+            if journal.name.startswith(f"{self.run_id}-") or self._journal_in_use(journal):
+                continue
+
+            records = [record for record in self._read_journal(journal)
+                       if record.get("title", "").startswith(title_prefix)]
+            failed = self._remove_records(records) if records else []
+            removed += len(records) - len(failed)
+
+            # Событие могло быть удалено самим тестом до сбоя, поэтому неудачное удаление
+            # повторяется ограниченное число раз
+            kept = []
+            for record in failed:
+                record = dict(record, sweeps=record.get("sweeps", 0) + 1)
+                if record["sweeps"] < config.EVENT_JOURNAL_MAX_SWEEPS:
+                    kept.append(record)
+                else:
+                    logger.warning(f"Событие {record} не удалено за {record['sweeps']} попыток, "
+                                   f"запись исключена из журнала")
+            self._rewrite_journal(journal, kept)
+
+        if removed:
+            logger.info(f"Удалено {removed} событий, оставшихся от прошлых запусков")
+        return removed
+
+    def _remove_empty_journal_dirs(self) -> None:
+        if not self.journal_root.is_dir():
+            return
+        for directory in self.journal_root.iterdir():
+            if directory.is_dir() and not any(directory.iterdir()):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    # Другой процесс успел записать журнал
+                    pass
+
+    @staticmethod
+    def _journal_in_use(journal: Path) -> bool:
+        """
+        Журнал принадлежит работающему процессу (pid - последняя часть имени) и недавно менялся.
+        """
+        if time.time() - journal.stat().st_mtime > config.EVENT_JOURNAL_STALE_AFTER:
+            return False
+        pid = journal.stem.rsplit("-", 1)[-1]
+        return not pid.isdigit() or _process_alive(int(pid))
+
+    def report(self) -> str:
+        """
+        Сводка по числу запросов и затраченному времени.
+        """
+        lines = ["Запросы менеджера личных событий:"]
+        for operation, stats in self.stats.items():
+            lines.append(f"  {operation}: {stats['calls']} запросов за {stats['seconds']:.2f} с")
+        if self.created:
+            lines.append(f"  не удалено событий: {len(self.created)}")
+        return "\n".join(lines)
+
+    def _append_journal(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        for _ in range(3):
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                with self.journal_path.open("a", encoding="utf-8") as journal:
+                    journal.write(line)
+                return
+            except FileNotFoundError:
+                # Пустой каталог удалил sweep_orphans другого процесса между созданием каталога и записью
+                continue
+        raise FileNotFoundError(f"Каталог журнала событий {self.journal_dir} удаляется другим процессом")
+
+    @staticmethod
+    def _read_journal(journal: Path) -> List[dict]:
+        """
+        Читает журнал. Повторные записи одного события (после редактирования) заменяют предыдущие,
+        события с записью forgotten (удалены тестом) пропускаются.
+        """
+        records = {}
+        with journal.open(encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["id"]] = record
+        return [record for record in records.values() if not record.get("forgotten")]
+
+    @staticmethod
+    def _rewrite_journal(journal: Path, records: List[dict]) -> None:
+        if not records:
+            journal.unlink(missing_ok=True)
+            return
+
+        with journal.open("w", encoding="utf-8") as lines:
+            for record in records:
+                lines.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _process_alive(pid: int) -> bool:
+    """
+    Процесс с pid работает. Если проверить нельзя (Windows без psutil), процесс считается работающим.
+    """
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -0,0 +1,294 @@
+"""
+Модели ответов API расписания.
+
+Тело ответа разбирается один раз (через orjson, если он установлен, иначе стандартным json),
+структура проверяется при создании модели, и ошибка структуры сообщает путь к полю
+(ResponseValidationError) вместо AttributeError на цепочке .get(). Модели - неизменяемые
+dataclass с __slots__. Расписание (ScheduleListing) создает модели событий только при обращении
+к ним: для поиска события по названию или id модели всех событий не создаются. Разобранный JSON
+при этом хранится целиком: по памяти расписание не экономнее response.json().
+"""
+import abc
+import json
+
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple, Type, TypeVar
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+M = TypeVar("M", bound="ResponseModel")
+
+
+class ResponseValidationError(ValueError):
+    """
+    Ответ API не соответствует ожидаемой структуре.
+    """
+
+    def __init__(self, model: str, path: str, message: str):
+        self.model = model
+        self.path = path
+        super().__init__(f"{model}: {path or 'тело ответа'}: {message}")
+
+
+def decode(content: bytes) -> Any:
+    """
+    Разбирает JSON тела ответа.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _field(data: Any, key: str, kinds: Tuple[type, ...], path: str, model: str, required: bool = True) -> Any:
+    """
+    Значение поля словаря с проверкой типа. Необязательное поле может отсутствовать или быть null.
+    """
+    if not isinstance(data, dict):
+        raise ResponseValidationError(model, path, f"ожидался объект, получено {type(data).__name__}")
+
+    value = data.get(key)
+    field_path = f"{path}.{key}" if path else key
+    if value is None:
+        if required:
+            raise ResponseValidationError(model, field_path, "поле отсутствует")
+        return None
+    if not isinstance(value, kinds) or isinstance(value, bool):
+        expected = " или ".join(kind.__name__ for kind in kinds)
+        raise ResponseValidationError(model, field_path, f"ожидался {expected}, получено {type(value).__name__}")
+    return value
+
+
+def _errors(body: Any) -> str:
+    errors = body.get("errors") if isinstance(body, dict) else None
+    if not errors:
+        return "поле отсутствует"
+    return "ответ с ошибкой: " + "; ".join(str(error.get("message", error)) if isinstance(error, dict) else str(error)
+                                           for error in errors)
+
+
+class ResponseModel(abc.ABC):
+    """
+    Модель тела ответа конечной точки.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    @abc.abstractmethod
+    def from_body(cls: Type[M], body: Any) -> M:
+        """
+        Модель из разобранного JSON тела ответа.
+
+        Raises:
+            ResponseValidationError: тело ответа не соответствует модели
+        """
+
+    @classmethod
+    def from_response(cls: Type[M], response: requests.Response) -> M:
+        """
+        Модель из ответа requests.
+
+        Raises:
+            ResponseValidationError: тело ответа не JSON или не соответствует модели
+        """
+        try:
+            body = decode(response.content)
+        except ValueError as e:
+            raise ResponseValidationError(cls.__name__, "",
+                                          f"не является JSON (HTTP {response.status_code}): {e}")
+        return cls.from_body(body)
+
+    @classmethod
+    def _data(cls, body: Any) -> dict:
+        if not isinstance(body, dict):
+            raise ResponseValidationError(cls.__name__, "", f"ожидался объект, получено {type(body).__name__}")
+        if body.get("data") is None:
+            raise ResponseValidationError(cls.__name__, "data", _errors(body))
+        return _field(body, "data", (dict,), "", cls.__name__)
+
+
+@dataclass(frozen=True)
+class EventPayload:
+    """
+    Поля личного события. Обязательно только название: id проверяют модели ответов,
+    которым он нужен (CreatedEvent, RemovedEvent).
+    """
+
+    __slots__ = ("id", "title", "description", "color", "background_color")
+
+    id: Optional[int]
+    title: str
+    description: Optional[str]
+    color: Optional[str]
+    background_color: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Any, path: str, model: str) -> "EventPayload":
+        return cls(
+            id=_field(data, "id", (int,), path, model, required=False),
+            title=_field(data, "title", (str,), path, model),
+            description=_field(data, "description", (str,), path, model, required=False),
+            color=_field(data, "color", (str,), path, model, required=False),
+            background_color=_field(data, "backgroundColor", (str,), path, model, required=False),
+        )
+
+
+@dataclass(frozen=True)
+class ScheduleEvent:
+    """
+    Событие расписания: тип, время начала и окончания (ISO) и поля события.
+    Обязательны только поля события (payload): ответы конечных точек различаются составом
+    остальных полей (например, ответ /updatePersonal может не содержать время события).
+    """
+
+    __slots__ = ("type", "start_at", "end_at", "payload")
+
+    type: Optional[str]
+    start_at: Optional[str]
+    end_at: Optional[str]
+    payload: EventPayload
+
+    @property
+    def id(self) -> Optional[int]:
+        return self.payload.id
+
+    @classmethod
+    def from_dict(cls, data: Any, path: str, model: str) -> "ScheduleEvent":
+        return cls(
+            type=_field(data, "type", (str,), path, model, required=False),
+            start_at=_field(data, "startAt", (str,), path, model, required=False),
+            end_at=_field(data, "endAt", (str,), path, model, required=False),
+            payload=EventPayload.from_dict(_field(data, "payload", (dict,), path, model), f"{path}.payload", model),
+        )
+
+
+@dataclass(frozen=True)
+class CreatedEvent(ResponseModel):
+    """
+    Ответ /createPersonal: {"data": событие}. Обязательны id и startAt - по ним событие редактируется и удаляется.
+    """
+
+    __slots__ = ("event",)
+
+    event: ScheduleEvent
+
+    @property
+    def id(self) -> int:
+        return self.event.payload.id
+
+    @property
+    def start_at(self) -> str:
+        return self.event.start_at
+
+    @classmethod
+    def from_body(cls, body: Any) -> "CreatedEvent":
+        data = cls._data(body)
+        _field(data, "startAt", (str,), "data", cls.__name__)
+        _field(_field(data, "payload", (dict,), "data", cls.__name__), "id", (int,), "data.payload", cls.__name__)
+        return cls(ScheduleEvent.from_dict(data, "data", cls.__name__))
+
+
+@dataclass(frozen=True)
+class UpdatedEvent(ResponseModel):
+    """
+    Ответ /updatePersonal: {"data": {"payload": событие}}.
+    """
+
+    __slots__ = ("event",)
+
+    event: ScheduleEvent
+
+    @property
+    def id(self) -> Optional[int]:
+        return self.event.payload.id
+
+    @classmethod
+    def from_body(cls, body: Any) -> "UpdatedEvent":
+        data = cls._data(body)
+        return cls(ScheduleEvent.from_dict(_field(data, "payload", (dict,), "data", cls.__name__),
+                                           "data.payload", cls.__name__))
+
+
+@dataclass(frozen=True)
+class RemovedEvent(ResponseModel):
+    """
+    Ответ /removePersonal: {"data": {"payload": {"id": ...}}}.
+    """
+
+    __slots__ = ("id",)
+
+    id: int
+
+    @classmethod
+    def from_body(cls, body: Any) -> "RemovedEvent":
+        payload = _field(cls._data(body), "payload", (dict,), "data", cls.__name__)
+        return cls(_field(payload, "id", (int,), "data.payload", cls.__name__))
+
+
+class ScheduleListing(ResponseModel):
+    """
+    Ответ /getSchedule: {"data": {"payload": [событие, ...]}}.
+
+    При создании проверяется только, что payload - список. Модель события создается и проверяется
+    при обращении к нему (индекс, итерация), поэтому для длинного расписания не создаются модели
+    событий, которые тест не читает. find_by_title и ids читают разобранный JSON напрямую.
+    Сам список событий разобран целиком и хранится в модели.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Any]):
+        self._items = items
+
+    @classmethod
+    def from_body(cls, body: Any) -> "ScheduleListing":
+        return cls(_field(cls._data(body), "payload", (list,), "data", cls.__name__))
+
+    @property
+    def items(self) -> List[Any]:
+        """
+        Разобранный JSON событий без создания моделей.
+        """
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> ScheduleEvent:
+        if index < 0:
+            index += len(self._items)
+            if index < 0:
+                raise IndexError(f"Индекс события вне расписания из {len(self._items)} событий")
+        return ScheduleEvent.from_dict(self._items[index], f"data.payload[{index}]", type(self).__name__)
+
+    def __iter__(self) -> Iterator[ScheduleEvent]:
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def ids(self) -> List[Any]:
+        """
+        id всех событий без создания моделей.
+        """
+        return [_payload(item).get("id") for item in self._items if isinstance(item, dict)]
+
+    def find_by_title(self, title: str) -> Optional[ScheduleEvent]:
+        """
+        Первое событие с названием title или None.
+        """
+        for index, item in enumerate(self._items):
+            if _payload(item).get("title") == title:
+                return self[index]
+        return None
+
+
+def _payload(item: Any) -> dict:
+    """
+    Поля события из разобранного JSON без проверки; {} для события неверной структуры.
+    """
+    payload = item.get("payload") if isinstance(item, dict) else None
+    return payload if isinstance(payload, dict) else {}
@@ -0,0 +1,302 @@
+import random
+import threading
+import time
+
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+import requests
+
+from urllib3.exceptions import ConnectTimeoutError
+
+from src.config.config import config
+from src.utils.logger_utils import logger
+
+
+class TokenBucket:
+    """
+    Клиентский ограничитель частоты запросов по алгоритму token bucket.
+
+    Бакет пополняется со скоростью rate токенов в секунду до capacity токенов.
+    Каждый запрос забирает один токен и при их отсутствии ждет пополнения.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: скорость пополнения, запросов в секунду
+            capacity: максимальный размер пачки запросов без ожидания
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Забирает токен, при необходимости ожидая его появления. Возвращает время ожидания в секундах.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+_shared_rate_limiter: Optional[TokenBucket] = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def shared_rate_limiter() -> TokenBucket:
+    """
+    Ограничитель частоты, общий для всех клиентов API процесса (Config.API_RATE_LIMIT, Config.API_RATE_BURST).
+    """
+    global _shared_rate_limiter
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = TokenBucket(config.API_RATE_LIMIT, config.API_RATE_BURST)
+        return _shared_rate_limiter
+
+
+class RetryMetrics:
+    """
+    Счетчики повторов запросов: число попыток и повторов, причины повторов, время ожидания.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.backoff_seconds = 0.0
+        self.rate_limit_seconds = 0.0
+        self.reasons = Counter()
+
+    def record_attempt(self, rate_limit_wait: float) -> None:
+        with self._lock:
+            self.attempts += 1
+            self.rate_limit_seconds += rate_limit_wait
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, reason: str, wait: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += wait
+            self.reasons[reason] += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> dict:
+        """
+        Текущие значения счетчиков.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "backoff_seconds": round(self.backoff_seconds, 3),
+                "rate_limit_seconds": round(self.rate_limit_seconds, 3),
+                "reasons": dict(self.reasons),
+            }
+
+    def report(self) -> str:
+        stats = self.snapshot()
+        return (f"Запросов к API: {stats['requests']}, попыток: {stats['attempts']}, повторов: {stats['retries']} "
+                f"{stats['reasons']}, исчерпано попыток: {stats['exhausted']}, ожидание повторов: "
+                f"{stats['backoff_seconds']} с, ожидание ограничителя частоты: {stats['rate_limit_seconds']} с")
+
+
+# Метрики всех политик повторов процесса, если политике не переданы собственные
+retry_metrics = RetryMetrics()
+
+
+class RetryPolicy:
+    """
+    Политика повторов запросов при перегрузке API.
+
+    Идемпотентные методы повторяются при ответах 429 и 5xx и при сетевых ошибках. Явно разрешенные
+    неидемпотентные методы и конечные точки повторяются только тогда, когда сервер точно не выполнил
+    запрос: при ответах 429 и 503 и при ошибке установки соединения. После 500, 502, 504 или таймаута
+    чтения изменение могло быть применено, и повтор (например, редактирование с устаревшим oldStartAt)
+    изменил бы результат. Повторы выполняются с экспоненциальной задержкой и случайным разбросом
+    (full jitter), заголовок Retry-After имеет приоритет над расчетной задержкой. Повторы прекращаются
+    по числу попыток или по общему бюджету времени.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Ответы, при которых сервер не выполнял запрос
+    NOT_APPLIED_STATUSES = frozenset({429, 503})
+
+    def __init__(self,
+                 max_attempts: int = 5,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 10.0,
+                 total_budget: float = 30.0,
+                 retry_methods: Iterable[str] = (),
+                 retry_endpoints: Iterable[str] = (),
+                 retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 metrics: Optional[RetryMetrics] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            max_attempts: максимальное число попыток, включая первую
+            backoff_factor: базовая задержка в секундах, удваивается с каждой попыткой
+            max_backoff: максимальная задержка между попытками
+            total_budget: общий бюджет времени на запрос со всеми повторами, в секундах
+            retry_methods: неидемпотентные методы, для которых разрешены повторы невыполненных запросов
+            retry_endpoints: конечные точки, для которых разрешены повторы невыполненных запросов при любом методе
+            retry_statuses: коды ответа, при которых повторяются идемпотентные запросы
+            rate_limiter: ограничитель частоты запросов; None - без ограничения
+            metrics: счетчики повторов; по умолчанию общие для процесса retry_metrics
+            sleep: функция ожидания
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.total_budget = total_budget
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.retry_endpoints = frozenset(retry_endpoints)
+        self.retry_statuses = frozenset(retry_statuses)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or retry_metrics
+        self._sleep = sleep
+
+    def is_retryable(self, method: str, endpoint: str) -> bool:
+        """
+        Разрешены ли повторы для метода и конечной точки.
+        """
+        method = method.upper()
+        return (method in self.IDEMPOTENT_METHODS
+                or method in self.retry_methods
+                or endpoint in self.retry_endpoints)
+
+    def should_retry(self, method: str, endpoint: str, response: Optional[requests.Response],
+                     error: Optional[Exception]) -> bool:
+        """
+        Нужно ли повторить запрос после ответа response или сетевой ошибки error.
+        """
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return error is not None or response.status_code in self.retry_statuses
+        if not self.is_retryable(method, endpoint):
+            return False
+        if error is not None:
+            return _not_sent(error)
+        return response.status_code in self.retry_statuses & self.NOT_APPLIED_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Задержка перед повтором номер attempt (с 1): случайное значение от 0 до base * 2^(attempt-1).
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Задержка из заголовка Retry-After (в секундах или HTTP-датой). None, если заголовка нет.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _acquire(self) -> None:
+        waited = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+        self.metrics.record_attempt(waited)
+
+    def execute(self, method: str, endpoint: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Выполняет запрос с повторами.
+
+        Args:
+            method: HTTP-метод
+            endpoint: конечная точка API
+            send: функция, отправляющая запрос
+
+        Returns:
+            Последний полученный ответ. Сетевая ошибка последней попытки пробрасывается.
+        """
+        self.metrics.record_request()
+        deadline = time.monotonic() + self.total_budget
+        attempt = 1
+
+        while True:
+            self._acquire()
+            try:
+                response = send()
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+
+            if error is None and response.status_code not in self.retry_statuses:
+                return response
+
+            if not self.should_retry(method, endpoint, response, error):
+                if error is not None:
+                    raise error
+                return response
+
+            reason = type(error).__name__ if error is not None else str(response.status_code)
+            wait = self.backoff(attempt)
+            if response is not None:
+                retry_after = self.retry_after(response)
+                if retry_after is not None:
+                    wait = retry_after
+
+            if attempt >= self.max_attempts or time.monotonic() + wait > deadline:
+                self.metrics.record_exhausted()
+                logger.warning(f"{method} {endpoint}: повторы исчерпаны после {attempt} попыток ({reason})")
+                if error is not None:
+                    raise error
+                return response
+
+            logger.debug(f"{method} {endpoint}: ответ {reason}, повтор {attempt} через {wait:.2f} с")
+            self.metrics.record_retry(reason, wait)
+            self._sleep(wait)
+            attempt += 1
+
+
+def _not_sent(error: Exception) -> bool:
+    """
+    Сетевая ошибка возникла до отправки запроса (соединение не установлено).
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError) or isinstance(error, requests.Timeout):
+        return False
+    reason = getattr(error.args[0], "reason", error.args[0]) if error.args else None
+    return isinstance(reason, ConnectTimeoutError)
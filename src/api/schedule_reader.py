@@ -0,0 +1,217 @@
+import hashlib
+import json
+import time
+
+from datetime import date as date_type, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import allure
+
+from src.api.api_client import ApiClient
+from src.api.models import ScheduleEvent, ScheduleListing
+from src.config.config import config
+from src.utils import calendar_time
+from src.utils.logger_utils import logger
+
+
+class DayBucket:
+    """
+    События одного дня расписания в кэше.
+    """
+
+    __slots__ = ("date", "items", "digest", "fetched_at")
+
+    def __init__(self, date: str, items: List[dict], digest: str, fetched_at: float):
+        self.date = date
+        self.items = items
+        self.digest = digest
+        self.fetched_at = fetched_at
+
+    @property
+    def listing(self) -> ScheduleListing:
+        return ScheduleListing(self.items)
+
+
+class ScheduleReader:
+    """
+    Чтение расписания преподавателя по дням с локальным кэшем.
+
+    Расписание хранится корзинами по дням (день - дата начала события в часовом поясе календаря),
+    для каждого дня запоминается хеш содержимого. Чтение диапазона запрашивает одним запросом
+    /getSchedule каждую непрерывную последовательность дней, которые нужно обновить:
+    отсутствующих в кэше, измененных (invalidate, invalidate_at) или старше max_age.
+    Повторный запрос того же интервала отправляется с If-None-Match/If-Modified-Since, и ответ 304
+    обновляет дни без передачи и разбора тела. Дни с неизменившимся хешем сохраняют прежние корзины.
+
+    Изменения событий через PersonalEventManager отмечаются автоматически (watch).
+
+    Конечная точка /getSchedule с параметрами from/to (ISO) и ответ {"data": {"payload": [...]}} описаны
+    по локальной замене API (src/stubs/schedule_api.py) и не сверены с реальным API /v2/schedule.
+    """
+
+    # Предполагаемый контракт, см. описание класса
+    ENDPOINT = "/getSchedule"
+
+    def __init__(self, client: ApiClient, max_age: Optional[float] = None, zone_name: Optional[str] = None):
+        """
+        Args:
+            client: клиент API
+            max_age: сколько секунд день из кэша считается актуальным без запроса;
+                0 - каждый раз проверять условным запросом (по умолчанию config.SCHEDULE_CACHE_MAX_AGE)
+            zone_name: часовой пояс календаря (по умолчанию config.TIMEZONE)
+        """
+        self.client = client
+        self.max_age = config.SCHEDULE_CACHE_MAX_AGE if max_age is None else max_age
+        self.zone_name = zone_name or config.TIMEZONE
+        self._days: Dict[str, DayBucket] = {}
+        self._dirty = set()
+        # Интервал (первый день, последний день) -> (ETag, Last-Modified) последнего ответа
+        self._validators: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "days_fetched": 0, "days_changed": 0, "days_cached": 0}
+
+    def watch(self, manager) -> None:
+        """
+        Отмечает измененными дни событий, которые создает, изменяет или удаляет менеджер событий.
+        """
+        manager.listeners.append(self.invalidate_at)
+
+    def invalidate(self, date: Optional[str] = None) -> None:
+        """
+        Отмечает день (или весь кэш, если date не передан) для обновления при следующем чтении.
+        """
+        if date is None:
+            self._dirty.update(self._days)
+        else:
+            self._dirty.add(date)
+
+    def invalidate_at(self, moment: Optional[str]) -> None:
+        """
+        Отмечает для обновления день, к которому относится момент времени ISO (startAt события).
+        """
+        if moment:
+            self.invalidate(self.day_of(moment))
+
+    def day_of(self, moment: str) -> str:
+        """
+        Дата 'YYYY-MM-DD' момента времени ISO в часовом поясе календаря.
+        """
+        return calendar_time.to_zone_iso(moment, self.zone_name)[:10]
+
+    def _is_fresh(self, date: str, now: float) -> bool:
+        bucket = self._days.get(date)
+        return bucket is not None and date not in self._dirty and now - bucket.fetched_at < self.max_age
+
+    @allure.step("Получение расписания с {start_date} по {end_date}")
+    def read(self, start_date: str, end_date: Optional[str] = None) -> Dict[str, ScheduleListing]:
+        """
+        Расписание по дням за интервал дат включительно.
+
+        Args:
+            start_date: первый день 'YYYY-MM-DD'
+            end_date: последний день 'YYYY-MM-DD' (по умолчанию равен start_date)
+
+        Returns:
+            События каждого дня интервала по датам.
+        """
+        dates = _date_range(start_date, end_date or start_date)
+        now = time.monotonic()
+
+        stale = [date for date in dates if not self._is_fresh(date, now)]
+        self.stats["days_cached"] += len(dates) - len(stale)
+        for first, last in _runs(stale):
+            self._fetch(first, last)
+
+        return {date: self._days[date].listing for date in dates}
+
+    def day(self, date: str) -> ScheduleListing:
+        """
+        События одного дня.
+        """
+        return self.read(date)[date]
+
+    def find(self, title: str, date: str) -> Optional[ScheduleEvent]:
+        """
+        Событие дня по названию или None.
+        """
+        return self.day(date).find_by_title(title)
+
+    def _fetch(self, first: str, last: str) -> None:
+        """
+        Запрашивает дни с first по last одним запросом и обновляет их корзины.
+        """
+        key = (first, last)
+        etag, last_modified = self._validators.get(key, (None, None))
+        headers = {}
+        if etag and all(date in self._days for date in _date_range(first, last)):
+            headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        next_day = (date_type.fromisoformat(last) + timedelta(days=1)).isoformat()
+        params = {"from": calendar_time.local_iso(first, "00:00", self.zone_name),
+                  "to": calendar_time.local_iso(next_day, "00:00", self.zone_name)}
+        response = self.client.get(self.ENDPOINT, params=params, headers=headers or None)
+        self.stats["requests"] += 1
+        fetched_at = time.monotonic()
+        dates = _date_range(first, last)
+
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+            for date in dates:
+                self._days[date].fetched_at = fetched_at
+                self._dirty.discard(date)
+            return
+
+        listing = ScheduleListing.from_response(response)
+        self._validators[key] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+        buckets: Dict[str, List[dict]] = {date: [] for date in dates}
+        for item in listing.items:
+            start_at = item.get("startAt") if isinstance(item, dict) else None
+            # Событие, начавшееся до интервала и пересекающее его, относится к дню своего начала
+            day_items = buckets.get(self.day_of(start_at)) if start_at else None
+            if day_items is not None:
+                day_items.append(item)
+
+        changed = []
+        for date, items in buckets.items():
+            digest = _digest(items)
+            bucket = self._days.get(date)
+            if bucket is not None and bucket.digest == digest:
+                bucket.fetched_at = fetched_at
+            else:
+                self._days[date] = DayBucket(date, items, digest, fetched_at)
+                changed.append(date)
+            self._dirty.discard(date)
+
+        self.stats["days_fetched"] += len(dates)
+        self.stats["days_changed"] += len(changed)
+        logger.debug(f"Расписание {first}..{last}: {len(listing)} событий, изменились дни: {changed or 'нет'}")
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    start, end = date_type.fromisoformat(start_date), date_type.fromisoformat(end_date)
+    if end < start:
+        raise ValueError(f"Конец интервала {end_date} раньше начала {start_date}")
+    return [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+
+
+def _runs(dates: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Непрерывные последовательности дней (первый, последний) из упорядоченного списка дат.
+    """
+    runs: List[List[str]] = []
+    for date in dates:
+        if runs and date_type.fromisoformat(date) - date_type.fromisoformat(runs[-1][1]) == timedelta(days=1):
+            runs[-1][1] = date
+        else:
+            runs.append([date, date])
+    return [(first, last) for first, last in runs]
+
+
+def _digest(items: List[dict]) -> str:
+    """
+    Хеш содержимого дня, не зависящий от порядка событий в ответе.
+    """
+    events = sorted(json.dumps(item, sort_keys=True, ensure_ascii=False) for item in items)
+    return hashlib.sha1("\n".join(events).encode("utf-8")).hexdigest()
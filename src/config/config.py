@@ -1,3 +1,6 @@
+import os
+
+
 class Config:
     """
     Базовая конфигурация для тестов кабинета Teacher Skyeng API и пользовательского интерфейса.
@@ -6,7 +9,56 @@ class Config:
     BASE_URL = "https://teacher.skyeng.ru"
     LOGIN_URL = "https://id.skyeng.ru/login"
     SCHEDULE_URL = "https://teachers.skyeng.ru"
-    API_URL = "https://api-teachers.skyeng.ru/v2/schedule"
+    # Можно переопределить переменной окружения, например для локальной замены API (src/stubs/schedule_api.py)
+    API_URL = os.getenv("API_URL", "https://api-teachers.skyeng.ru/v2/schedule")
+
+    # Клиентское ограничение частоты запросов к API, общее для процесса: запросов в секунду и размер пачки
+    API_RATE_LIMIT = 20
+    API_RATE_BURST = 20
+
+    # Авторизация через cookie
+    AUTH_COOKIE_NAME = "token_global"
+    AUTH_COOKIE_DOMAIN = ".skyeng.ru"
+    # Легкая страница на домене cookie: браузер должен находиться на домене, чтобы принять cookie
+    AUTH_COOKIE_BOOTSTRAP_URL = "https://teachers.skyeng.ru/favicon.ico"
+
+    # Кэш токена авторизации, общий для воркеров: каталог (файл кэша - на каждую учетную запись и адрес API),
+    # запас до истечения токена для обновления и время ожидания блокировки кэша, секунд
+    TOKEN_CACHE_DIR = ".qa_auth"
+    TOKEN_REFRESH_MARGIN = 15 * 60
+    TOKEN_LOCK_TIMEOUT = 120
+
+    # Часовой пояс календаря преподавателя
+    TIMEZONE = "Europe/Moscow"
+
+    # Пул слотов календаря для параллельного запуска: смещения дней от сегодня, часы и длительность слота
+    EVENT_SLOT_DAYS = tuple(range(1, 8))
+    EVENT_SLOT_HOURS = (10, 22)
+    EVENT_SLOT_MINUTES = 30
+
+    # Сколько секунд день расписания из кэша ScheduleReader считается актуальным без запроса;
+    # 0 - каждое чтение проверяется условным запросом (If-None-Match)
+    SCHEDULE_CACHE_MAX_AGE = 0
+
+    # Журналы созданных тестами событий для удаления после аварийно завершенных запусков
+    EVENT_JOURNAL_DIR = ".qa_events"
+    # Журнал работающего процесса очищается, только если не менялся дольше этого времени, секунд;
+    # число попыток удалить событие из журнала прошлых запусков
+    EVENT_JOURNAL_STALE_AFTER = 6 * 60 * 60
+    EVENT_JOURNAL_MAX_SWEEPS = 3
+
+    # Запуск в несколько процессов (--shards): каталог истории длительностей тестов, планов и журналов воркеров,
+    # оценка памяти на один воркер с браузером, МБ
+    SHARD_DIR = ".qa_shards"
+    BROWSER_WORKER_RAM_MB = 1024
+
+    # История p50/p95 методов страниц по запускам профилировщика шагов (--profile-steps)
+    # и число хранимых запусков на метод
+    STEP_HISTORY_PATH = ".qa_profile/step_history.json"
+    STEP_HISTORY_RUNS = 20
+
+    # Ограничение суммарного размера скриншотов и HTML упавших тестов за сессию, байт
+    FAILURE_ARTIFACTS_MAX_BYTES = 50 * 2 ** 20
 
 
 config = Config()
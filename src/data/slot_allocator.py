@@ -0,0 +1,166 @@
+import os
+import re
+import uuid
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional, Tuple
+
+from src.config.config import config
+from src.data.test_data import TestData
+from src.utils.calendar_time import local_iso
+from src.utils.logger_utils import logger
+
+
+@dataclass(frozen=True)
+class EventSlot:
+    """
+    Временное окно в календаре преподавателя, выделенное одному тесту.
+
+    Attributes:
+        date: дата в формате 'YYYY-MM-DD' (московское время)
+        start_time: время начала в формате 'HH:MM'
+        end_time: время окончания в формате 'HH:MM'
+        title_prefix: уникальный префикс названий событий теста
+    """
+
+    date: str
+    start_time: str
+    end_time: str
+    title_prefix: str
+
+    @property
+    def start_at(self) -> str:
+        return local_iso(self.date, self.start_time)
+
+    @property
+    def end_at(self) -> str:
+        return local_iso(self.date, self.end_time)
+
+    def title(self, name: str) -> str:
+        """
+        Название события с префиксом слота.
+        """
+        return f"{self.title_prefix}{name}"
+
+
+_LOCAL_RUN_ID = uuid.uuid4().hex
+
+
+def current_run_id() -> str:
+    """
+    Идентификатор запуска, общий для всех воркеров одного прогона.
+
+    При запуске в несколько процессов берется из PYTEST_XDIST_TESTRUNUID, иначе генерируется на процесс.
+    """
+    return os.getenv("PYTEST_XDIST_TESTRUNUID") or _LOCAL_RUN_ID
+
+
+def current_worker() -> Tuple[int, int]:
+    """
+    Возвращает номер текущего воркера и общее число воркеров.
+
+    Номер берется из переменных окружения, которые выставляет запуск в несколько процессов
+    (PYTEST_XDIST_WORKER='gw3', PYTEST_XDIST_WORKER_COUNT='8'). При последовательном запуске - (0, 1).
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    match = re.search(r"\d+", worker)
+    worker_id = int(match.group()) if match else 0
+    worker_count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return worker_id, max(worker_count, worker_id + 1)
+
+
+class SlotAllocator:
+    """
+    Распределитель непересекающихся временных окон и префиксов названий между воркерами и тестами.
+
+    Пул слотов - декартово произведение дней и интервалов рабочего времени. Слоты пула нумеруются
+    по порядку, воркер N получает слоты с номерами N, N + count, N + 2 * count, ...,
+    поэтому воркеры никогда не бронируют одно и то же время.
+    """
+
+    # Общий маркер в начале названий всех событий, созданных автотестами
+    TITLE_MARKER = "qa-"
+
+    def __init__(self,
+                 days: Optional[Iterable[int]] = None,
+                 hours: Optional[Tuple[int, int]] = None,
+                 slot_minutes: Optional[int] = None,
+                 worker_id: Optional[int] = None,
+                 worker_count: Optional[int] = None,
+                 run_id: Optional[str] = None):
+        """
+        Args:
+            days: смещения дней относительно сегодняшней даты (1 - завтра)
+            hours: интервал часов (начало, конец), в котором выделяются слоты
+            slot_minutes: длительность слота в минутах
+            worker_id: номер воркера; по умолчанию определяется из окружения
+            worker_count: число воркеров; по умолчанию определяется из окружения
+            run_id: идентификатор запуска в префиксе названий; по умолчанию - начало current_run_id()
+        """
+        default_worker_id, default_worker_count = current_worker()
+
+        self.days = tuple(days if days is not None else config.EVENT_SLOT_DAYS)
+        self.hours = hours if hours is not None else config.EVENT_SLOT_HOURS
+        self.slot_minutes = slot_minutes if slot_minutes is not None else config.EVENT_SLOT_MINUTES
+        self.worker_id = default_worker_id if worker_id is None else worker_id
+        self.worker_count = default_worker_count if worker_count is None else worker_count
+        self.run_id = run_id or current_run_id()[:4]
+
+        self._slots = self._worker_slots()
+        self._allocated = 0
+
+    @property
+    def title_marker(self) -> str:
+        """
+        Префикс, общий для всех названий событий текущего запуска.
+        """
+        return f"{self.TITLE_MARKER}{self.run_id}"
+
+    def _pool(self) -> Iterator[Tuple[int, int]]:
+        """
+        Все слоты пула в виде пар (смещение дня, минута начала от полуночи).
+        """
+        start_hour, end_hour = self.hours
+        for day in self.days:
+            for minute in range(start_hour * 60, end_hour * 60 - self.slot_minutes + 1, self.slot_minutes):
+                yield day, minute
+
+    def _worker_slots(self) -> list:
+        return [slot for index, slot in enumerate(self._pool())
+                if index % self.worker_count == self.worker_id]
+
+    def allocate(self) -> EventSlot:
+        """
+        Выделяет следующий свободный слот воркера.
+
+        Raises:
+            RuntimeError: если слоты воркера закончились
+        """
+        if self._allocated >= len(self._slots):
+            raise RuntimeError(
+                f"Воркер {self.worker_id} израсходовал все {len(self._slots)} слотов. "
+                f"Расширьте пул дней или часов (EVENT_SLOT_DAYS, EVENT_SLOT_HOURS)")
+
+        day, minute = self._slots[self._allocated]
+        sequence = self._allocated
+        self._allocated += 1
+
+        base_date = datetime.strptime(TestData.date(), "%Y-%m-%d")
+        slot_date = base_date + timedelta(days=day - 1)
+        start = timedelta(minutes=minute)
+        end = start + timedelta(minutes=self.slot_minutes)
+
+        slot = EventSlot(
+            date=slot_date.strftime("%Y-%m-%d"),
+            start_time=self._format_time(start),
+            end_time=self._format_time(end),
+            title_prefix=f"{self.title_marker}{self.worker_id:02d}{sequence:02d}_"
+        )
+        logger.debug(f"Выделен слот {slot}")
+        return slot
+
+    @staticmethod
+    def _format_time(delta: timedelta) -> str:
+        minutes = int(delta.total_seconds()) // 60
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
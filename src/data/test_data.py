@@ -1,11 +1,9 @@
 import os
 import uuid
-import pytz
 
-from src.utils.logger_utils import logger
+from src.utils import calendar_time
 
 from dotenv import load_dotenv
-from datetime import datetime, timedelta, timezone
 
 load_dotenv()
 
@@ -17,6 +15,7 @@ class TestData:
 
     VALID_EMAIL = os.getenv("SKYENG_EMAIL")
     VALID_PASSWORD = os.getenv("SKYENG_PASSWORD")
+    GLOBAL_TOKEN = os.getenv("GLOBAL_TOKEN")
 
     INVALID_EMAIL = "test@skyeng.ru"
     INVALID_PASSWORD = "testTEST"
@@ -29,18 +28,9 @@ class TestData:
     @classmethod
     def date(cls):
         """
-        Возвращает завтрашнюю дату с учетом смещения часового пояса на -4 часа
+        Возвращает завтрашнюю дату по московскому времени (вычисляется один раз в сутки)
         """
-        local_tz = pytz.timezone("Europe/Moscow")
-        now_utc = datetime.now(timezone.utc)
-        local_time = now_utc.astimezone(local_tz)
-        tomorrow = local_time + timedelta(days=1)
-
-        logger.debug(f"Текущее UTC время: {now_utc.strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.debug(f"Локальное время ({local_tz}): {local_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.debug(f"Завтрашняя дата ({local_tz}): {tomorrow.strftime('%Y-%m-%d')}")
-
-        return tomorrow.strftime("%Y-%m-%d")
+        return calendar_time.tomorrow()
 
     @classmethod
     def get_personal_event(cls, background_color: str = "#EBFDF2", color: str = "#43B658", description: str = "",
@@ -53,10 +43,30 @@ class TestData:
             "color": color,
             "description": description,
             "title": title,
-            "startAt": f"{date}T{start_at}:00+03:00",
-            "endAt": f"{date}T{end_at}:00+03:00"
+            "startAt": calendar_time.local_iso(date, start_at),
+            "endAt": calendar_time.local_iso(date, end_at)
         }
 
+    @classmethod
+    def get_personal_events(cls, slots, background_color: str = "#EBFDF2", color: str = "#43B658",
+                            description: str = ""):
+        """
+        Генерация пачки событий для слотов (название, дата, время начала, время окончания)
+        """
+        slots = list(slots)
+        times = calendar_time.iso_slots((date, start_at, end_at) for _, date, start_at, end_at in slots)
+        return [
+            {
+                "backgroundColor": background_color,
+                "color": color,
+                "description": description,
+                "title": title,
+                "startAt": start_at,
+                "endAt": end_at
+            }
+            for (title, _, _, _), (start_at, end_at) in zip(slots, times)
+        ]
+
     @classmethod
     def get_personal_event_by_id(cls,
                                  background_color: str = "#EBFDF2",
@@ -84,11 +94,9 @@ class TestData:
                 "description": description,
                 "title": title,
                 "id": event_id,
-                "startAt": f"{date}T{start_at}:00+03:00",
-                "endAt": f"{date}T{end_at}:00+03:00",
-                "oldStartAt": datetime.fromisoformat(old_start_at)
-                .astimezone(timezone(timedelta(hours=3)))
-                .isoformat()
+                "startAt": calendar_time.local_iso(date, start_at),
+                "endAt": calendar_time.local_iso(date, end_at),
+                "oldStartAt": calendar_time.to_zone_iso(old_start_at)
             }
         return {
             "backgroundColor": background_color,
@@ -96,6 +104,6 @@ class TestData:
             "description": description,
             "title": title,
             "id": event_id,
-            "startAt": f"{date}T{start_at}:00+03:00",
-            "endAt": f"{date}T{end_at}:00+03:00"
+            "startAt": calendar_time.local_iso(date, start_at),
+            "endAt": calendar_time.local_iso(date, end_at)
         }
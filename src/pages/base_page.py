@@ -1,27 +1,32 @@
 import allure
 import logging
-
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as ec
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
     NoSuchElementException
 )
 from src.config.config import config
-from typing import List
+from src.utils.calendar_time import utc_option_date
+from src.utils.logger_utils import logger
+from src.utils.wait_engine import Locator, WaitEngine
+from typing import Any, Callable, Dict, List, Optional
 
 
 class BasePage:
     """
     Базовый класс для страницы сайта.
     Содержит общие методы для работы с элементами страницы.
+    Ожидания выполняются через WaitEngine: условие проверяется в браузере и ожидание
+    завершается сразу после его выполнения, время ожиданий собирается в wait_stats.
+    Скриншоты при таймаутах не снимаются: отрицательные проверки (is_element_present) ожидают таймаут
+    штатно, а данные страницы для упавших тестов собирает FailureArtifacts в conftest.
     """
 
     def __init__(self, driver):
         self.driver = driver
         self.base_url = config.BASE_URL
+        self.waits = WaitEngine(driver)
 
     def refresh_page(self):
         """
@@ -29,6 +34,17 @@ class BasePage:
         """
         self.driver.refresh()
 
+    def wait_until(self, predicate: Callable[[], Any], name: str, timeout: int = 10) -> Any:
+        """
+        Ожидание произвольного условия страницы с опросом predicate.
+
+        Args:
+            predicate: функция без аргументов, возвращающая истинное значение при выполнении условия
+            name: название условия в статистике ожиданий
+            timeout: время ожидания в секундах
+        """
+        return self.waits.until_true(predicate, name, timeout)
+
     @allure.step("Поиск элемента {locator}")
     def find_element(self, locator: tuple[str, str], timeout: int = 10) -> WebElement:
         """
@@ -38,19 +54,9 @@ class BasePage:
             locator: кортеж с локатором (By.ID, 'id')
             timeout: время ожидания элемента
         """
-        custom_wait = WebDriverWait(self.driver, timeout)
-
         try:
-            return custom_wait.until(
-                ec.presence_of_element_located(locator),
-                message=f"Не найден элемент по локатору {locator}"
-            )
+            return self.waits.until(locator, "present", timeout, message=f"Не найден элемент по локатору {locator}")
         except TimeoutException as e:
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="screenshot_error",
-                attachment_type=allure.attachment_type.PNG
-            )
             raise TimeoutException(f"Элемент {locator} не найден на странице") from e
 
     @allure.step("Поиск элементов {locator}")
@@ -58,39 +64,26 @@ class BasePage:
         """
         Поиск всех элементов на странице по локатору.
         """
-        custom_wait = WebDriverWait(self.driver, timeout)
-
         try:
-            return custom_wait.until(
-                ec.presence_of_all_elements_located(locator),
-                message=f"Не найдены элементы по локатору {locator}"
-            )
+            return self.waits.until(locator, "present_all", timeout,
+                                    message=f"Не найдены элементы по локатору {locator}")
         except TimeoutException as e:
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="screenshot_error",
-                attachment_type=allure.attachment_type.PNG
-            )
             raise TimeoutException(f"Элементы {locator} не найдены на странице") from e
 
     @allure.step("Клик по элементу {locator}")
-    def click(self, locator: tuple[str, str], timeout: int = 10):
+    def click(self, locator: Locator, timeout: int = 10):
         """
         Клик по элементу с предварительным ожиданием кликабельности элемента.
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                ec.element_to_be_clickable(locator)
-            )
+            element = self.wait_for_element_clickable(locator, timeout)
             element.click()
         except TimeoutException:
             raise AssertionError(
                 f"Не удалось найти или кликнуть по элементу: {locator} за {timeout} секунд.")
         except StaleElementReferenceException:
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    ec.element_to_be_clickable(locator)
-                )
+                element = self.wait_for_element_clickable(locator, timeout)
                 element.click()
             except TimeoutException:
                 raise AssertionError(
@@ -107,9 +100,7 @@ class BasePage:
             timeout: Максимальное время ожидания (в секундах).
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                ec.visibility_of_element_located(locator)
-            )
+            element = self.wait_for_element_visible(locator, timeout)
             element.clear()
             element.send_keys(text)
         except TimeoutException:
@@ -117,9 +108,7 @@ class BasePage:
 
         except StaleElementReferenceException:
             try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    ec.visibility_of_element_located(locator)
-                )
+                element = self.wait_for_element_visible(locator, timeout)
                 element.clear()
                 element.send_keys(text)
             except TimeoutException:
@@ -137,6 +126,30 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
 
+    @allure.step("Ожидание первого из состояний страницы: {states}")
+    def wait_for_first(self, states: Dict[str, tuple[str, str]], timeout: int = 10,
+                       condition: str = "visible") -> Optional[str]:
+        """
+        Ожидание первого из взаимоисключающих состояний страницы (например, аватар пользователя
+        или сообщение об ошибке входа). Все локаторы ожидаются одновременно, поэтому отрицательный
+        результат известен, как только страница показала другое состояние, без ожидания таймаута.
+
+        Args:
+            states: локаторы по именам состояний; при одновременном появлении побеждает указанное раньше
+            timeout: время ожидания в секундах
+            condition: present, visible или clickable
+
+        Returns:
+            Имя наступившего состояния или None, если ни одно не наступило за timeout секунд.
+        """
+        try:
+            state, _ = self.waits.first_of(states, condition, timeout)
+        except TimeoutException:
+            logger.debug(f"Ни одно из состояний {', '.join(states)} не наступило за {timeout} секунд")
+            return None
+        logger.debug(f"Наступило состояние страницы: {state}")
+        return state
+
     @allure.step("Получение текста элемента {locator}")
     def get_text(self, locator: tuple[str, str], timeout: int = 10) -> str:
         """
@@ -147,44 +160,65 @@ class BasePage:
             return element.text
         except (TimeoutException, StaleElementReferenceException) as e:
             logging.error(f"Ошибка: {e}")
-            allure.attach(
-                self.driver.get_screenshot_as_png(),
-                name="get_text_error",
-                attachment_type=allure.attachment_type.PNG
-            )
             raise
 
-    def wait_for_element_visible(self, locator: tuple[str, str], timeout: int = 10):
+    def wait_for_element_visible(self, locator: Locator, timeout: int = 10):
         """
         Ожидание видимости элемента.
         """
-        custom_wait = WebDriverWait(self.driver, timeout)
-
-        return custom_wait.until(
-            ec.visibility_of_element_located(locator),
-            message=f"Элемент {locator} не стал видимым"
-        )
+        return self.waits.until(locator, "visible", timeout, message=f"Элемент {locator} не стал видимым")
 
-    def wait_for_element_disappear(self, locator: tuple[str, str], timeout: int = 10):
+    def wait_for_element_disappear(self, locator: Locator, timeout: int = 10):
         """
         Ожидание исчезновения элемента.
         """
-        custom_wait = WebDriverWait(self.driver, timeout)
-
-        return custom_wait.until(
-            ec.invisibility_of_element_located(locator),
-            message=f"Элемент {locator} не исчез"
-        )
+        return self.waits.until(locator, "invisible", timeout, message=f"Элемент {locator} не исчез")
 
-    def wait_for_element_clickable(self, locator: tuple[str, str], timeout: int = 10) -> WebElement:
+    def wait_for_element_clickable(self, locator: Locator, timeout: int = 10) -> WebElement:
         """
         Ожидание кликабельности элемента.
 
         Args:
-            locator: кортеж с локатором (By.ID, 'id')
+            locator: кортеж с локатором (By.ID, 'id') или найденный элемент
             timeout: время ожидания в секундах
         """
-        return WebDriverWait(self.driver, timeout).until(
-            ec.element_to_be_clickable(locator),
-            message=f"Элемент {locator} не кликабелен"
-        )
+        return self.waits.until(locator, "clickable", timeout, message=f"Элемент {locator} не кликабелен")
+
+    # Значения и элементы опций списка за один вызов: [[значение, опция], ...]
+    SELECT_OPTIONS_SCRIPT = """
+        return Array.from(arguments[0].options).map(function (option) { return [option.value, option]; });
+    """
+
+    @allure.step("Выбор даты {date} в списке {locator}")
+    def select_option_by_date(self, locator: Locator, date: str, timezone_name: Optional[str] = None,
+                              timeout: int = 10) -> bool:
+        """
+        Выбирает в выпадающем списке опцию, значение которой - момент времени в UTC (ISO),
+        приходящийся на дату date в часовом поясе timezone_name.
+
+        Args:
+            locator: кортеж с локатором списка <select> или найденный элемент
+            date: дата в формате 'YYYY-MM-DD'
+            timezone_name: часовой пояс, в котором задана дата (по умолчанию config.TIMEZONE)
+            timeout: время ожидания кликабельности списка
+
+        Returns:
+            bool: True, если опция найдена и выбрана
+        """
+        return self._select_date_option(self.wait_for_element_clickable(locator, timeout), date, timezone_name)
+
+    def _select_date_option(self, select: WebElement, date: str, timezone_name: Optional[str] = None) -> bool:
+        """
+        Выбор опции по дате в найденном списке: значения всех опций читаются одним вызовом execute_script,
+        опция выбирается по индексу.
+        """
+        options = self.driver.execute_script(self.SELECT_OPTIONS_SCRIPT, select)
+        dates = [utc_option_date(value, timezone_name) for value, _ in options]
+        if date not in dates:
+            logger.warning(f"Дата {date} не найдена в списке: {[value for value, _ in options]}")
+            return False
+
+        index = dates.index(date)
+        logger.debug(f"Найдена дата: {date}, значение: {options[index][0]}")
+        options[index][1].click()
+        return True
@@ -0,0 +1,181 @@
+from typing import Callable, Dict, Optional, TypeVar
+
+import allure
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.pages.base_page import BasePage
+from src.pages.locators import LOCATORS, SCOPE_PREFIX, LocatorEntry, LocatorError
+from src.utils.logger_utils import logger
+
+T = TypeVar("T")
+
+
+class FormContext:
+    """
+    Модальное окно или форма с кэшем найденных элементов.
+
+    Корень (локатор реестра) ищется от документа один раз, дочерние элементы ищутся внутри
+    уже найденного корня по относительным локаторам реестра, и найденные элементы переиспользуются
+    всеми последующими действиями. Кэш сбрасывается только при StaleElementReferenceException
+    (окно перерисовано): тогда корень и элементы ищутся заново и действие повторяется.
+
+    Помимо посимвольного ввода (input_text) поля можно заполнить одним вызовом execute_script (fill).
+    """
+
+    STALE_RETRIES = 2
+
+    # Заполнение полей внутри корня: [[селектор, значение], ...]. Значение устанавливается через
+    # нативный сеттер, затем отправляются события input, change и blur, на которые подписаны формы Angular.
+    # Если какого-то поля еще нет, ничего не меняется и возвращается null. Иначе возвращаются поля,
+    # значение которых после обработки событий отличается от заданного: [[селектор, значение], ...]
+    FILL_SCRIPT = """
+        var root = arguments[0], fields = arguments[1];
+        var elements = fields.map(function (field) { return root.querySelector(field[0]); });
+        if (elements.indexOf(null) !== -1) {
+            return null;
+        }
+
+        elements.forEach(function (element, index) {
+            var prototype = Object.getPrototypeOf(element);
+            element.focus();
+            Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, fields[index][1]);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+            element.dispatchEvent(new FocusEvent('blur'));
+        });
+
+        return {mismatches: elements.map(function (element, index) {
+            return [fields[index][0], element.value];
+        }).filter(function (pair, index) {
+            return pair[1] !== fields[index][1];
+        })};
+    """
+
+    def __init__(self, page: BasePage, root: str, timeout: float = 10):
+        """
+        Args:
+            page: страница, через которую выполняются ожидания
+            root: имя локатора корня в реестре (например, "schedule.slot_modal_body")
+            timeout: время ожидания элементов в секундах
+        """
+        self.page = page
+        self.root = root
+        self.timeout = timeout
+        self._elements: Dict[str, WebElement] = {}
+        self.lookups = 0
+        self.stale_retries = 0
+
+    def element(self, name: str) -> WebElement:
+        """
+        Элемент формы по имени локатора реестра; ищется один раз и затем берется из кэша.
+        """
+        element = self._elements.get(name)
+        if element is None:
+            element = self._elements[name] = self._resolve(name)
+        return element
+
+    def invalidate(self) -> None:
+        """
+        Сбрасывает кэш: следующие обращения найдут корень и элементы заново.
+        """
+        self._elements.clear()
+
+    def _resolve(self, name: str) -> WebElement:
+        self.lookups += 1
+        if name == self.root:
+            return self.page.find_element(LOCATORS.get(name), self.timeout)
+
+        entry = LOCATORS[name]
+        if entry.scope is None:
+            raise LocatorError(f"{name}: локатор не относится к корню {self.root}")
+        parent = self.element(entry.scope)
+        return self.page.wait_until(lambda: self._find_child(parent, entry), f"form element {name}", self.timeout)
+
+    def selector(self, name: str) -> str:
+        """
+        CSS-селектор элемента относительно корня формы.
+        """
+        entry = LOCATORS[name]
+        if entry.scope is None:
+            raise LocatorError(f"{name}: локатор не относится к корню {self.root}")
+        if entry.scope == self.root:
+            return entry.value
+
+        parent = self.selector(entry.scope)
+        if entry.value.startswith(SCOPE_PREFIX):
+            return f"{parent} > {entry.value[len(SCOPE_PREFIX):]}"
+        return f"{parent} {entry.value}"
+
+    @staticmethod
+    def _find_child(parent: WebElement, entry: LocatorEntry) -> Optional[WebElement]:
+        try:
+            return parent.find_element(*entry.relative)
+        except NoSuchElementException:
+            return None
+
+    def run(self, name: str, action: Callable[[WebElement], T]) -> T:
+        """
+        Выполняет действие с элементом формы. Если элемент устарел, кэш сбрасывается,
+        элемент ищется заново и действие повторяется (не больше STALE_RETRIES раз).
+        """
+        for attempt in range(self.STALE_RETRIES + 1):
+            try:
+                return action(self.element(name))
+            except StaleElementReferenceException:
+                if attempt == self.STALE_RETRIES:
+                    raise
+                logger.debug(f"Элемент {name} устарел, форма {self.root} ищется заново")
+                self.stale_retries += 1
+                self.invalidate()
+
+    @allure.step("Клик по элементу формы {name}")
+    def click(self, name: str) -> None:
+        """
+        Клик по элементу формы после ожидания его кликабельности.
+        """
+        self.run(name, lambda element: self.page.wait_for_element_clickable(element, self.timeout).click())
+
+    @allure.step("Ввод текста '{text}' в поле формы {name}")
+    def input_text(self, name: str, text: str, click: bool = False) -> None:
+        """
+        Вводит текст в поле формы, предварительно очищая его.
+
+        Args:
+            name: имя локатора поля
+            text: текст для ввода
+            click: кликнуть по полю перед вводом вместо ожидания видимости (поля, которые принимают
+                ввод только в фокусе и видимы вместе с формой)
+        """
+        def fill(element: WebElement) -> None:
+            if click:
+                element.click()
+            else:
+                self.page.wait_for_element_visible(element, self.timeout)
+            element.clear()
+            element.send_keys(text)
+
+        self.run(name, fill)
+
+    @allure.step("Заполнение полей формы одним скриптом")
+    def fill(self, values: Dict[str, str]) -> None:
+        """
+        Заполняет поля формы одним вызовом execute_script и проверяет принятые формой значения
+        в том же вызове. Ждет, пока все поля появятся в корне.
+
+        Args:
+            values: значения по именам локаторов полей
+
+        Raises:
+            AssertionError: форма не приняла значения некоторых полей
+        """
+        fields = [[self.selector(name), value] for name, value in values.items()]
+
+        def fill_fields(root: WebElement) -> dict:
+            return self.page.wait_until(lambda: self.page.driver.execute_script(self.FILL_SCRIPT, root, fields),
+                                        f"form fill {self.root}", self.timeout)
+
+        mismatches = self.run(self.root, fill_fields)["mismatches"]
+        if mismatches:
+            raise AssertionError(f"Поля формы не приняли значения: {mismatches}")
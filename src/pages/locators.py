@@ -0,0 +1,216 @@
+"""
+Реестр локаторов страниц.
+
+Каждый локатор объявляется здесь один раз под именем "<страница>.<элемент>" и проверяется при импорте:
+недопустимая стратегия, лишние пробелы и переносы строк, несбалансированные скобки и кавычки
+приводят к LocatorError. Page object получают локаторы из реестра (LOCATORS.get), поэтому
+медленный или сломанный локатор исправляется в одном месте.
+
+Локаторы модальных окон объявлены относительно корня (scope): абсолютный CSS-селектор собирается
+из цепочки корней один раз при импорте, а относительный (LOCATORS.relative) используется для поиска
+внутри уже найденного корня. Для локаторов, замененных CSS-селекторами, сохранен исходный XPath:
+benchmarks/locator_resolution.py сравнивает на снимке страницы время и результат поиска по обоим.
+"""
+import re
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+SUPPORTED_STRATEGIES = (By.XPATH, By.CSS_SELECTOR, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME,
+                        By.LINK_TEXT, By.PARTIAL_LINK_TEXT)
+SCOPE_PREFIX = ":scope > "
+BRACKETS = {"(": ")", "[": "]"}
+
+
+class LocatorError(ValueError):
+    """
+    Ошибка объявления локатора.
+    """
+
+
+@dataclass(frozen=True)
+class LocatorEntry:
+    """
+    Локатор реестра.
+
+    value - селектор относительно корня scope (для CSS начинается с ":scope > ", если элемент - прямой
+    потомок корня), locator - абсолютный локатор для поиска от документа, xpath - исходный XPath,
+    который заменен селектором.
+    """
+    name: str
+    by: str
+    value: str
+    locator: Tuple[str, str]
+    scope: Optional[str] = None
+    xpath: Optional[str] = None
+
+    @property
+    def relative(self) -> Tuple[str, str]:
+        return self.by, self.value
+
+
+def _check_syntax(name: str, by: str, value: str) -> None:
+    if by not in SUPPORTED_STRATEGIES:
+        raise LocatorError(f"{name}: неподдерживаемая стратегия поиска '{by}'")
+    if not value or value != value.strip():
+        raise LocatorError(f"{name}: пустой локатор или пробелы по краям: {value!r}")
+    if re.search(r"\s{2,}|[\t\n\r]", value):
+        raise LocatorError(f"{name}: лишние пробелы или перенос строки в локаторе: {value!r}")
+    if by == By.CLASS_NAME and " " in value:
+        raise LocatorError(f"{name}: составные классы не поддерживаются By.CLASS_NAME, используйте CSS: {value!r}")
+    if by == By.XPATH and (value.endswith("/") or value[0] not in "/(." or re.search(r"\s/|/\s", value)):
+        raise LocatorError(f"{name}: некорректный XPath: {value!r}")
+
+    stack, quote = [], None
+    for char in value:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in BRACKETS:
+            stack.append(BRACKETS[char])
+        elif char in BRACKETS.values():
+            if not stack or stack.pop() != char:
+                raise LocatorError(f"{name}: несбалансированные скобки: {value!r}")
+    if quote or stack:
+        raise LocatorError(f"{name}: незакрытые кавычки или скобки: {value!r}")
+
+
+class LocatorRegistry:
+    """
+    Реестр локаторов с проверкой при объявлении и поиском внутри корня модального окна.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, LocatorEntry] = {}
+
+    def register(self, name: str, by: str, value: str, scope: Optional[str] = None,
+                 xpath: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Объявляет локатор и возвращает абсолютный локатор (By, селектор).
+
+        Args:
+            name: имя локатора "<страница>.<элемент>"
+            by: стратегия поиска (By.*)
+            value: селектор; для локатора со scope - относительно корня
+            scope: имя локатора корня, внутри которого ищется элемент
+            xpath: исходный XPath, замененный селектором
+
+        Raises:
+            LocatorError: локатор объявлен повторно или некорректен
+        """
+        if name in self._entries:
+            raise LocatorError(f"{name}: локатор уже объявлен")
+        _check_syntax(name, by, value)
+        if xpath is not None:
+            _check_syntax(name, By.XPATH, xpath)
+
+        locator = (by, value)
+        if scope is not None:
+            parent = self._entries.get(scope)
+            if parent is None:
+                raise LocatorError(f"{name}: корень '{scope}' не объявлен")
+            if by != By.CSS_SELECTOR or parent.locator[0] != By.CSS_SELECTOR:
+                raise LocatorError(f"{name}: локаторы внутри корня поддерживаются только для CSS")
+            if value.startswith(SCOPE_PREFIX):
+                locator = (By.CSS_SELECTOR, f"{parent.locator[1]} > {value[len(SCOPE_PREFIX):]}")
+            else:
+                locator = (By.CSS_SELECTOR, f"{parent.locator[1]} {value}")
+
+        self._entries[name] = LocatorEntry(name, by, value, locator, scope, xpath)
+        return locator
+
+    def __getitem__(self, name: str) -> LocatorEntry:
+        return self._entries[name]
+
+    def __iter__(self) -> Iterator[LocatorEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str) -> Tuple[str, str]:
+        """
+        Абсолютный локатор для поиска от документа.
+        """
+        return self._entries[name].locator
+
+    def relative(self, name: str) -> Tuple[str, str]:
+        """
+        Локатор относительно корня scope.
+        """
+        return self._entries[name].relative
+
+    def find(self, root: WebElement, name: str) -> WebElement:
+        """
+        Ищет элемент внутри найденного корня его scope.
+        """
+        return root.find_element(*self.relative(name))
+
+
+LOCATORS = LocatorRegistry()
+register = LOCATORS.register
+
+# Страница входа
+register("login.avatar", By.CLASS_NAME, "avatar")
+register("login.switch_to_email_form", By.CSS_SELECTOR, ".js-phone-form-to-username-password")
+register("login.password_input", By.CSS_SELECTOR, "input[name='password']")
+register("login.username_input", By.CSS_SELECTOR, "input[name='username']")
+register("login.submit_button", By.CSS_SELECTOR,
+         "html > body > div:nth-of-type(1) > div:nth-of-type(2) > div:nth-of-type(2) > div:nth-of-type(1) > div"
+         " > form > div:nth-of-type(5) > button",
+         xpath="/html/body/div[1]/div[2]/div[2]/div[1]/div/form/div[5]/button")
+register("login.form", By.CLASS_NAME, "js-authentication-form-window")
+# Сообщение о неверном логине или пароле: появляется в окне формы после ответа сервера.
+# Класс сообщения не сверен с разметкой id.skyeng.ru, поэтому пустые контейнеры ошибок исключены,
+# а LoginPage.wait_for_login_outcome подтверждает ошибку (см. там)
+register("login.error_banner", By.CSS_SELECTOR, ".js-authentication-form-window [class*='error']:not(:empty)")
+
+# Главная страница
+register("main.avatar", By.CLASS_NAME, "avatar")
+register("main.schedule_tab", By.ID, "left-menu-item:Расписание")
+
+# Страница расписания
+register("schedule.add_event_button", By.CSS_SELECTOR, "ds-icon[target='schedule page - icon plus - click']")
+register("schedule.personal_event", By.CSS_SELECTOR, "tcc-calendar-event-personal")
+register("schedule.delete_confirm_button", By.CSS_SELECTOR,
+         'sky-ui-button[target="schedule page - personal event modal - remove button - click"] button')
+
+# Модальное окно создания события: корень оверлея, тело окна и форма личного события
+register("schedule.overlay", By.CSS_SELECTOR, "#cdk-overlay-0")
+register("schedule.slot_modal_body", By.CSS_SELECTOR,
+         ":scope > cabinet-schedule-class-slot-modal > sky-ui-popup > div > div > div:nth-of-type(2) > div",
+         scope="schedule.overlay")
+register("schedule.personal_event_tab", By.CSS_SELECTOR,
+         ":scope > div:nth-of-type(1) > div > sky-ui-tabs > div > sky-ui-tab:nth-of-type(2)",
+         scope="schedule.slot_modal_body",
+         xpath="//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div/div/div[2]"
+               "/div/div[1]/div/sky-ui-tabs/div/sky-ui-tab[2]")
+register("schedule.personal_event_form", By.CSS_SELECTOR,
+         ":scope > div:nth-of-type(2) > cabinet-schedule-personal-event-form > div",
+         scope="schedule.slot_modal_body")
+
+_FORM_XPATH = ("//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div/div/div[2]"
+              "/div/div[2]/cabinet-schedule-personal-event-form/div")
+register("schedule.event_name_input", By.CSS_SELECTOR, ":scope > div:nth-of-type(1) > input",
+         scope="schedule.personal_event_form", xpath=f"{_FORM_XPATH}/div[1]/input")
+register("schedule.day_dropdown", By.CSS_SELECTOR, ":scope > div:nth-of-type(2) > select",
+         scope="schedule.personal_event_form", xpath=f"{_FORM_XPATH}/div[2]/select")
+register("schedule.event_description", By.CSS_SELECTOR, ":scope > div:nth-of-type(4) > textarea",
+         scope="schedule.personal_event_form", xpath=f"{_FORM_XPATH}/div[4]/textarea")
+register("schedule.save_submit_button", By.CSS_SELECTOR, ":scope > div:nth-of-type(6) > sky-ui-button > button",
+         scope="schedule.personal_event_form", xpath=f"{_FORM_XPATH}/div[6]/sky-ui-button/button")
+
+# Поля времени: исходные XPath искали по всему документу, селекторы ищут внутри формы
+register("schedule.time_picker_start_hh", By.CSS_SELECTOR, "app-time-picker:nth-of-type(1) input[class*='input-hours']",
+         scope="schedule.personal_event_form", xpath="//app-time-picker[1]//input[contains(@class, 'input-hours')]")
+register("schedule.time_picker_start_mm", By.CSS_SELECTOR,
+         "app-time-picker:nth-of-type(1) input[class*='input-minutes']",
+         scope="schedule.personal_event_form", xpath="//app-time-picker[1]//input[contains(@class, 'input-minutes')]")
+register("schedule.time_picker_end_hh", By.CSS_SELECTOR, "app-time-picker:nth-of-type(2) input[class*='input-hours']",
+         scope="schedule.personal_event_form", xpath="//app-time-picker[2]//input[contains(@class, 'input-hours')]")
+register("schedule.time_picker_end_mm", By.CSS_SELECTOR, "app-time-picker:nth-of-type(2) input[class*='input-minutes']",
+         scope="schedule.personal_event_form", xpath="//app-time-picker[2]//input[contains(@class, 'input-minutes')]")
@@ -1,11 +1,16 @@
+import time
+
 import allure
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as ec
+from typing import Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
 
 from src.config.config import config
 from src.pages.base_page import BasePage
+from src.pages.locators import LOCATORS
+from src.utils.logger_utils import logger
 
 
 class LoginPage(BasePage):
@@ -13,13 +18,14 @@ class LoginPage(BasePage):
     Страница входа в систему.
     Содержит методы для взаимодействия с элементами страницы входа.
     """
-    # Локаторы элементов страницы входа
-    AVATAR_LOCATOR = (By.CLASS_NAME, "avatar")
-    SWITCH_TO_EMAIL_FORM = (By.CSS_SELECTOR, ".js-phone-form-to-username-password")
-    EMAIL_PASSWORD_INPUT = (By.CSS_SELECTOR, "input[name='password']")
-    LOGIN_PASSWORD_INPUT = (By.CSS_SELECTOR, "input[name='username']")
-    LOGIN_BUTTON_SUBMIT = (By.XPATH, "/html/body/div[1]/div[2]/div[2]/div[1]/div/form/div[5]/button")
-    LOGIN_FORM = (By.CLASS_NAME, "js-authentication-form-window")
+    # Локаторы элементов страницы входа (объявлены в src/pages/locators.py)
+    AVATAR_LOCATOR = LOCATORS.get("login.avatar")
+    SWITCH_TO_EMAIL_FORM = LOCATORS.get("login.switch_to_email_form")
+    EMAIL_PASSWORD_INPUT = LOCATORS.get("login.password_input")
+    LOGIN_PASSWORD_INPUT = LOCATORS.get("login.username_input")
+    LOGIN_BUTTON_SUBMIT = LOCATORS.get("login.submit_button")
+    LOGIN_FORM = LOCATORS.get("login.form")
+    LOGIN_ERROR_BANNER = LOCATORS.get("login.error_banner")
 
     def __init__(self, driver):
         """
@@ -30,6 +36,8 @@ class LoginPage(BasePage):
         """
         super().__init__(driver)
         self.url = config.LOGIN_URL
+        # Видимые до отправки формы элементы локатора ошибки: они не относятся к результату входа
+        self._errors_before_submit = []
 
     @allure.step("Открытие страницы входа")
     def open(self) -> None:
@@ -44,8 +52,7 @@ class LoginPage(BasePage):
         Нажимает на кнопку, чтобы переключиться на форму входа по email и паролю
         """
         self.click(self.SWITCH_TO_EMAIL_FORM)
-        WebDriverWait(self.driver, 10).until(
-            ec.visibility_of_element_located(self.EMAIL_PASSWORD_INPUT))
+        self.wait_for_element_visible(self.EMAIL_PASSWORD_INPUT)
 
     @allure.step("Ввод email: {email}")
     def enter_email(self, email: str) -> None:
@@ -72,6 +79,8 @@ class LoginPage(BasePage):
         """
         Нажимает на кнопку "Войти"
         """
+        self._errors_before_submit = [element for element in self.driver.find_elements(*self.LOGIN_ERROR_BANNER)
+                                      if element.is_displayed()]
         self.click(self.LOGIN_BUTTON_SUBMIT)
 
     @allure.step("Проверка наличия формы входа")
@@ -81,9 +90,45 @@ class LoginPage(BasePage):
         """
         return self.is_element_present(self.LOGIN_FORM)
 
+    @allure.step("Ожидание результата входа")
+    def wait_for_login_outcome(self, timeout: int = 10) -> Optional[str]:
+        """
+        Ждет результат отправки формы входа: аватар пользователя ("logged_in")
+        или сообщение об ошибке входа ("login_error"), в зависимости от того, что появится раньше.
+
+        Ошибка засчитывается, только если сообщение появилось после отправки формы, браузер остался
+        на странице входа и аватара нет. Иначе элемент с классом ошибки не считается ответом на вход,
+        и до конца timeout ожидается аватар.
+
+        Returns:
+            Имя результата или None, если за timeout секунд не появилось ни то, ни другое
+        """
+        started = time.monotonic()
+        states = {"logged_in": self.AVATAR_LOCATOR, "login_error": self.LOGIN_ERROR_BANNER}
+        try:
+            outcome, element = self.waits.first_of(states, "visible", timeout)
+        except TimeoutException:
+            logger.debug(f"Ни аватар, ни ошибка входа не появились за {timeout} секунд")
+            return None
+        if outcome == "logged_in" or self._is_login_error(element):
+            logger.debug(f"Результат входа: {outcome}")
+            return outcome
+
+        remaining = max(timeout - (time.monotonic() - started), 0)
+        return "logged_in" if self.is_element_present(self.AVATAR_LOCATOR, remaining) else None
+
+    def _is_login_error(self, element) -> bool:
+        return (element not in self._errors_before_submit
+                and urlsplit(self.driver.current_url).netloc == urlsplit(self.url).netloc
+                and not self.driver.find_elements(*self.AVATAR_LOCATOR))
+
     @allure.step("Проверка авторизации пользователя")
     def is_user_logged_in(self) -> bool:
-        return self.is_element_present(self.AVATAR_LOCATOR)
+        """
+        Проверяет, авторизован ли пользователь. При неверных данных возвращает False,
+        как только страница покажет ошибку входа.
+        """
+        return self.wait_for_login_outcome() == "logged_in"
 
     @allure.step("Выполнение входа в систему")
     def login(self, email: str, password: str) -> None:
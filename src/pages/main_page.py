@@ -2,7 +2,7 @@ import allure
 
 from src.config.config import config
 from src.pages.base_page import BasePage
-from selenium.webdriver.common.by import By
+from src.pages.locators import LOCATORS
 
 
 class MainPage(BasePage):
@@ -11,8 +11,8 @@ class MainPage(BasePage):
     Содержит методы для взаимодействия с основными элементами главной страницы.
     """
 
-    AVATAR_LOCATOR = (By.CLASS_NAME, "avatar")
-    SCHEDULE_TAB_LOCATOR = (By.ID, "left-menu-item:Расписание")
+    AVATAR_LOCATOR = LOCATORS.get("main.avatar")
+    SCHEDULE_TAB_LOCATOR = LOCATORS.get("main.schedule_tab")
 
     def __init__(self, driver):
         """
@@ -1,20 +1,35 @@
-from typing import Optional
+import re
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 import allure
-import pytz
 
 from src.config.config import config
-from datetime import datetime, timezone
 from src.pages.base_page import BasePage
+from src.pages.form_context import FormContext
+from src.pages.locators import LOCATORS
 from src.utils.logger_utils import logger
 
 from selenium.webdriver import ActionChains
-from selenium.webdriver.common.by import By
 from selenium.common import TimeoutException, NoSuchElementException
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as ec
+
+
+@dataclass(frozen=True)
+class ScheduleEvent:
+    """
+    Личное событие в сетке расписания.
+    """
+    title: str
+    start_time: str
+    end_time: str
+    color: str
+    element: WebElement
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return self.title, self.start_time, self.end_time
 
 
 class SchedulePage(BasePage):
@@ -23,33 +38,60 @@ class SchedulePage(BasePage):
     Содержит методы для работы с личными событиями в расписании.
     """
 
-    # Локаторы основных элементов
-    ADD_EVENT_BUTTON = (By.CSS_SELECTOR, "ds-icon[target='schedule page - icon plus - click']")
-    PERSONAL_EVENT_TAB = (
-        By.XPATH, "//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div/div/div[2]\
-        /div/div[1]/div/sky-ui-tabs/div/sky-ui-tab[2]")
+    # Локаторы основных элементов (объявлены в src/pages/locators.py)
+    ADD_EVENT_BUTTON = LOCATORS.get("schedule.add_event_button")
+    PERSONAL_EVENT_TAB = LOCATORS.get("schedule.personal_event_tab")
 
     # Локаторы формы личного события
-    EVENT_NAME_INPUT = (By.XPATH, "//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div\
-    /div/div[2]/div/div[2]/cabinet-schedule-personal-event-form/div/div[1]/input")
-    EVENT_DESCRIPTION = (By.XPATH, "//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div\
-    /div/div[2]/div/div[2]/cabinet-schedule-personal-event-form/div/div[4]/textarea")
-    DAY_DROPDOWN = (By.XPATH, "//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div/div/div[2]\
-    /div/div[2]/cabinet-schedule-personal-event-form/div/div[2]/select")
+    EVENT_NAME_INPUT = LOCATORS.get("schedule.event_name_input")
+    EVENT_DESCRIPTION = LOCATORS.get("schedule.event_description")
+    DAY_DROPDOWN = LOCATORS.get("schedule.day_dropdown")
 
     # Локаторы времени
-    TIME_PICKER_START_HH = "//app-time-picker[1]//input[contains(@class, 'input-hours')]"
-    TIME_PICKER_START_MM = "//app-time-picker[1]//input[contains(@class, 'input-minutes')]"
-    TIME_PICKER_END_HH = "//app-time-picker[2]//input[contains(@class, 'input-hours')]"
-    TIME_PICKER_END_MM = "//app-time-picker[2]//input[contains(@class, 'input-minutes')]"
-    PERSONAL_EVENT_CONTAINER = (By.CSS_SELECTOR, "tcc-calendar-event-personal")
-    SAVE_SUBMIT_BUTTON = (By.XPATH,
-                          "//*[@id='cdk-overlay-0']/cabinet-schedule-class-slot-modal/sky-ui-popup/div/div/div[2]\
-                          /div/div[2]/cabinet-schedule-personal-event-form/div/div[6]/sky-ui-button/button")
-
-    DELETE_CONFIRM_BUTTON = (By.CSS_SELECTOR,
-                             'sky-ui-button[target="schedule page - personal event modal - remove button - click"] \
-                             button')
+    TIME_PICKER_START_HH = LOCATORS.get("schedule.time_picker_start_hh")
+    TIME_PICKER_START_MM = LOCATORS.get("schedule.time_picker_start_mm")
+    TIME_PICKER_END_HH = LOCATORS.get("schedule.time_picker_end_hh")
+    TIME_PICKER_END_MM = LOCATORS.get("schedule.time_picker_end_mm")
+    PERSONAL_EVENT_CONTAINER = LOCATORS.get("schedule.personal_event")
+    SAVE_SUBMIT_BUTTON = LOCATORS.get("schedule.save_submit_button")
+
+    # Данные всех личных событий за один вызов: [элемент, название, время, цвет]
+    EXTRACT_PERSONAL_EVENTS_FUNCTION = """
+        function () {
+            return Array.from(document.querySelectorAll('tcc-calendar-event-personal')).map(function (event) {
+                var view = event.querySelector('div.long-view');
+                var title = view && view.querySelector('.long-view__title');
+                var time = view && view.querySelector('.long-view__time');
+                if (!title || !time) {
+                    return null;
+                }
+                return [event, title.innerText.trim(), time.innerText.trim(), getComputedStyle(view).backgroundColor];
+            }).filter(Boolean);
+        }
+    """
+    EXTRACT_PERSONAL_EVENTS_SCRIPT = f"return ({EXTRACT_PERSONAL_EVENTS_FUNCTION})();"
+
+    # Версия DOM страницы: MutationObserver увеличивает счетчик поколений при любом изменении документа.
+    # Случайный id отличает новую загрузку страницы, на которой счетчик начинается заново.
+    # Если версия совпадает с известной (arguments[0]), события не извлекаются: [версия, null]
+    PERSONAL_EVENTS_INDEX_SCRIPT = f"""
+        if (!window.__scheduleGeneration) {{
+            var generation = window.__scheduleGeneration = {{id: Math.random().toString(36).slice(2), value: 0}};
+            new MutationObserver(function () {{ generation.value++; }})
+                .observe(document.documentElement, {{childList: true, subtree: true, characterData: true}});
+        }}
+        var version = window.__scheduleGeneration.id + ':' + window.__scheduleGeneration.value;
+        if (version === arguments[0]) {{
+            return [version, null];
+        }}
+        return [version, ({EXTRACT_PERSONAL_EVENTS_FUNCTION})()];
+    """
+    EVENT_TIME_PATTERN = re.compile(r"\d{1,2}:\d{2}")
+
+    DELETE_CONFIRM_BUTTON = LOCATORS.get("schedule.delete_confirm_button")
+
+    # Режимы заполнения формы личного события (см. create_personal_event)
+    FILL_MODES = ("typing", "script")
 
     def __init__(self, driver):
         """
@@ -60,6 +102,8 @@ class SchedulePage(BasePage):
         """
         super().__init__(driver)
         self.url = config.SCHEDULE_URL
+        self._event_index: Dict[Tuple[str, str, str], ScheduleEvent] = {}
+        self._event_index_version: Optional[str] = None
 
     @allure.step("Открытие страницы расписания")
     def open(self) -> None:
@@ -89,9 +133,6 @@ class SchedulePage(BasePage):
         Returns:
             None
         """
-        WebDriverWait(self.driver, 10).until(
-            ec.element_to_be_clickable(self.ADD_EVENT_BUTTON)
-        )
         self.click(self.ADD_EVENT_BUTTON)
 
     @allure.step("Переключение на вкладку 'Личные события'")
@@ -102,9 +143,6 @@ class SchedulePage(BasePage):
         Returns:
             None
         """
-        WebDriverWait(self.driver, 10).until(
-            ec.element_to_be_clickable(self.PERSONAL_EVENT_TAB)
-        )
         self.click(self.PERSONAL_EVENT_TAB)
 
     @allure.step("Ввод названия личного события: {personal_event_name}")
@@ -118,9 +156,6 @@ class SchedulePage(BasePage):
         Returns:
             None
         """
-        WebDriverWait(self.driver, 10).until(
-            ec.visibility_of_element_located(self.EVENT_NAME_INPUT)
-        )
         self.input_text(self.EVENT_NAME_INPUT, personal_event_name)
 
     @allure.step("Ввод описания личного события")
@@ -144,9 +179,6 @@ class SchedulePage(BasePage):
         Returns:
             None
         """
-        WebDriverWait(self.driver, 10).until(
-            ec.element_to_be_clickable(self.DAY_DROPDOWN)
-        )
         self.click(self.DAY_DROPDOWN)
 
     @allure.step("Выбор даты: {date}")
@@ -157,30 +189,7 @@ class SchedulePage(BasePage):
         Args:
             date: дата в формате 'YYYY-MM-DD' (локальное время Москвы).
         """
-        select_element = self.find_element(self.DAY_DROPDOWN)
-        WebDriverWait(self.driver, 10).until(
-            ec.element_to_be_clickable(select_element)
-        )
-        select = Select(select_element)
-        options = select.options
-
-        local_tz = pytz.timezone("Europe/Moscow")
-
-        for option in options:
-            # Получаем значение атрибута value (UTC дата)
-            option_value_utc = option.get_attribute("value")
-            # Парсим UTC дату
-            utc_date = datetime.fromisoformat(option_value_utc.replace("Z", ""))
-            utc_date = utc_date.replace(tzinfo=timezone.utc)
-            # Конвертируем в московское время
-            local_date = utc_date.astimezone(local_tz)
-            # Форматируем в 'YYYY-MM-DD'
-            option_date = local_date.strftime("%Y-%m-%d")
-
-            if date == option_date:
-                logger.debug(f'Найдена дата: {option_date}, значение: {option_value_utc}')
-                option.click()
-                return
+        self.select_option_by_date(self.DAY_DROPDOWN, date)
 
     @allure.step("Прокрутка к элементу на странице")
     def scroll_to_element(self, element):
@@ -204,8 +213,8 @@ class SchedulePage(BasePage):
         start_hh, start_mm = start_time.split(":")
         end_hh, end_mm = end_time.split(":")
 
-        start_hh_element = self.driver.find_element(By.XPATH, self.TIME_PICKER_START_HH)
-        start_mm_element = self.driver.find_element(By.XPATH, self.TIME_PICKER_START_MM)
+        start_hh_element = self.driver.find_element(*self.TIME_PICKER_START_HH)
+        start_mm_element = self.driver.find_element(*self.TIME_PICKER_START_MM)
 
         start_hh_element.click()
         start_hh_element.clear()
@@ -215,8 +224,8 @@ class SchedulePage(BasePage):
         start_mm_element.clear()
         start_mm_element.send_keys(start_mm)
 
-        end_hh_element = self.driver.find_element(By.XPATH, self.TIME_PICKER_END_HH)
-        end_mm_element = self.driver.find_element(By.XPATH, self.TIME_PICKER_END_MM)
+        end_hh_element = self.driver.find_element(*self.TIME_PICKER_END_HH)
+        end_mm_element = self.driver.find_element(*self.TIME_PICKER_END_MM)
 
         end_hh_element.click()
         end_hh_element.clear()
@@ -234,33 +243,63 @@ class SchedulePage(BasePage):
         Returns:
             None
         """
-        WebDriverWait(self.driver, 10).until(
-            ec.element_to_be_clickable(self.SAVE_SUBMIT_BUTTON)
-        )
         self.click(self.SAVE_SUBMIT_BUTTON)
 
     @allure.step("Создание личного события")
     def create_personal_event(self, event_name: str, event_description: str, date: str, start_time: str,
-                              end_time: str) -> None:
+                              end_time: str, fill_mode: str = "typing") -> None:
         """
         Создает новое личное событие
+
+        Args:
+            fill_mode: typing - посимвольный ввод в каждое поле, как у пользователя;
+                script - все поля заполняются одним вызовом execute_script (быстрее, для подготовки данных)
         """
+        if fill_mode not in self.FILL_MODES:
+            raise ValueError(f"Неизвестный режим заполнения '{fill_mode}'. Доступные: {', '.join(self.FILL_MODES)}")
+
         self.click_add_event_button()
-        self.switch_to_personal_event_tab()
-        self.enter_personal_event_name(event_name)
-        self.enter_personal_event_description(event_description)
-        self.click_on_day_dropdown_list()
-        self.click_day_options_from_drop_down_list(date)
-        self.select_time_picker(start_time, end_time)
-        self.click_create_personal_event_submit_button()
+
+        # Окно ищется один раз, поля - внутри него, найденные элементы переиспользуются
+        form = self.personal_event_form()
+        form.click("schedule.personal_event_tab")
+
+        start_hh, start_mm = start_time.split(":")
+        end_hh, end_mm = end_time.split(":")
+        times = (("schedule.time_picker_start_hh", start_hh), ("schedule.time_picker_start_mm", start_mm),
+                 ("schedule.time_picker_end_hh", end_hh), ("schedule.time_picker_end_mm", end_mm))
+
+        if fill_mode == "script":
+            form.fill({"schedule.event_name_input": event_name, "schedule.event_description": event_description,
+                       **dict(times)})
+            form.run("schedule.day_dropdown", lambda select: self._select_date_option(select, date))
+        else:
+            form.input_text("schedule.event_name_input", event_name)
+            form.input_text("schedule.event_description", event_description)
+            form.click("schedule.day_dropdown")
+            form.run("schedule.day_dropdown", lambda select: self._select_date_option(select, date))
+            for name, value in times:
+                form.input_text(name, value, click=True)
+
+        form.click("schedule.save_submit_button")
+
+    def personal_event_form(self) -> FormContext:
+        """
+        Окно создания события с кэшем найденных полей.
+        """
+        return FormContext(self, "schedule.slot_modal_body")
 
     @allure.step("Проверка создания личного события")
-    def is_personal_event_created(self, event_name: str) -> bool:
+    def is_personal_event_created(self, event_name: str, timeout: int = 10) -> bool:
         """
         Проверяет, создано ли личное событие
         """
-        event_locator = (By.XPATH, f"//div[contains(text(), '{event_name}')]")
-        return self.is_element_present(event_locator)
+        try:
+            self.wait_until(lambda: any(event_name in title for title, _, _ in self.personal_event_index()),
+                            f"personal event created {event_name}", timeout)
+            return True
+        except TimeoutException:
+            return False
 
     @allure.step("Удаление личного события")
     def delete_personal_event(self, event: WebElement) -> None:
@@ -272,15 +311,12 @@ class SchedulePage(BasePage):
         """
         try:
             self.click(event)
-            delete_button = WebDriverWait(self.driver, 10).until(
-                ec.element_to_be_clickable(self.DELETE_CONFIRM_BUTTON)
-            )
+            delete_button = self.wait_for_element_clickable(self.DELETE_CONFIRM_BUTTON)
             delete_button.click()
             logger.debug("Кнопка удаления нажата.")
 
             try:
-                WebDriverWait(self.driver, 10).until(ec.invisibility_of_element_located((By.XPATH,
-                                                                                         "//div[@class='event' and contains(.,'Test Событие')]")))
+                self.wait_for_element_disappear(event)
                 logger.debug("Событие успешно удалено (ожидание завершено)")
             except TimeoutException:
                 logger.warning("Ожидание удаления события истекло.")
@@ -294,6 +330,49 @@ class SchedulePage(BasePage):
             logger.error(f"Кнопка удаления не найдена для события {event}.  Локатор: {self.DELETE_CONFIRM_BUTTON}")
             raise
 
+    def _parse_personal_events(self, rows: list) -> List[ScheduleEvent]:
+        events = []
+        for element, title, time_range, color in rows:
+            times = self.EVENT_TIME_PATTERN.findall(time_range)
+            if len(times) < 2:
+                logger.debug(f"Не удалось разобрать время события '{title}': {time_range}")
+                continue
+            events.append(ScheduleEvent(title, times[0], times[1], color, element))
+        return events
+
+    def extract_personal_events(self) -> List[ScheduleEvent]:
+        """
+        Возвращает все личные события расписания одним вызовом execute_script.
+        """
+        return self._parse_personal_events(self.driver.execute_script(self.EXTRACT_PERSONAL_EVENTS_SCRIPT))
+
+    def personal_event_index(self) -> Dict[Tuple[str, str, str], ScheduleEvent]:
+        """
+        Индекс личных событий по (название, начало, окончание).
+
+        Индекс перестраивается, только если DOM страницы изменился с прошлого обращения,
+        иначе обращение стоит одного легкого вызова execute_script.
+        """
+        version, rows = self.driver.execute_script(self.PERSONAL_EVENTS_INDEX_SCRIPT, self._event_index_version)
+        if rows is not None:
+            self._event_index = {event.key: event for event in self._parse_personal_events(rows)}
+            self._event_index_version = version
+            logger.debug(f"Индекс личных событий перестроен ({version}): {len(self._event_index)} событий")
+        return self._event_index
+
+    @allure.step("Получение личных событий из расписания")
+    def get_personal_events(self, timeout: int = 10) -> List[ScheduleEvent]:
+        """
+        Возвращает личные события расписания, ожидая появления хотя бы одного.
+        Возвращает пустой список, если события не появились за timeout секунд.
+        """
+        try:
+            events = self.wait_until(lambda: list(self.personal_event_index().values()), "personal events", timeout)
+        except TimeoutException:
+            events = []
+        logger.debug(f'Найдено {len(events)} личных событий')
+        return events
+
     @allure.step("Получение личного события из расписания")
     def get_personal_event_from_schedule(self, event_name: str, event_start_time: str,
                                          event_end_time: str) -> Optional[WebElement]:
@@ -301,25 +380,11 @@ class SchedulePage(BasePage):
         Возвращает личное событие по имени и времени из расписания.
         Возвращает None, если событие не найдено.
         """
-        calendar_events = self.find_elements(self.PERSONAL_EVENT_CONTAINER)
-        logger.debug(f'Найдено {len(calendar_events)} личных событий')
-
-        for event in calendar_events:
-            try:
-                long_view_container = event.find_element(By.CSS_SELECTOR, 'div.long-view')
-                event_title = long_view_container.find_element(By.CSS_SELECTOR, '.long-view__title').text
-                event_time = long_view_container.find_element(By.CSS_SELECTOR, '.long-view__time').text
-            except NoSuchElementException:
-                logger.debug("Элемент 'div.long-view' или его потомки не найдены в текущем блоке.")
-                continue  # Skip this event
-
-            if event_title == event_name:
-                start_event_time = event_time.split()[0]
-                end_event_time = event_time.split()[2]
-
-                if event_start_time == start_event_time and event_end_time == end_event_time:
-                    logger.debug(f'Найдено событие: {event}')
-                    return event
+        if self.get_personal_events():
+            event = self._event_index.get((event_name, event_start_time, event_end_time))
+            if event is not None:
+                logger.debug(f'Найдено событие: {event}')
+                return event.element
 
         logger.debug(f"Событие {event_name} c временем {event_start_time} - {event_end_time} не найдено.")
         return None
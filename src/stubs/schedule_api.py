@@ -0,0 +1,281 @@
+"""
+Локальная замена API расписания преподавателя (/v2/schedule) с хранением событий в памяти.
+
+Запуск отдельно:
+    python -m src.stubs.schedule_api --port 8080
+    API_URL=http://127.0.0.1:8080/v2/schedule pytest tests/test_api.py
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import threading
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.config.config import config
+
+BASE_PATH = "/v2/schedule"
+
+
+class ScheduleValidationError(ValueError):
+    """
+    Некорректные данные события.
+    """
+
+
+class ScheduleStore:
+    """
+    Хранилище личных событий в памяти.
+
+    События индексируются по id и по времени начала (отсортированный список), поэтому выборка
+    событий, пересекающихся с интервалом [from, to), выполняется бинарным поиском.
+    """
+
+    FIELDS = ("title", "description", "color", "backgroundColor")
+
+    def __init__(self):
+        self._events: Dict[int, dict] = {}
+        # Отсортированный индекс (начало в секундах, id)
+        self._by_start: List[Tuple[float, int]] = []
+        self._max_duration = 0.0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._events)
+
+    @staticmethod
+    def _timestamp(value) -> float:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            raise ScheduleValidationError(f"Некорректная дата и время: {value!r}")
+
+    def _validate(self, data: dict) -> Tuple[float, float]:
+        title = data.get("title") or ""
+        if not title:
+            raise ScheduleValidationError("Название события обязательно")
+
+        start, end = self._timestamp(data.get("startAt")), self._timestamp(data.get("endAt"))
+        if end <= start:
+            raise ScheduleValidationError("Время окончания должно быть позже времени начала")
+        return start, end
+
+    def _index(self, event: dict) -> None:
+        insort(self._by_start, (event["_start"], event["id"]))
+        self._max_duration = max(self._max_duration, event["_end"] - event["_start"])
+
+    def _unindex(self, event: dict) -> None:
+        position = bisect_left(self._by_start, (event["_start"], event["id"]))
+        del self._by_start[position]
+
+    def create(self, data: dict) -> dict:
+        start, end = self._validate(data)
+        with self._lock:
+            event = {field: data.get(field, "") for field in self.FIELDS}
+            event.update(id=next(self._ids), startAt=data["startAt"], endAt=data["endAt"], _start=start, _end=end)
+            self._events[event["id"]] = event
+            self._index(event)
+            return event
+
+    def update(self, data: dict) -> dict:
+        start, end = self._validate(data)
+        with self._lock:
+            event = self._events.get(data.get("id"))
+            if event is None:
+                raise KeyError(data.get("id"))
+
+            self._unindex(event)
+            event.update({field: data.get(field, event[field]) for field in self.FIELDS})
+            event.update(startAt=data["startAt"], endAt=data["endAt"], _start=start, _end=end)
+            self._index(event)
+            return event
+
+    def remove(self, event_id) -> dict:
+        with self._lock:
+            event = self._events.pop(event_id, None)
+            if event is None:
+                raise KeyError(event_id)
+            self._unindex(event)
+            return event
+
+    def between(self, start_at: str, end_at: str) -> List[dict]:
+        """
+        События, пересекающиеся с интервалом [start_at, end_at), в порядке начала.
+        """
+        start, end = self._timestamp(start_at), self._timestamp(end_at)
+        with self._lock:
+            low = bisect_left(self._by_start, (start - self._max_duration, -1))
+            high = bisect_right(self._by_start, (end, -1))
+            events = (self._events[event_id] for _, event_id in self._by_start[low:high])
+            return [event for event in events if event["_end"] > start and event["_start"] < end]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._by_start.clear()
+            self._max_duration = 0.0
+
+
+def event_view(event: dict) -> dict:
+    """
+    Представление события в ответах API.
+    """
+    payload = {field: event[field] for field in ScheduleStore.FIELDS}
+    payload["id"] = event["id"]
+    return {"type": "personal", "startAt": event["startAt"], "endAt": event["endAt"], "payload": payload}
+
+
+class ScheduleApiHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов к локальному API расписания.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело уходят одним пакетом без задержки Нейгла, иначе keep-alive упирается в задержанный ACK
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    store: ScheduleStore = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: Optional[dict], headers: Optional[dict] = None) -> None:
+        content = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"data": None, "errors": [{"message": message}]})
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            raise ScheduleValidationError("Тело запроса не является JSON")
+
+    def _endpoint(self) -> Optional[str]:
+        path = urlsplit(self.path).path
+        if not path.startswith(BASE_PATH):
+            return None
+        return path[len(BASE_PATH):] or "/"
+
+    def do_GET(self):
+        if self._endpoint() != "/getSchedule":
+            self._send_error(404, f"Неизвестная конечная точка {self.path}")
+            return
+
+        query = parse_qs(urlsplit(self.path).query)
+        try:
+            events = self.store.between(query["from"][0], query["to"][0])
+        except (KeyError, ScheduleValidationError) as e:
+            self._send_error(400, f"Некорректный интервал: {e}")
+            return
+
+        body = {"data": {"payload": [event_view(event) for event in events]}}
+        etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self._send_json(200, body, {"ETag": etag})
+
+    def do_POST(self):
+        endpoint = self._endpoint()
+        try:
+            data = self._read_json()
+            if endpoint == "/createPersonal":
+                self._send_json(200, {"data": event_view(self.store.create(data))})
+            elif endpoint == "/updatePersonal":
+                self._send_json(200, {"data": {"payload": event_view(self.store.update(data))}})
+            elif endpoint == "/removePersonal":
+                event = self.store.remove(data.get("id"))
+                self._send_json(200, {"data": {"payload": {"id": event["id"]}}})
+            else:
+                self._send_error(404, f"Неизвестная конечная точка {self.path}")
+        except ScheduleValidationError as e:
+            self._send_error(400, str(e))
+        except KeyError as e:
+            self._send_error(404, f"Событие {e} не найдено")
+
+
+class ScheduleApiServer:
+    """
+    Локальный HTTP-сервер API расписания, работающий в фоновом потоке.
+
+    Пример:
+        with ScheduleApiServer() as server:
+            config.API_URL = server.api_url
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, store: Optional[ScheduleStore] = None):
+        """
+        Args:
+            host: адрес сервера
+            port: порт; 0 - любой свободный
+            store: хранилище событий; по умолчанию пустое
+        """
+        self.store = store or ScheduleStore()
+        handler = type("BoundScheduleApiHandler", (ScheduleApiHandler,), {"store": self.store})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="schedule-api", daemon=True)
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def start(self) -> "ScheduleApiServer":
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Обслуживает запросы в текущем потоке (для запуска из командной строки).
+        """
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = ScheduleApiServer(args.host, args.port)
+    print(f"API расписания: {server.api_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
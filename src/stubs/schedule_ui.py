@@ -0,0 +1,116 @@
+"""
+Локальная замена страниц кабинета преподавателя (вход, главная, расписание) для замеров UI-сценариев.
+
+Страницы повторяют разметку, на которую рассчитаны локаторы page object, и имитируют
+поведение кабинета на клиенте: вход по паролю, создание и удаление личных событий.
+
+Запуск отдельно:
+    python -m src.stubs.schedule_ui --port 8081
+"""
+import argparse
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PAGES_DIR = Path(__file__).parent / "ui"
+
+ROUTES = {
+    "/": "main.html",
+    "/login": "login.html",
+    "/schedule": "schedule.html",
+}
+
+
+class ScheduleUiHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов к страницам-заменам.
+    """
+
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, content: bytes = b"", content_type: str = "text/html; charset=utf-8") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        page = ROUTES.get(urlsplit(self.path).path)
+        if page is None:
+            # Например, favicon.ico, на котором браузер принимает cookie авторизации
+            self._send(204)
+            return
+        self._send(200, (PAGES_DIR / page).read_bytes())
+
+
+class ScheduleUiServer:
+    """
+    Локальный HTTP-сервер страниц-замен, работающий в фоновом потоке.
+
+    Пример:
+        with ScheduleUiServer() as server:
+            config.LOGIN_URL = server.login_url
+            config.SCHEDULE_URL = server.schedule_url
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), ScheduleUiHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="schedule-ui", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self) -> str:
+        return f"{self.base_url}/login"
+
+    @property
+    def schedule_url(self) -> str:
+        return f"{self.base_url}/schedule"
+
+    def start(self) -> "ScheduleUiServer":
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    server = ScheduleUiServer(args.host, args.port)
+    print(f"Страницы кабинета: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
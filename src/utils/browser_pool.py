@@ -0,0 +1,170 @@
+from typing import Callable, List, Optional, Union
+
+import allure
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.config.config import config
+from src.pages.base_page import BasePage
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.utils.logger_utils import logger
+
+
+class AuthorizedBrowserPool:
+    """
+    Пул прогретых авторизованных браузеров.
+
+    Браузер создается и авторизуется один раз (подстановкой cookie с токеном) и затем
+    переиспользуется тестами одного воркера. Между тестами выполняется дешевый сброс:
+    закрываются оверлеи расписания и открывается страница расписания.
+    Полный вход через форму LoginPage выполняется только если cookie отклонена.
+    Токен можно передать функцией (TokenService.get_token), тогда каждый браузер получает
+    актуальный токен, а токен, полученный при входе через форму, передается в remember_token.
+    """
+
+    # Закрывает модальные окна Angular CDK, оставшиеся от предыдущего теста
+    CLEAR_OVERLAYS_SCRIPT = """
+        document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', bubbles: true}));
+        document.querySelectorAll('.cdk-overlay-container').forEach(function (container) {
+            container.innerHTML = '';
+        });
+    """
+
+    def __init__(self, driver_factory: Callable[[], WebDriver], token: Union[str, Callable[[], Optional[str]], None],
+                 email: str, password: str, auth_check_timeout: int = 5,
+                 remember_token: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            driver_factory: функция, создающая новый экземпляр веб-драйвера
+            token: значение cookie token_global (GLOBAL_TOKEN) или функция, возвращающая актуальный токен
+            email: email для резервного входа через форму
+            password: пароль для резервного входа через форму
+            auth_check_timeout: время ожидания признака авторизации после подстановки cookie
+            remember_token: функция, получающая новый токен после входа через форму
+        """
+        self._driver_factory = driver_factory
+        self._token = token
+        self._remember_token = remember_token
+        self._email = email
+        self._password = password
+        self._auth_check_timeout = auth_check_timeout
+
+        self._drivers: List[WebDriver] = []
+        self._idle: List[WebDriver] = []
+        self._dirty = set()
+
+    @allure.step("Получение авторизованного браузера из пула")
+    def acquire(self) -> WebDriver:
+        """
+        Возвращает авторизованный браузер на странице расписания.
+        Создает новый браузер, если в пуле нет свободных.
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if id(driver) not in self._dirty:
+                return driver
+
+            try:
+                self._reset(driver)
+                self._dirty.discard(id(driver))
+                return driver
+            except WebDriverException as e:
+                logger.warning(f"Браузер из пула неработоспособен и будет заменен: {e}")
+                self._discard(driver)
+
+        driver = self._driver_factory()
+        self._drivers.append(driver)
+        self._authorize(driver)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Возвращает браузер в пул. Сброс состояния откладывается до следующего acquire().
+        """
+        if driver not in self._drivers:
+            return
+
+        self._dirty.add(id(driver))
+        self._idle.append(driver)
+
+    def close(self) -> None:
+        """
+        Закрывает все браузеры пула.
+        """
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logger.warning(f"Не удалось закрыть браузер: {e}")
+
+        self._drivers.clear()
+        self._idle.clear()
+        self._dirty.clear()
+
+    def _discard(self, driver: WebDriver) -> None:
+        """
+        Удаляет неработоспособный браузер из пула.
+        """
+        self._dirty.discard(id(driver))
+        if driver in self._drivers:
+            self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def _reset(self, driver: WebDriver) -> None:
+        """
+        Дешевый сброс состояния между тестами.
+        """
+        driver.execute_script(self.CLEAR_OVERLAYS_SCRIPT)
+
+        if self._token is not None and driver.get_cookie(config.AUTH_COOKIE_NAME) is None:
+            logger.debug("Cookie авторизации потеряна, выполняется повторная авторизация")
+            self._authorize(driver)
+            return
+
+        driver.get(config.SCHEDULE_URL)
+
+    @allure.step("Авторизация браузера через cookie")
+    def _authorize(self, driver: WebDriver) -> None:
+        """
+        Авторизует браузер подстановкой cookie. Если cookie отклонена,
+        выполняет вход через форму LoginPage.
+        """
+        token = self._token() if callable(self._token) else self._token
+        if token:
+            driver.get(config.AUTH_COOKIE_BOOTSTRAP_URL)
+            driver.add_cookie({
+                "name": config.AUTH_COOKIE_NAME,
+                "value": token,
+                "domain": config.AUTH_COOKIE_DOMAIN,
+                "path": "/",
+                "secure": True
+            })
+            driver.get(config.SCHEDULE_URL)
+
+            if self._is_authorized(driver):
+                logger.debug("Браузер авторизован через cookie")
+                return
+
+            logger.warning("Cookie авторизации отклонена, выполняется вход через форму")
+            driver.delete_all_cookies()
+
+        LoginPage(driver).login(self._email, self._password)
+        if not self._is_authorized(driver):
+            raise AssertionError("Не удалось авторизовать браузер ни через cookie, ни через форму входа")
+
+        cookie = driver.get_cookie(config.AUTH_COOKIE_NAME)
+        if cookie is not None and self._remember_token is not None:
+            self._remember_token(cookie["value"])
+
+        driver.get(config.SCHEDULE_URL)
+
+    def _is_authorized(self, driver: WebDriver) -> bool:
+        """
+        Проверяет авторизацию по наличию аватара пользователя.
+        """
+        return BasePage(driver).is_element_present(MainPage.AVATAR_LOCATOR, timeout=self._auth_check_timeout)
@@ -0,0 +1,107 @@
+"""
+Даты и время календаря преподавателя.
+
+Объекты часовых поясов, смещения относительно UTC и преобразования значений запоминаются,
+"завтра" вычисляется один раз в сутки (до следующей локальной полуночи). Строки startAt/endAt
+для множества слотов собираются пачкой без разбора дат на каждый слот.
+"""
+import logging
+import time
+
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from src.config.config import config
+from src.utils.logger_utils import logger
+
+# Часовой пояс -> (unix-время следующей локальной полуночи, завтрашняя дата 'YYYY-MM-DD')
+_tomorrow_cache: Dict[str, Tuple[float, str]] = {}
+
+
+@lru_cache(maxsize=None)
+def zone(name: Optional[str] = None) -> tzinfo:
+    """
+    Часовой пояс по имени IANA, по умолчанию config.TIMEZONE.
+    """
+    return ZoneInfo(name or config.TIMEZONE)
+
+
+def tomorrow(zone_name: Optional[str] = None) -> str:
+    """
+    Завтрашняя дата 'YYYY-MM-DD' в часовом поясе. Пересчитывается только после локальной полуночи.
+    """
+    zone_name = zone_name or config.TIMEZONE
+    cached = _tomorrow_cache.get(zone_name)
+    if cached is not None and time.time() < cached[0]:
+        return cached[1]
+
+    now_utc = datetime.now(timezone.utc)
+    local_time = now_utc.astimezone(zone(zone_name))
+    next_midnight = datetime.combine(local_time.date() + timedelta(days=1), datetime.min.time(), zone(zone_name))
+    value = next_midnight.strftime("%Y-%m-%d")
+    _tomorrow_cache[zone_name] = (next_midnight.timestamp(), value)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Текущее UTC время: {now_utc.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.debug(f"Локальное время ({zone_name}): {local_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.debug(f"Завтрашняя дата ({zone_name}): {value}")
+    return value
+
+
+@lru_cache(maxsize=4096)
+def utc_offset(date: str, zone_name: Optional[str] = None) -> str:
+    """
+    Смещение часового пояса относительно UTC на дату 'YYYY-MM-DD' в виде '+03:00'.
+    Для строки, не являющейся датой, - текущее смещение.
+    """
+    try:
+        moment = datetime.strptime(date, "%Y-%m-%d").replace(hour=12, tzinfo=zone(zone_name))
+    except ValueError:
+        moment = datetime.now(zone(zone_name))
+    return moment.isoformat()[-6:]
+
+
+def local_iso(date: str, time_of_day: str, zone_name: Optional[str] = None) -> str:
+    """
+    Момент времени 'YYYY-MM-DDTHH:MM:00+03:00' для даты и времени 'HH:MM' в часовом поясе.
+    """
+    return f"{date}T{time_of_day}:00{utc_offset(date, zone_name)}"
+
+
+def iso_slots(slots: Iterable[Tuple[str, str, str]], zone_name: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Строки startAt и endAt для множества слотов (дата, начало 'HH:MM', окончание 'HH:MM').
+    """
+    offsets: Dict[str, str] = {}
+    result = []
+    for date, start_time, end_time in slots:
+        offset = offsets.get(date)
+        if offset is None:
+            offset = offsets[date] = utc_offset(date, zone_name)
+        result.append((f"{date}T{start_time}:00{offset}", f"{date}T{end_time}:00{offset}"))
+    return result
+
+
+@lru_cache(maxsize=4096)
+def to_zone_iso(value: str, zone_name: Optional[str] = None) -> str:
+    """
+    Момент времени ISO, пересчитанный в часовой пояс (например, startAt из ответа API для oldStartAt).
+    """
+    return datetime.fromisoformat(value).astimezone(zone(zone_name)).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def utc_option_date(value: str, zone_name: Optional[str] = None) -> Optional[str]:
+    """
+    Дата 'YYYY-MM-DD' в часовом поясе для момента времени в UTC из значения опции (ISO).
+    Возвращает None, если значение не является датой.
+    """
+    try:
+        utc_date = datetime.fromisoformat(value.replace("Z", ""))
+    except ValueError:
+        return None
+    if utc_date.tzinfo is None:
+        utc_date = utc_date.replace(tzinfo=timezone.utc)
+    return utc_date.astimezone(zone(zone_name)).strftime("%Y-%m-%d")
@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.logger_utils import logger
+
+
+@dataclass(frozen=True)
+class DriverProfile:
+    """
+    Набор настроек браузера для уровня тестов.
+
+    Attributes:
+        name: имя профиля
+        headless: запуск без графического интерфейса
+        window_size: фиксированный размер окна (ширина, высота); None - окно разворачивается
+        disable_images: отключение загрузки изображений
+        page_load_strategy: стратегия загрузки страницы (normal, eager, none)
+        blocked_urls: шаблоны URL сторонних ресурсов, запросы к которым блокируются
+        arguments: дополнительные аргументы командной строки Chrome
+    """
+
+    name: str
+    headless: bool = False
+    window_size: Optional[Tuple[int, int]] = None
+    disable_images: bool = False
+    page_load_strategy: str = "normal"
+    blocked_urls: Tuple[str, ...] = ()
+    arguments: Tuple[str, ...] = field(default=())
+
+
+# Аналитика и виджеты, не влияющие на проверяемую функциональность
+THIRD_PARTY_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*mc.yandex.ru*",
+    "*top-fwz1.mail.ru*",
+    "*vk.com/rtrg*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*intercom.io*",
+    "*sentry.io*",
+)
+
+LIGHTWEIGHT_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-notifications",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-dev-shm-usage",
+)
+
+PROFILES: Dict[str, DriverProfile] = {
+    # Полноценный браузер с графическим интерфейсом, как при ручной проверке
+    "full": DriverProfile(name="full"),
+    # Headless без прочих ограничений
+    "headless": DriverProfile(
+        name="headless",
+        headless=True,
+        window_size=(1920, 1080),
+        arguments=LIGHTWEIGHT_ARGUMENTS
+    ),
+    # Минимальный по ресурсам профиль: без изображений, сторонних скриптов и ожидания полной загрузки
+    "lite": DriverProfile(
+        name="lite",
+        headless=True,
+        window_size=(1920, 1080),
+        disable_images=True,
+        page_load_strategy="eager",
+        blocked_urls=THIRD_PARTY_URL_PATTERNS,
+        arguments=LIGHTWEIGHT_ARGUMENTS
+    ),
+}
+
+DEFAULT_PROFILE = "full"
+
+
+def get_profile(name: str) -> DriverProfile:
+    """
+    Возвращает профиль по имени.
+
+    Raises:
+        ValueError: если профиль с таким именем не объявлен
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Неизвестный профиль драйвера '{name}'. Доступные профили: {', '.join(PROFILES)}")
+
+
+def build_chrome_options(profile: DriverProfile) -> webdriver.ChromeOptions:
+    """
+    Формирует настройки Chrome по профилю.
+    """
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = profile.page_load_strategy
+
+    if profile.headless:
+        options.add_argument("--headless=new")
+
+    if profile.window_size:
+        width, height = profile.window_size
+        options.add_argument(f"--window-size={width},{height}")
+
+    if profile.disable_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    for argument in profile.arguments:
+        options.add_argument(argument)
+
+    return options
+
+
+def create_driver(profile_name: str = DEFAULT_PROFILE) -> WebDriver:
+    """
+    Создает экземпляр Chrome по имени профиля.
+
+    Args:
+        profile_name: имя профиля из PROFILES
+    """
+    profile = get_profile(profile_name)
+    logger.debug(f"Запуск браузера с профилем '{profile.name}'")
+
+    driver = webdriver.Chrome(options=build_chrome_options(profile))
+
+    if profile.window_size is None and not profile.headless:
+        driver.maximize_window()
+
+    if profile.blocked_urls:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+
+    return driver
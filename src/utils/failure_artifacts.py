@@ -0,0 +1,117 @@
+import base64
+import hashlib
+import shutil
+import tempfile
+import threading
+
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import allure
+
+from src.utils.logger_utils import logger
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """
+    Подготовленное вложение: файл на диске или текстовая заметка вместо него.
+    """
+    name: str
+    attachment_type: allure.attachment_type
+    path: Optional[Path] = None
+    note: str = ""
+
+
+class FailureArtifacts:
+    """
+    Сбор скриншота, URL и HTML страницы для упавших тестов.
+
+    capture() вызывается из потока теста сразу после падения, пока браузер еще открыт, и забирает
+    из драйвера только сырые данные. Декодирование, хеширование и запись на диск выполняются
+    в фоновом потоке. attach() вызывается в конце teardown и прикладывает готовые файлы к отчету
+    Allure из потока теста, потому что Allure привязывает вложения к текущему шагу потока.
+    Одинаковые по содержимому вложения сохраняются один раз, повторы заменяются ссылкой на первое.
+    Суммарный размер вложений за сессию ограничен max_total_bytes.
+    """
+
+    def __init__(self, max_total_bytes: int, directory: Optional[Path] = None):
+        self.max_total_bytes = max_total_bytes
+        self.total_bytes = 0
+        self._directory = Path(directory or tempfile.mkdtemp(prefix="qa_artifacts_"))
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+        self._pending: Dict[str, List[Future]] = defaultdict(list)
+        self._seen: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    def capture(self, key: str, driver, title: str) -> None:
+        """
+        Забирает из драйвера скриншот, URL и HTML страницы и ставит их подготовку в очередь.
+
+        Args:
+            key: ключ теста, по которому вложения затем прикладываются в attach()
+            driver: экземпляр веб-драйвера
+            title: название теста в именах вложений
+        """
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+            url = driver.current_url
+            page_source = driver.page_source
+        except Exception as e:
+            logger.warning(f"Не удалось собрать данные страницы для '{title}': {e}")
+            return
+
+        pending = self._pending[key]
+        pending.append(self._executor.submit(
+            self._prepare, f"Скриншот при ошибке: {title}", allure.attachment_type.PNG, screenshot, True, title))
+
+        url_artifact = Future()
+        url_artifact.set_result(Artifact("URL страницы при сбое", allure.attachment_type.TEXT, note=url))
+        pending.append(url_artifact)
+
+        pending.append(self._executor.submit(
+            self._prepare, "Источник страницы при сбое", allure.attachment_type.HTML, page_source, False, title))
+
+    def _prepare(self, name: str, attachment_type, content: str, encoded: bool, title: str) -> Artifact:
+        data = base64.b64decode(content) if encoded else content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            first = self._seen.get(digest)
+            if first is not None:
+                return Artifact(name, allure.attachment_type.TEXT, note=f"Совпадает с вложением теста {first}")
+            if self.total_bytes + len(data) > self.max_total_bytes:
+                return Artifact(name, allure.attachment_type.TEXT,
+                                note=f"Не сохранено: превышен лимит вложений {self.max_total_bytes} байт за сессию")
+            self._seen[digest] = title
+            self.total_bytes += len(data)
+            self._sequence += 1
+            path = self._directory / f"{self._sequence:05d}.{attachment_type.extension}"
+
+        path.write_bytes(data)
+        return Artifact(name, attachment_type, path=path)
+
+    def attach(self, key: str) -> None:
+        """
+        Прикладывает подготовленные вложения теста к отчету Allure.
+        """
+        for future in self._pending.pop(key, []):
+            try:
+                artifact = future.result()
+            except Exception as e:
+                logger.warning(f"Не удалось подготовить вложение: {e}")
+                continue
+
+            if artifact.path is not None:
+                allure.attach.file(str(artifact.path), name=artifact.name, attachment_type=artifact.attachment_type)
+            else:
+                allure.attach(artifact.note, name=artifact.name, attachment_type=artifact.attachment_type)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        shutil.rmtree(self._directory, ignore_errors=True)
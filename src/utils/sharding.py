@@ -0,0 +1,334 @@
+"""
+Запуск тестов в несколько процессов с распределением по длительностям прошлых запусков.
+
+Длительность каждого теста (setup + call + teardown) сохраняется после запуска в файл
+(DurationStore, экспоненциальное сглаживание по запускам). При запуске с --shards тесты
+раскладываются по воркерам жадным алгоритмом LPT (сначала самые долгие, каждый - в наименее
+загруженный подходящий воркер). UI-тесты (и тесты без маркера api) попадают только в воркеры
+с браузером, число которых ограничено доступной памятью; API-тесты заполняют все воркеры.
+Каждый воркер - отдельный процесс pytest с переменными окружения PYTEST_XDIST_*, по которым
+SlotAllocator, журналы событий и профилировщик шагов различают воркеры. Отчеты о тестах воркер
+записывает в файл (ShardReportWriter), запуск с --shards передает их своим плагинам отчетов.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.utils.logger_utils import logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Оценка длительности теста без истории, секунд
+DEFAULT_DURATIONS = {"ui": 15.0, "api": 0.5}
+
+
+class DurationStore:
+    """
+    Длительности тестов по прошлым запускам: {nodeid: {"kind": "ui" или "api", "seconds": секунды}}.
+    """
+
+    def __init__(self, path: Path, smoothing: float = 0.5):
+        """
+        Args:
+            path: файл истории длительностей (JSON)
+            smoothing: вес нового замера при обновлении (1 - хранить только последний замер)
+        """
+        self.path = Path(path)
+        self.smoothing = smoothing
+        self.durations: Dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                self.durations = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logger.warning(f"Файл длительностей тестов {self.path} поврежден и будет перезаписан")
+
+    def update(self, measured: Dict[str, dict]) -> None:
+        """
+        Учитывает замеры запуска: {nodeid: {"kind", "seconds"}}.
+        """
+        for nodeid, entry in measured.items():
+            previous = self.durations.get(nodeid)
+            seconds = entry["seconds"]
+            if previous is not None:
+                seconds = previous["seconds"] + self.smoothing * (seconds - previous["seconds"])
+            self.durations[nodeid] = {"kind": entry["kind"], "seconds": seconds}
+
+    def estimate(self, nodeid: str, kind: str) -> float:
+        """
+        Длительность теста из истории; для нового теста - медиана известных тестов того же вида.
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]["seconds"]
+        known = [entry["seconds"] for entry in self.durations.values() if entry.get("kind") == kind]
+        return statistics.median(known) if known else DEFAULT_DURATIONS[kind]
+
+    def save(self) -> None:
+        """
+        Атомарно записывает историю (несколько запусков могут завершиться одновременно).
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.durations, ensure_ascii=False, indent=1, sort_keys=True),
+                             encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+
+def item_kind(item) -> str:
+    """
+    "api" для модульных тестов и тестов только с маркером api, иначе "ui": тест без маркеров может
+    использовать браузер.
+    """
+    if item.get_closest_marker("ui") is None and (item.get_closest_marker("api") is not None
+                                                  or item.get_closest_marker("unit") is not None):
+        return "api"
+    return "ui"
+
+
+def available_memory_mb() -> Optional[float]:
+    """
+    Доступная память, МБ (psutil или /proc/meminfo); None, если определить не удалось.
+    """
+    if psutil is not None:
+        return psutil.virtual_memory().available / 2 ** 20
+    try:
+        with open("/proc/meminfo", encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def worker_counts(requested: int, ui_tests: int, browser_ram_mb: float,
+                  memory_mb: Optional[float] = None) -> Tuple[int, int]:
+    """
+    Число воркеров с браузером и воркеров только для API-тестов.
+
+    Воркеров с браузером не больше, чем UI-тестов и чем помещается в доступную память
+    (по browser_ram_mb на браузер), но не меньше одного, если UI-тесты есть.
+    """
+    if memory_mb is None:
+        memory_mb = available_memory_mb()
+    browser_workers = min(requested, ui_tests)
+    if memory_mb is not None and browser_ram_mb > 0:
+        browser_workers = min(browser_workers, int(memory_mb // browser_ram_mb))
+    browser_workers = max(browser_workers, 1 if ui_tests else 0)
+    return browser_workers, requested - browser_workers
+
+
+@dataclass
+class Shard:
+    """
+    Тесты одного воркера.
+    """
+    worker_id: int
+    browser: bool
+    nodeids: List[str] = field(default_factory=list)
+    load: float = 0.0
+
+
+def plan_shards(tests: Iterable[Tuple[str, str, float]], browser_workers: int, api_workers: int) -> List[Shard]:
+    """
+    Распределение тестов (nodeid, вид, длительность) по воркерам алгоритмом LPT.
+    UI-тесты назначаются только воркерам с браузером. Пустые воркеры не запускаются.
+    """
+    shards = [Shard(index, True) for index in range(browser_workers)]
+    shards += [Shard(browser_workers + index, False) for index in range(api_workers)]
+
+    for nodeid, kind, seconds in sorted(tests, key=lambda test: test[2], reverse=True):
+        candidates = [shard for shard in shards if shard.browser or kind == "api"]
+        if not candidates:
+            raise ValueError(f"Нет воркера с браузером для теста {nodeid}")
+        target = min(candidates, key=lambda shard: (shard.load, shard.worker_id))
+        target.nodeids.append(nodeid)
+        target.load += seconds
+
+    shards = [shard for shard in shards if shard.nodeids]
+    for index, shard in enumerate(shards):
+        shard.worker_id = index
+    return shards
+
+
+@dataclass
+class ShardResult:
+    shard: Shard
+    returncode: int
+    seconds: float
+    log_path: Path
+    summary: str
+
+
+class ShardRunner:
+    """
+    Запуск воркеров: по процессу pytest на каждый Shard с теми же аргументами командной строки
+    и файлом плана (--shard-plan), по которому воркер оставляет только свои тесты.
+    """
+
+    # Файлы воркера, которые он записывает за запуск: удаляются перед запуском, чтобы после
+    # аварийного завершения воркера не подхватить файлы прошлого запуска
+    WORKER_FILES = ("durations.json", "reports.jsonl", "steps.json", "cassette.json.gz", "junit.xml")
+
+    def __init__(self, args: Sequence[str], directory: Path, cwd: Optional[Path] = None, junitxml: bool = False):
+        """
+        Args:
+            args: аргументы исходного запуска pytest
+            directory: каталог планов, журналов вывода и замеров длительностей воркеров
+            cwd: рабочий каталог воркеров
+            junitxml: исходный запуск пишет отчет JUnit XML; каждый воркер пишет свой в directory
+        """
+        self.args = list(args)
+        self.directory = Path(directory)
+        self.cwd = cwd
+        self.junitxml = junitxml
+
+    def run(self, shards: List[Shard]) -> List[ShardResult]:
+        """
+        Запускает воркеры и ждет их завершения. Результаты - в порядке завершения воркеров.
+        """
+        run_id = uuid.uuid4().hex
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for shard in shards:
+            for suffix in self.WORKER_FILES:
+                (self.directory / f"gw{shard.worker_id}.{suffix}").unlink(missing_ok=True)
+        started = time.monotonic()
+        processes = []
+        try:
+            for shard in shards:
+                processes.append(self._start(shard, len(shards), run_id))
+
+            results = []
+            pending = list(processes)
+            while pending:
+                for running in list(pending):
+                    shard, process, log_path, log = running
+                    if process.poll() is None:
+                        continue
+                    pending.remove(running)
+                    log.close()
+                    results.append(ShardResult(shard, process.returncode, time.monotonic() - started, log_path,
+                                               _summary_line(log_path)))
+                if pending:
+                    time.sleep(0.1)
+            return results
+        finally:
+            for _, process, _, log in processes:
+                if process.poll() is None:
+                    process.terminate()
+                log.close()
+
+    def _start(self, shard: Shard, worker_count: int, run_id: str):
+        name = f"gw{shard.worker_id}"
+        plan_path = self.directory / f"{name}.plan.json"
+        plan_path.write_text(json.dumps({"nodeids": shard.nodeids, "durations": str(self.durations_path(name)),
+                                         "reports": str(self.reports_path(name)),
+                                         "steps": str(self.steps_path(name)),
+                                         "cassette": str(self.cassette_path(name))},
+                                        ensure_ascii=False), encoding="utf-8")
+
+        env = dict(os.environ, PYTEST_XDIST_WORKER=name, PYTEST_XDIST_WORKER_COUNT=str(worker_count),
+                   PYTEST_XDIST_TESTRUNUID=run_id)
+        log_path = self.directory / f"{name}.log"
+        log = log_path.open("w", encoding="utf-8")
+        command = [sys.executable, "-m", "pytest", *self.args, f"--shard-plan={plan_path}"]
+        if self.junitxml:
+            # Последнее значение опции заменяет путь исходного запуска: воркеры не перезаписывают отчеты друг друга
+            command.append(f"--junitxml={self.directory / f'{name}.junit.xml'}")
+        logger.info(f"Воркер {name}: {len(shard.nodeids)} тестов, оценка {shard.load:.1f} с, "
+                    f"{'с браузером' if shard.browser else 'только API'}")
+        process = subprocess.Popen(command, cwd=self.cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        return shard, process, log_path, log
+
+    def durations_path(self, worker: str) -> Path:
+        return self.directory / f"{worker}.durations.json"
+
+    def reports_path(self, worker: str) -> Path:
+        return self.directory / f"{worker}.reports.jsonl"
+
+    def steps_path(self, worker: str) -> Path:
+        """
+        Длительности вызовов методов страниц воркера при --profile-steps (для истории профиля шагов).
+        """
+        return self.directory / f"{worker}.steps.json"
+
+    def cassette_path(self, worker: str) -> Path:
+        """
+        Кассета API, которую воркер записывает при --api-cassette=record (объединяет запуск с --shards).
+        """
+        return self.directory / f"{worker}.cassette.json.gz"
+
+    def collect_durations(self, results: List[ShardResult]) -> Dict[str, dict]:
+        """
+        Замеры длительностей, записанные воркерами.
+        """
+        durations = {}
+        for result in results:
+            path = self.durations_path(f"gw{result.shard.worker_id}")
+            if path.exists():
+                durations.update(json.loads(path.read_text(encoding="utf-8")))
+        return durations
+
+    def collect_step_samples(self, results: List[ShardResult]) -> Dict[str, List[float]]:
+        """
+        Длительности вызовов методов страниц, записанные воркерами, объединенные по методам.
+        """
+        samples: Dict[str, List[float]] = {}
+        for result in results:
+            path = self.steps_path(f"gw{result.shard.worker_id}")
+            if path.exists():
+                for name, values in json.loads(path.read_text(encoding="utf-8")).items():
+                    samples.setdefault(name, []).extend(values)
+        return samples
+
+    def collect_reports(self, results: List[ShardResult]) -> List[dict]:
+        """
+        Отчеты о тестах (сериализованные TestReport), записанные воркерами, в порядке номеров воркеров.
+        """
+        reports = []
+        for result in sorted(results, key=lambda result: result.shard.worker_id):
+            path = self.reports_path(f"gw{result.shard.worker_id}")
+            if path.exists():
+                with path.open(encoding="utf-8") as lines:
+                    reports += [json.loads(line) for line in lines if line.strip()]
+        return reports
+
+
+class ShardReportWriter:
+    """
+    Плагин воркера: дописывает отчет о каждой фазе теста в файл сразу после нее,
+    поэтому отчеты завершенных тестов сохраняются и при аварийном завершении воркера.
+    """
+
+    def __init__(self, config, path: Path):
+        self.config = config
+        self.path = Path(path)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+
+def combined_exit_code(codes: Iterable[int]) -> int:
+    """
+    Код завершения запуска по кодам воркеров: 0, если все воркеры успешны или не нашли тестов (5).
+    """
+    codes = [code for code in codes if code not in (0, 5)]
+    return max(codes) if codes else 0
+
+
+def _summary_line(log_path: Path) -> str:
+    lines = [line.strip("= \n") for line in log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+             if line.startswith("=")]
+    return lines[-1] if lines else ""
@@ -0,0 +1,339 @@
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.pages.base_page import BasePage
+from src.pages.form_context import FormContext
+from src.pages.login_page import LoginPage
+from src.pages.main_page import MainPage
+from src.config.config import config
+from src.pages.schedule_page import SchedulePage
+from src.utils.logger_utils import logger
+from src.utils.wait_engine import WaitEngine
+
+PAGE_CLASSES = (BasePage, FormContext, LoginPage, MainPage, SchedulePage)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+class _Frame:
+    """
+    Вызов метода страницы на стеке профилировщика.
+    """
+    __slots__ = ("name", "started", "children", "round_trips", "wait")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.children = 0.0
+        self.round_trips = 0
+        self.wait = 0.0
+
+
+class StepProfiler:
+    """
+    Профилировщик шагов page object.
+
+    После install() оборачивает публичные методы классов страниц, WebDriver.execute
+    (каждая команда драйвера - одно обращение к chromedriver) и ожидания WaitEngine.
+    Для каждого метода собираются время выполнения (полное и собственное, без вложенных
+    методов страниц), число обращений к драйверу и время ожиданий. По итогам строится отчет
+    о горячих путях: методы и цепочки вызовов, ранжированные по суммарному времени, с перцентилями.
+    """
+
+    WAIT_METHODS = ("until", "until_true")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._steps: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        self._paths: Dict[str, List[float]] = defaultdict(list)
+        self._commands: Dict[str, List[float]] = defaultdict(list)
+        self._patches = []
+
+    @property
+    def installed(self) -> bool:
+        return bool(self._patches)
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _patch(self, owner, name: str, wrapper) -> None:
+        self._patches.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, wrapper)
+
+    def install(self, page_classes: Iterable[type] = PAGE_CLASSES) -> "StepProfiler":
+        """
+        Подключает профилировщик к классам страниц, WebDriver и WaitEngine.
+        """
+        if self.installed:
+            return self
+
+        for page_class in page_classes:
+            for name, member in list(vars(page_class).items()):
+                if name.startswith("_") or not inspect.isfunction(member):
+                    continue
+                self._patch(page_class, name, self._wrap_step(f"{page_class.__name__}.{name}", member))
+
+        self._patch(WebDriver, "execute", self._wrap_command(WebDriver.execute))
+        for name in self.WAIT_METHODS:
+            self._patch(WaitEngine, name, self._wrap_wait(vars(WaitEngine)[name]))
+        return self
+
+    def uninstall(self) -> None:
+        """
+        Восстанавливает исходные методы.
+        """
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            setattr(owner, name, original)
+
+    def _wrap_step(self, name: str, func):
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = profiler._stack()
+            frame = _Frame(name)
+            stack.append(frame)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack.pop()
+                elapsed = time.perf_counter() - frame.started
+                path = " > ".join([item.name for item in stack] + [name])
+                if stack:
+                    parent = stack[-1]
+                    parent.children += elapsed
+                    parent.round_trips += frame.round_trips
+                    parent.wait += frame.wait
+                with profiler._lock:
+                    step = profiler._steps[name]
+                    step["wall"].append(elapsed)
+                    step["self"].append(elapsed - frame.children)
+                    step["round_trips"].append(frame.round_trips)
+                    step["wait"].append(frame.wait)
+                    profiler._paths[path].append(elapsed)
+
+        return wrapper
+
+    def _wrap_command(self, func):
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(driver, driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return func(driver, driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - started
+                stack = profiler._stack()
+                if stack:
+                    stack[-1].round_trips += 1
+                with profiler._lock:
+                    profiler._commands[driver_command].append(elapsed)
+
+        return wrapper
+
+    def _wrap_wait(self, func):
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack = profiler._stack()
+                if stack:
+                    stack[-1].wait += time.perf_counter() - started
+
+        return wrapper
+
+    def samples(self) -> Dict[str, List[float]]:
+        """
+        Длительности всех вызовов каждого метода страниц (для истории запусков).
+        """
+        with self._lock:
+            return {name: list(step["wall"]) for name, step in self._steps.items()}
+
+    @staticmethod
+    def _summary(values: List[float]) -> dict:
+        return {
+            "count": len(values),
+            "total": round(sum(values), 6),
+            "p50": round(percentile(values, 50), 6),
+            "p95": round(percentile(values, 95), 6),
+            "max": round(max(values, default=0.0), 6),
+        }
+
+    def report_data(self) -> dict:
+        """
+        Отчет в виде словаря: методы страниц, цепочки вызовов и команды драйвера,
+        отсортированные по суммарному времени.
+        """
+        with self._lock:
+            steps = {name: {key: list(values) for key, values in step.items()} for name, step in self._steps.items()}
+            paths = {path: list(values) for path, values in self._paths.items()}
+            commands = {name: list(values) for name, values in self._commands.items()}
+
+        step_rows = []
+        for name, step in steps.items():
+            row = {"name": name, **self._summary(step["wall"])}
+            row["self_total"] = round(sum(step["self"]), 6)
+            row["round_trips"] = sum(step["round_trips"])
+            row["round_trips_p95"] = percentile(step["round_trips"], 95)
+            row["wait_total"] = round(sum(step["wait"]), 6)
+            step_rows.append(row)
+
+        def ranked(rows):
+            return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+        return {
+            "steps": ranked(step_rows),
+            "paths": ranked({"path": path, **self._summary(values)} for path, values in paths.items()),
+            "commands": ranked({"command": name, **self._summary(values)} for name, values in commands.items()),
+        }
+
+    def report_text(self, top: int = 20) -> str:
+        """
+        Текстовая таблица горячих путей.
+        """
+        data = self.report_data()
+        lines = [f"Методы страниц (топ {min(top, len(data['steps']))} по суммарному времени):",
+                 f"{'total, s':>9} {'self, s':>8} {'calls':>6} {'p50, s':>7} {'p95, s':>7} {'max, s':>7} "
+                 f"{'trips':>6} {'wait, s':>8}  method"]
+        for row in data["steps"][:top]:
+            lines.append(f"{row['total']:>9.2f} {row['self_total']:>8.2f} {row['count']:>6} {row['p50']:>7.3f} "
+                         f"{row['p95']:>7.3f} {row['max']:>7.3f} {row['round_trips']:>6} {row['wait_total']:>8.2f}"
+                         f"  {row['name']}")
+
+        lines += ["", f"Цепочки вызовов (топ {min(top, len(data['paths']))}):",
+                  f"{'total, s':>9} {'calls':>6} {'p95, s':>7}  path"]
+        for row in data["paths"][:top]:
+            lines.append(f"{row['total']:>9.2f} {row['count']:>6} {row['p95']:>7.2f}  {row['path']}")
+
+        lines += ["", "Команды драйвера:", f"{'total, s':>9} {'calls':>6} {'p50, s':>7} {'p95, s':>7}  command"]
+        for row in data["commands"]:
+            lines.append(f"{row['total']:>9.2f} {row['count']:>6} {row['p50']:>7.3f} {row['p95']:>7.3f}"
+                         f"  {row['command']}")
+        return "\n".join(lines)
+
+    def write(self, directory, name: str = "step_profile") -> Optional[Path]:
+        """
+        Сохраняет отчет в directory/<name>.json и directory/<name>.txt. Возвращает путь к JSON
+        или None, если шаги не выполнялись.
+        """
+        data = self.report_data()
+        if not data["steps"] and not data["commands"]:
+            return None
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / f"{name}.json"
+        json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        (directory / f"{name}.txt").write_text(self.report_text(), encoding="utf-8")
+        logger.info(f"Профиль шагов сохранен в {json_path}")
+        return json_path
+
+
+class StepHistory:
+    """
+    История времени методов страниц по запускам: {метод: [{"recorded_at", "count", "p50", "p95"}, ...]},
+    для каждого метода - последние max_runs запусков, в которых он выполнялся. По ней отчет показывает,
+    как изменились перцентили методов относительно прошлого запуска.
+    """
+
+    def __init__(self, path: Path, max_runs: Optional[int] = None):
+        """
+        Args:
+            path: файл истории (JSON)
+            max_runs: число хранимых запусков на метод (по умолчанию config.STEP_HISTORY_RUNS)
+        """
+        self.path = Path(path)
+        self.max_runs = config.STEP_HISTORY_RUNS if max_runs is None else max_runs
+        self.runs: Dict[str, List[dict]] = {}
+        if self.path.exists():
+            try:
+                self.runs = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logger.warning(f"Файл истории профиля шагов {self.path} поврежден и будет перезаписан")
+
+    @staticmethod
+    def _summary(values: List[float]) -> dict:
+        return {"count": len(values), "p50": round(percentile(values, 50), 6), "p95": round(percentile(values, 95), 6)}
+
+    def compare(self, samples: Dict[str, List[float]]) -> List[dict]:
+        """
+        Перцентили методов в замерах samples и в прошлом запуске, по убыванию изменения p95.
+        Методы без истории - в конце (previous None).
+        """
+        rows = []
+        for name, values in samples.items():
+            if not values:
+                continue
+            previous = self.runs.get(name, [None])[-1]
+            row = {"name": name, "previous": previous, **self._summary(values)}
+            row["delta_p95"] = round(row["p95"] - previous["p95"], 6) if previous else None
+            rows.append(row)
+        return sorted(rows, key=lambda row: (row["previous"] is None, -abs(row["delta_p95"] or 0.0)))
+
+    def add_run(self, samples: Dict[str, List[float]]) -> None:
+        """
+        Добавляет в историю перцентили методов запуска.
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for name, values in samples.items():
+            if values:
+                runs = self.runs.setdefault(name, [])
+                runs.append(dict(self._summary(values), recorded_at=recorded_at))
+                del runs[:-self.max_runs]
+
+    def save(self) -> None:
+        """
+        Атомарно записывает историю.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.runs, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def report_text(rows: List[dict], top: int = 20) -> str:
+        """
+        Текстовая таблица изменения перцентилей методов относительно прошлого запуска.
+        """
+        lines = [f"Изменение методов страниц относительно прошлого запуска (топ {min(top, len(rows))} по изменению p95):",
+                 f"{'p50 было':>9} {'p50':>7} {'p95 было':>9} {'p95':>7} {'изм. p95':>9} {'изм., %':>8}  method"]
+        for row in rows[:top]:
+            previous = row["previous"]
+            if previous is None:
+                lines.append(f"{'-':>9} {row['p50']:>7.3f} {'-':>9} {row['p95']:>7.3f} {'-':>9} {'-':>8}"
+                             f"  {row['name']} (новый)")
+                continue
+            change = f"{row['delta_p95'] / previous['p95'] * 100:+.0f}" if previous["p95"] else "-"
+            lines.append(f"{previous['p50']:>9.3f} {row['p50']:>7.3f} {previous['p95']:>9.3f} {row['p95']:>7.3f} "
+                         f"{row['delta_p95']:>+9.3f} {change:>8}  {row['name']}")
+        return "\n".join(lines)
@@ -0,0 +1,214 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+import allure
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.config.config import config
+from src.pages.login_page import LoginPage
+from src.utils.driver_factory import create_driver
+from src.utils.logger_utils import logger
+from src.utils.wait_engine import WaitEngine
+
+
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Время истечения JWT (claim exp, unix-время) или None, если токен не JWT или exp не задан.
+    Подпись не проверяется: срок нужен только для своевременного обновления токена.
+    """
+    if not token:
+        return None
+
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenService:
+    """
+    Токен авторизации (cookie token_global), общий для клиентов API и браузеров.
+
+    Токен берется из памяти, затем из кэша на диске, затем из GLOBAL_TOKEN. Если до истечения
+    токена осталось меньше refresh_margin секунд, выполняется один вход через LoginPage в
+    безголовом браузере, и новый токен записывается в кэш. Файл кэша свой для каждой учетной
+    записи и адреса API: после смены учетных данных токен другой учетной записи не используется.
+    Без учетных данных токен не обновляется: используется исходный токен, о чем предупреждение
+    выводится один раз. Кэш обновляется под файловой
+    блокировкой, поэтому воркеры xdist входят не больше одного раза за время жизни токена:
+    остальные воркеры дожидаются блокировки и читают уже обновленный токен.
+    """
+
+    def __init__(self, email: str, password: str, initial_token: Optional[str] = None,
+                 cache_path: Optional[str] = None, refresh_margin: Optional[int] = None,
+                 lock_timeout: Optional[int] = None,
+                 driver_factory: Callable[[], WebDriver] = partial(create_driver, "headless")):
+        """
+        Args:
+            email: email для входа через форму при обновлении токена
+            password: пароль для входа через форму
+            initial_token: исходный токен (GLOBAL_TOKEN), используется, пока не истекает
+            cache_path: файл кэша токена (по умолчанию - файл учетной записи в config.TOKEN_CACHE_DIR)
+            refresh_margin: за сколько секунд до истечения токен обновляется
+            lock_timeout: время ожидания блокировки кэша, секунд; более старая блокировка считается брошенной
+            driver_factory: функция, создающая браузер для входа
+        """
+        self.email = email
+        self.password = password
+        self.cache_path = Path(cache_path) if cache_path else self.default_cache_path(email)
+        self.lock_path = self.cache_path.with_name(self.cache_path.name + ".lock")
+        self.refresh_margin = config.TOKEN_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self.lock_timeout = config.TOKEN_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+        self._driver_factory = driver_factory
+        self._initial_token = initial_token
+        self._token: Optional[str] = None
+        self._lock = threading.Lock()
+        # Без учетных данных обновить токен нельзя: исходный токен используется без повторных попыток
+        self._refresh_impossible = False
+        self.logins = 0
+
+    @staticmethod
+    def default_cache_path(email: Optional[str]) -> Path:
+        """
+        Файл кэша токена учетной записи email для текущего адреса API.
+        """
+        account_key = hashlib.sha1(f"{email or ''}|{config.API_URL}".encode("utf-8")).hexdigest()[:12]
+        return Path(config.TOKEN_CACHE_DIR) / f"token-{account_key}.json"
+
+    def is_fresh(self, token: Optional[str]) -> bool:
+        """
+        Токен задан и не истекает в ближайшие refresh_margin секунд. Токен без exp считается свежим.
+        """
+        if not token:
+            return False
+        expiry = jwt_expiry(token)
+        return expiry is None or expiry - time.time() > self.refresh_margin
+
+    def get_token(self) -> Optional[str]:
+        """
+        Возвращает актуальный токен, при необходимости обновляя его.
+        Вызов дешевый, пока токен в памяти не истекает, поэтому его можно передавать как источник токена.
+        """
+        token = self._token
+        if self._refresh_impossible or self.is_fresh(token):
+            return token
+
+        with self._lock:
+            if self.is_fresh(self._token):
+                return self._token
+
+            for candidate in (self._read_cache(), self._initial_token):
+                if self.is_fresh(candidate):
+                    self._token = candidate
+                    return candidate
+
+            self._token = self._refresh()
+            return self._token
+
+    def remember(self, token: str) -> None:
+        """
+        Сохраняет токен, полученный в обход сервиса (например, при входе браузера через форму).
+        """
+        with self._lock:
+            self._token = token
+            with self._file_lock():
+                self._write_cache(token)
+
+    def _refresh(self) -> Optional[str]:
+        if not (self.email and self.password):
+            logger.warning("Токен истекает, но учетные данные для входа не заданы: используется исходный токен")
+            self._refresh_impossible = True
+            return self._initial_token
+
+        with self._file_lock():
+            # Пока ожидали блокировку, токен мог обновить другой воркер
+            cached = self._read_cache()
+            if self.is_fresh(cached):
+                return cached
+
+            token = self._login()
+            self._write_cache(token)
+            return token
+
+    @allure.step("Обновление токена авторизации через форму входа")
+    def _login(self) -> str:
+        driver = self._driver_factory()
+        try:
+            LoginPage(driver).login(self.email, self.password)
+            cookie = WaitEngine(driver).until_true(
+                lambda: driver.get_cookie(config.AUTH_COOKIE_NAME), "auth cookie",
+                message=f"Cookie {config.AUTH_COOKIE_NAME} не получена после входа")
+        finally:
+            driver.quit()
+
+        self.logins += 1
+        token = cookie["value"]
+        expiry = jwt_expiry(token)
+        logger.info("Токен авторизации обновлен" + (
+            f", действует до {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(expiry))}" if expiry else ""))
+        return token
+
+    def _read_cache(self) -> Optional[str]:
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf-8")).get("token")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_cache(self, token: str) -> None:
+        """
+        Атомарно записывает токен в кэш, доступный только владельцу.
+        """
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"token": token, "exp": jwt_expiry(token)}, file)
+        os.replace(temp_path, self.cache_path)
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        Межпроцессная блокировка кэша через создание файла блокировки (O_CREAT | O_EXCL).
+        """
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                try:
+                    age = time.time() - self.lock_path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if age > self.lock_timeout:
+                    logger.warning(f"Брошенная блокировка {self.lock_path} удалена")
+                    self.lock_path.unlink(missing_ok=True)
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Не дождались блокировки кэша токена {self.lock_path}")
+                time.sleep(0.2)
+                continue
+
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            break
+
+        try:
+            yield
+        finally:
+            self.lock_path.unlink(missing_ok=True)
@@ -0,0 +1,447 @@
+import threading
+import time
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as ec
+
+from src.utils.logger_utils import logger
+
+Locator = Union[Tuple[str, str], WebElement]
+
+
+class WaitStats:
+    """
+    Гистограммы времени ожиданий по локаторам.
+
+    Для каждого ключа (условие и локатор) считаются число ожиданий, суммарное и максимальное время,
+    число таймаутов и распределение по корзинам BUCKETS (верхние границы в секундах).
+    """
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __len__(self):
+        return len(self._stats)
+
+    def record(self, key: str, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "count": 0, "total": 0.0, "max": 0.0, "timeouts": 0, "histogram": [0] * (len(self.BUCKETS) + 1)
+                }
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["timeouts"] += timed_out
+            stats["histogram"][bisect_left(self.BUCKETS, seconds)] += 1
+
+    def percentile(self, key: str, percent: float) -> float:
+        """
+        Оценка перцентиля по гистограмме: верхняя граница корзины (для последней - максимум).
+        """
+        with self._lock:
+            stats = self._stats[key]
+            rank = stats["count"] * percent / 100
+            seen = 0
+            for index, count in enumerate(stats["histogram"]):
+                seen += count
+                if seen >= rank and count:
+                    return min(self.BUCKETS[index], stats["max"]) if index < len(self.BUCKETS) else stats["max"]
+            return stats["max"]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: dict(stats, histogram=list(stats["histogram"])) for key, stats in self._stats.items()}
+
+    def report(self, top: int = 15) -> str:
+        """
+        Таблица ожиданий, занявших больше всего времени.
+        """
+        stats = sorted(self.snapshot().items(), key=lambda item: item[1]["total"], reverse=True)[:top]
+        lines = [f"Ожидания элементов (топ {len(stats)} по суммарному времени):",
+                 f"{'total, s':>9} {'count':>6} {'p50, s':>7} {'p95, s':>7} {'max, s':>7} {'timeouts':>8}  locator"]
+        for key, item in stats:
+            lines.append(f"{item['total']:>9.2f} {item['count']:>6} {self.percentile(key, 50):>7.2f} "
+                         f"{self.percentile(key, 95):>7.2f} {item['max']:>7.2f} {item['timeouts']:>8}  {key}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# Статистика всех ожиданий процесса
+wait_stats = WaitStats()
+
+
+class WaitEngine:
+    """
+    Ожидание состояний элементов с проверкой условия в браузере.
+
+    Условие проверяется скриптом execute_async_script, который подписывается на изменения DOM
+    (MutationObserver, плюс частая перепроверка для CSS-переходов без изменений DOM) и завершается,
+    как только условие выполнено, без фиксированного интервала опроса. Результат подтверждается
+    соответствующим expected_condition Selenium, поэтому семантика ожиданий та же, что у WebDriverWait.
+    Если скрипт неприменим (локатор по тексту ссылки, ошибка скрипта, переход на другую страницу),
+    используется опрос с интервалом, растущим от MIN_POLL до MAX_POLL.
+
+    first_of ожидает одновременно несколько взаимоисключающих состояний страницы одним скриптом
+    и возвращает первое наступившее, поэтому отрицательный результат не требует ожидания таймаута.
+    """
+
+    CONDITIONS = {
+        "present": (ec.presence_of_element_located, None),
+        "present_all": (ec.presence_of_all_elements_located, None),
+        "visible": (ec.visibility_of_element_located, ec.visibility_of),
+        "clickable": (ec.element_to_be_clickable, ec.element_to_be_clickable),
+        "invisible": (ec.invisibility_of_element_located, ec.invisibility_of_element),
+    }
+
+    # Максимальная длительность одного вызова скрипта, после которой условие перепроверяется из Python
+    SCRIPT_SLICE = 1.0
+    MIN_POLL = 0.05
+    MAX_POLL = 0.5
+
+    # Общие функции скриптов ожидания: поиск элементов, проверка условия и подписка на изменения DOM.
+    # observe вызывает done с первым отличным от null результатом check или с null по таймауту.
+    SCRIPT_FUNCTIONS = """
+        function find(using, value, target) {
+            if (target) {
+                return target.isConnected ? [target] : [];
+            }
+            if (using === 'xpath') {
+                var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) {
+                    nodes.push(snapshot.snapshotItem(i));
+                }
+                return nodes;
+            }
+            return Array.from(document.querySelectorAll(value));
+        }
+
+        function visible(element) {
+            return element.getClientRects().length > 0 && getComputedStyle(element).visibility !== 'hidden';
+        }
+
+        function matches(elements, condition) {
+            var element = elements[0];
+            switch (condition) {
+                case 'present': return element || null;
+                case 'present_all': return elements.length ? elements : null;
+                case 'visible': return element && visible(element) ? element : null;
+                case 'clickable': return element && visible(element) && !element.disabled ? element : null;
+                case 'invisible': return !element || !visible(element) ? true : null;
+            }
+            return null;
+        }
+
+        function observe(check, timeout, done) {
+            var result = check();
+            if (result !== null) {
+                done(result);
+                return;
+            }
+
+            var finished = false, observer, ticker, timer;
+            function finish(value) {
+                if (finished) {
+                    return;
+                }
+                finished = true;
+                observer.disconnect();
+                clearInterval(ticker);
+                clearTimeout(timer);
+                done(value);
+            }
+            function recheck() {
+                var value = check();
+                if (value !== null) {
+                    finish(value);
+                }
+            }
+
+            observer = new MutationObserver(recheck);
+            observer.observe(document.documentElement,
+                             {childList: true, subtree: true, attributes: true, characterData: true});
+            ticker = setInterval(recheck, 100);
+            timer = setTimeout(function () { finish(null); }, timeout);
+        }
+    """
+
+    WAIT_SCRIPT = SCRIPT_FUNCTIONS + """
+        var using = arguments[0], value = arguments[1], target = arguments[2], condition = arguments[3],
+            timeout = arguments[4], done = arguments[arguments.length - 1];
+
+        observe(function () { return matches(find(using, value, target), condition); }, timeout, done);
+    """
+
+    # Гонка состояний: [[using, value], ...] проверяются по порядку, результат - [индекс, элемент]
+    # первого состояния, для которого выполнено условие хотя бы для одного найденного элемента
+    FIRST_SCRIPT = SCRIPT_FUNCTIONS + """
+        var locators = arguments[0], condition = arguments[1], timeout = arguments[2],
+            done = arguments[arguments.length - 1];
+
+        function anyMatch(elements, condition) {
+            for (var i = 0; i < elements.length; i++) {
+                var element = matches([elements[i]], condition);
+                if (element !== null) {
+                    return element;
+                }
+            }
+            return null;
+        }
+
+        observe(function () {
+            for (var i = 0; i < locators.length; i++) {
+                var element = anyMatch(find(locators[i][0], locators[i][1], null), condition);
+                if (element !== null) {
+                    return [i, element];
+                }
+            }
+            return null;
+        }, timeout, done);
+    """
+
+    def __init__(self, driver, stats: Optional[WaitStats] = None):
+        self.driver = driver
+        self.stats = stats or wait_stats
+
+    @staticmethod
+    def describe(locator: Locator) -> str:
+        """
+        Ключ локатора в статистике ожиданий.
+        """
+        if isinstance(locator, WebElement):
+            return "WebElement"
+        by, value = locator
+        return f"{by}=" + " ".join(value.split())
+
+    @staticmethod
+    def _script_locator(locator: Locator) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        Локатор для скрипта ожидания: (xpath или css, выражение). None - скрипт неприменим.
+        """
+        if isinstance(locator, WebElement):
+            return None, None
+
+        by, value = locator
+        if by == By.XPATH:
+            return "xpath", value
+        if by == By.CSS_SELECTOR:
+            return "css", value
+        # Так же, как Selenium преобразует эти стратегии в CSS
+        if by == By.ID:
+            return "css", f'[id="{value}"]'
+        if by == By.NAME:
+            return "css", f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return "css", f".{value}"
+        if by == By.TAG_NAME:
+            return "css", value
+        return None
+
+    def _check(self, locator: Locator, condition: str) -> Any:
+        by_locator, by_element = self.CONDITIONS[condition]
+        expected = by_element(locator) if isinstance(locator, WebElement) else by_locator(locator)
+        try:
+            return expected(self.driver)
+        except NoSuchElementException:
+            return False
+
+    def _check_any(self, locator: Locator, condition: str) -> Any:
+        """
+        Условие для найденного элемента или для любого из элементов локатора.
+        """
+        if isinstance(locator, WebElement) or self.CONDITIONS[condition][1] is None:
+            return self._check(locator, condition)
+        for element in self.driver.find_elements(*locator):
+            try:
+                result = self._check(element, condition)
+            except StaleElementReferenceException:
+                continue
+            if result:
+                return result
+        return False
+
+    def _wait_in_browser(self, script_locator, locator: Locator, condition: str, timeout: float) -> Any:
+        using, value = script_locator
+        target = locator if isinstance(locator, WebElement) else None
+        return self.driver.execute_async_script(self.WAIT_SCRIPT, using, value, target, condition, int(timeout * 1000))
+
+    def until(self, locator: Locator, condition: str, timeout: float = 10, message: str = "") -> Any:
+        """
+        Ждет выполнения условия для элемента.
+
+        Args:
+            locator: кортеж (By, значение) или найденный ранее WebElement
+            condition: present, present_all, visible, clickable или invisible
+            timeout: время ожидания в секундах
+            message: сообщение исключения по таймауту
+
+        Returns:
+            Элемент (список элементов для present_all, True для invisible).
+
+        Raises:
+            TimeoutException: условие не выполнено за timeout секунд
+        """
+        if condition not in self.CONDITIONS:
+            raise ValueError(f"Неизвестное условие ожидания '{condition}'. Доступные: {', '.join(self.CONDITIONS)}")
+        if isinstance(locator, WebElement) and self.CONDITIONS[condition][1] is None:
+            raise ValueError(f"Условие '{condition}' ожидается только по локатору")
+
+        key = f"{condition} {self.describe(locator)}"
+        started = time.monotonic()
+        deadline = started + timeout
+        script_locator = self._script_locator(locator)
+        interval = self.MIN_POLL
+
+        while True:
+            hint = None
+            remaining = deadline - time.monotonic()
+            if script_locator is not None and remaining > 0:
+                try:
+                    hint = self._wait_in_browser(script_locator, locator, condition, min(remaining, self.SCRIPT_SLICE))
+                except StaleElementReferenceException:
+                    if condition != "invisible":
+                        raise
+                    hint = True
+                except WebDriverException as e:
+                    logger.debug(f"Ожидание {key} в браузере недоступно, переход на опрос: {e.msg}")
+                    script_locator = None
+
+                if hint and condition in ("present", "present_all"):
+                    self.stats.record(key, time.monotonic() - started)
+                    return hint
+
+            # Найденный скриптом элемент проверяется напрямую, без повторного поиска по локатору
+            result = self._check(hint if isinstance(hint, WebElement) else locator, condition)
+            if result:
+                self.stats.record(key, time.monotonic() - started)
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.stats.record(key, time.monotonic() - started, timed_out=True)
+                raise TimeoutException(message or f"Не дождались условия {key} за {timeout} секунд")
+
+            # Опрос, если скрипт неприменим или его оценка расходится с проверкой Selenium
+            if script_locator is None or hint:
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 1.5, self.MAX_POLL)
+
+    def first_of(self, states: Dict[str, Tuple[str, str]], condition: str = "visible", timeout: float = 10,
+                 message: str = "") -> Tuple[str, Any]:
+        """
+        Ждет первое из взаимоисключающих состояний страницы: все локаторы проверяются одновременно
+        одним скриптом в браузере, и ожидание завершается, как только выполнено условие для любого из них.
+        Состояние наступило, если условие выполнено хотя бы для одного найденного по локатору элемента
+        (скрытый первый элемент не мешает). При одновременном выполнении побеждает состояние, указанное раньше.
+
+        Args:
+            states: локаторы (By, значение) по именам состояний
+            condition: present, visible или clickable
+            timeout: время ожидания в секундах
+            message: сообщение исключения по таймауту
+
+        Returns:
+            Имя состояния и найденный элемент.
+
+        Raises:
+            TimeoutException: ни одно из состояний не наступило за timeout секунд
+        """
+        if condition not in ("present", "visible", "clickable"):
+            raise ValueError(f"Условие '{condition}' не поддерживается для гонки состояний")
+
+        names = list(states)
+        key = f"first {condition} " + " | ".join(names)
+        started = time.monotonic()
+        deadline = started + timeout
+        script_locators = [self._script_locator(states[name]) for name in names]
+        use_script = None not in script_locators
+        interval = self.MIN_POLL
+
+        while True:
+            hint = None
+            remaining = deadline - time.monotonic()
+            if use_script and remaining > 0:
+                try:
+                    hint = self.driver.execute_async_script(self.FIRST_SCRIPT, script_locators, condition,
+                                                            int(min(remaining, self.SCRIPT_SLICE) * 1000))
+                except WebDriverException as e:
+                    logger.debug(f"Ожидание {key} в браузере недоступно, переход на опрос: {e.msg}")
+                    use_script = False
+
+            if hint and condition == "present":
+                self.stats.record(key, time.monotonic() - started)
+                return names[hint[0]], hint[1]
+
+            # Состояние, найденное скриптом, подтверждается проверкой Selenium; при опросе проверяются все
+            if hint:
+                candidates = [(names[hint[0]], hint[1])]
+            elif not use_script:
+                candidates = [(name, states[name]) for name in names]
+            else:
+                candidates = []
+            for name, locator in candidates:
+                try:
+                    result = self._check_any(locator, condition)
+                except StaleElementReferenceException:
+                    result = None
+                if result:
+                    self.stats.record(key, time.monotonic() - started)
+                    return name, result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.stats.record(key, time.monotonic() - started, timed_out=True)
+                raise TimeoutException(message or f"Не дождались ни одного из состояний {key} за {timeout} секунд")
+
+            if not use_script or hint:
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 1.5, self.MAX_POLL)
+
+    def until_true(self, predicate: Callable[[], Any], name: str, timeout: float = 10, message: str = "") -> Any:
+        """
+        Ждет, пока predicate вернет истинное значение, опрашивая его с растущим интервалом.
+
+        Args:
+            predicate: функция без аргументов
+            name: ключ ожидания в статистике
+            timeout: время ожидания в секундах
+            message: сообщение исключения по таймауту
+
+        Raises:
+            TimeoutException: условие не выполнено за timeout секунд
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = self.MIN_POLL
+
+        while True:
+            result = predicate()
+            if result:
+                self.stats.record(name, time.monotonic() - started)
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.stats.record(name, time.monotonic() - started, timed_out=True)
+                raise TimeoutException(message or f"Не дождались условия {name} за {timeout} секунд")
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, self.MAX_POLL)
@@ -1,93 +1,504 @@
+import json
 import os
+
 import pytest
-import allure
 import requests
 
-from selenium import webdriver
+from functools import partial
+from pathlib import Path
+from typing import List, Optional
+
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.data.test_data import TestData
+from src.data.slot_allocator import EventSlot, SlotAllocator, current_worker
 from src.api.api_client import ApiClient
-from src.pages.login_page import LoginPage
+from src.api.async_api_client import AsyncApiClient
+from src.api.event_manager import PersonalEventManager, PreparedEvent
+from src.api.models import CreatedEvent
+from src.api.schedule_reader import ScheduleReader
+from src.api.retry import RetryPolicy, retry_metrics, shared_rate_limiter
+from src.api.cassette import Cassette, mount_cassette
+from src.config.config import config as settings
+from src.pages.schedule_page import SchedulePage
+from src.stubs.schedule_api import ScheduleApiServer
 from src.utils.logger_utils import logger
+from src.utils.browser_pool import AuthorizedBrowserPool
+from src.utils.driver_factory import PROFILES, DEFAULT_PROFILE, create_driver
+from src.utils.failure_artifacts import FailureArtifacts
+from src.utils.sharding import (
+    DurationStore,
+    ShardReportWriter,
+    ShardRunner,
+    combined_exit_code,
+    item_kind,
+    plan_shards,
+    worker_counts
+)
+from src.utils.step_profiler import StepHistory, StepProfiler
+from src.utils.token_service import TokenService
+from src.utils.wait_engine import wait_stats
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--driver-profile",
+        action="store",
+        default=DEFAULT_PROFILE,
+        choices=sorted(PROFILES),
+        help="Профиль браузера для UI-тестов (переопределяется маркером driver_profile)"
+    )
+    parser.addoption(
+        "--fill-mode",
+        action="store",
+        default="typing",
+        choices=SchedulePage.FILL_MODES,
+        help="Режим заполнения форм UI-тестов: посимвольный ввод или один скрипт (переопределяется маркером fill_mode)"
+    )
+    parser.addoption(
+        "--api-cassette",
+        action="store",
+        default="off",
+        choices=("off", "record", "replay", "strict"),
+        help="Запись ответов API в кассету или их воспроизведение (strict - ошибка на незаписанный запрос)"
+    )
+    parser.addoption(
+        "--api-cassette-path",
+        action="store",
+        default="tests/cassettes/api.json.gz",
+        help="Путь к файлу кассеты API"
+    )
+    parser.addoption(
+        "--fake-api",
+        action="store_true",
+        default=False,
+        help="Запустить локальную замену API расписания и направить на нее клиентов API"
+    )
+    parser.addoption(
+        "--profile-steps",
+        action="store_true",
+        default=False,
+        help="Профилировать методы страниц и команды драйвера, отчет о горячих путях по итогам сессии"
+    )
+    parser.addoption(
+        "--profile-steps-dir",
+        action="store",
+        default="step-profile",
+        help="Каталог отчетов профилировщика шагов"
+    )
+    parser.addoption(
+        "--shards",
+        action="store",
+        default=None,
+        help="Число процессов-воркеров или auto (по числу ядер); тесты распределяются по длительностям прошлых запусков"
+    )
+    parser.addoption(
+        "--browser-ram-mb",
+        action="store",
+        type=float,
+        default=settings.BROWSER_WORKER_RAM_MB,
+        help="Оценка памяти на один воркер с браузером, МБ: ограничивает число воркеров для UI-тестов"
+    )
+    parser.addoption(
+        "--shard-plan",
+        action="store",
+        default=None,
+        help="Служебная: файл плана воркера, создается при запуске с --shards"
+    )
+
+
+def pytest_configure(config):
+    """
+    Запускает локальную замену API расписания до создания клиентов API (опция --fake-api)
+    и подключает профилировщик шагов (опция --profile-steps).
+    """
+    if config.getoption("--fake-api"):
+        config.fake_api_server = ScheduleApiServer().start()
+        _set_api_url(config.fake_api_server.api_url)
+
+    if config.getoption("--profile-steps"):
+        config.step_profiler = StepProfiler().install()
+
+    config.failure_artifacts = FailureArtifacts(settings.FAILURE_ARTIFACTS_MAX_BYTES)
+
+    # Длительности тестов этого запуска: nodeid -> {"kind", "seconds"}
+    config.test_durations = {}
+    plan_path = config.getoption("--shard-plan")
+    config.shard_plan = json.loads(Path(plan_path).read_text(encoding="utf-8")) if plan_path else None
+    if config.shard_plan is not None:
+        config.pluginmanager.register(ShardReportWriter(config, config.shard_plan["reports"]), "shard_reports")
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "fake_api_server", None)
+    if server is not None:
+        server.stop()
+
+    profiler = getattr(config, "step_profiler", None)
+    if profiler is not None:
+        profiler.uninstall()
+
+    artifacts = getattr(config, "failure_artifacts", None)
+    if artifacts is not None:
+        artifacts.close()
+
+
+def _set_api_url(api_url: str) -> None:
+    logger.info(f"Клиенты API направлены на {api_url}")
+    settings.API_URL = api_url
+
+
+def is_replaying_api(pytest_config) -> bool:
+    """
+    Ответы API воспроизводятся из кассеты.
+    """
+    return pytest_config.getoption("--api-cassette") in ("replay", "strict")
+
+
+@pytest.fixture(scope="function")
+def driver_profile(request) -> str:
+    """
+    Имя профиля браузера для текущего теста: маркер driver_profile или опция --driver-profile.
+    """
+    marker = request.node.get_closest_marker("driver_profile")
+    if marker is not None:
+        return marker.args[0]
+    return request.config.getoption("--driver-profile")
+
+
+@pytest.fixture(scope="function")
+def fill_mode(request) -> str:
+    """
+    Режим заполнения форм для текущего теста: маркер fill_mode или опция --fill-mode.
+    """
+    marker = request.node.get_closest_marker("fill_mode")
+    if marker is not None:
+        return marker.args[0]
+    return request.config.getoption("--fill-mode")
 
 
 @pytest.fixture(scope="function")
-def browser():
-    driver = webdriver.Chrome()
-    driver.maximize_window()
+def browser(driver_profile):
+    driver = create_driver(driver_profile)
 
     yield driver
     driver.quit()
 
 
+@pytest.fixture(scope="session")
+def token_service() -> TokenService:
+    """
+    Сервис токена авторизации, общий для браузеров и клиентов API.
+    Токен обновляется через форму входа не чаще одного раза за время его жизни на весь запуск.
+    """
+    return TokenService(TestData.VALID_EMAIL, TestData.VALID_PASSWORD, initial_token=TestData.GLOBAL_TOKEN)
+
+
+@pytest.fixture(scope="session")
+def api_token(request, token_service):
+    """
+    Источник токена для клиентов API. При воспроизведении кассеты и с локальной заменой API
+    токен не проверяется, поэтому используется GLOBAL_TOKEN без обновления.
+    """
+    if is_replaying_api(request.config) or request.config.getoption("--fake-api"):
+        return TestData.GLOBAL_TOKEN
+    return token_service.get_token
+
+
+@pytest.fixture(scope="session")
+def browser_pools(token_service):
+    """
+    Пулы авторизованных браузеров по профилям, по одному пулу на профиль в каждом воркере (процессе pytest).
+    Браузер авторизуется один раз через cookie token_global и переиспользуется между тестами.
+    """
+    pools = {}
+
+    def get_pool(profile_name: str) -> AuthorizedBrowserPool:
+        if profile_name not in pools:
+            pools[profile_name] = AuthorizedBrowserPool(
+                driver_factory=partial(create_driver, profile_name),
+                token=token_service.get_token,
+                email=TestData.VALID_EMAIL,
+                password=TestData.VALID_PASSWORD,
+                remember_token=token_service.remember
+            )
+        return pools[profile_name]
+
+    yield get_pool
+
+    for pool in pools.values():
+        pool.close()
+
+
 @pytest.fixture(scope="function")
-def auth(browser):
+def auth(browser_pools, driver_profile):
     """
     Фикстура для авторизации пользователя перед тестами.
+    Выдает прогретый авторизованный браузер из пула и возвращает его в пул после теста.
+    """
+    pool = browser_pools(driver_profile)
+    driver = pool.acquire()
+
+    yield driver
+    pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def api_cassette(request) -> Optional[Cassette]:
+    """
+    Кассета API сессии (опция --api-cassette). None, если запись и воспроизведение выключены.
+    В режиме записи кассета сохраняется после завершения всех тестов и очистки данных;
+    воркер запуска с --shards записывает собственную кассету, их объединяет pytest_runtestloop.
+    """
+    mode = request.config.getoption("--api-cassette")
+    if mode == "off":
+        yield None
+        return
+
+    cassette_path = api_cassette_path(request.config)
+    if mode == "record" and request.config.shard_plan is not None:
+        cassette_path = Path(request.config.shard_plan["cassette"])
+    cassette = Cassette(cassette_path)
+    if mode != "record":
+        cassette.load()
+
+    yield cassette
+
+    if mode == "record":
+        cassette.save()
+
+
+def api_cassette_path(pytest_config) -> Path:
+    return pytest_config.rootpath / pytest_config.getoption("--api-cassette-path")
+
+
+@pytest.fixture(autouse=True)
+def api_cassette_scope(request):
+    """
+    Помечает запросы к API текущим тестом, чтобы при воспроизведении тест получал свои ответы
+    независимо от порядка тестов.
+    """
+    if request.config.getoption("--api-cassette") == "off":
+        yield
+        return
+
+    cassette = request.getfixturevalue("api_cassette")
+    cassette.scope = request.node.nodeid
+    yield
+    cassette.scope = None
+
+
+@pytest.fixture(scope="session")
+def api_session_factory(request, api_cassette):
+    """
+    Фабрика сессий requests для клиентов API с пулом соединений и подключенной кассетой.
+    """
+    mode = request.config.getoption("--api-cassette")
+
+    def create_session(pool_maxsize: int = 10) -> requests.Session:
+        session = requests.Session()
+        if api_cassette is not None:
+            mount_cassette(session, api_cassette, mode, pool_maxsize=pool_maxsize)
+        else:
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return session
+
+    return create_session
+
+
+def create_retry_policy(rate_limited: bool = True) -> RetryPolicy:
+    """
+    Политика повторов для клиентов API тестов.
+    Редактирование и удаление событий повторяются, только если сервер их не выполнил (429, 503,
+    соединение не установлено): повтор примененного запроса отправил бы устаревший oldStartAt
+    или удалял бы уже удаленное событие.
     """
-    login_page = LoginPage(browser)
-    login_page.open()
-    login_page.login(TestData.VALID_EMAIL, TestData.VALID_PASSWORD)
-    return browser
+    return RetryPolicy(
+        retry_endpoints=(PersonalEventManager.UPDATE_ENDPOINT, PersonalEventManager.REMOVE_ENDPOINT),
+        rate_limiter=shared_rate_limiter() if rate_limited else None
+    )
 
 
 @pytest.fixture
-def authorized_api_client() -> ApiClient:
+def authorized_api_client(request, api_session_factory, api_token) -> ApiClient:
     """
     Авторизованный клиент API.
     """
 
-    session = requests.Session()
-    token = os.getenv('GLOBAL_TOKEN')
-    client = ApiClient(session=session, token=token)
+    session = api_session_factory()
+    client = ApiClient(session=session, token=api_token,
+                       retry_policy=create_retry_policy(rate_limited=not is_replaying_api(request.config)))
 
     return client
 
 
-@pytest.fixture(autouse=False)
-def make_screenshot_on_fail(request, authenticated_driver) -> None:
+@pytest.fixture
+def async_api_client(request, api_session_factory, api_token) -> AsyncApiClient:
     """
-     Фикстура для сбора отладочной информации при падении теста.
+    Авторизованный асинхронный клиент API для пачек запросов при подготовке и очистке данных.
+    """
+    client = AsyncApiClient(session=api_session_factory(pool_maxsize=10), token=api_token,
+                            retry_policy=create_retry_policy(rate_limited=not is_replaying_api(request.config)))
+
+    yield client
+    client.close()
+
 
-     Собирает:
-     - Скриншот страницы
-     - URL страницы
-     - HTML-код страницы
+def pytest_collection_modifyitems(config, items) -> None:
+    """
+    Пропускает тесты с маркером fake_api_only без --fake-api.
+    В воркере запуска с --shards оставляет только тесты из его плана.
+    """
+    if not config.getoption("--fake-api"):
+        for item in items:
+            marker = item.get_closest_marker("fake_api_only")
+            if marker is not None:
+                reason = marker.args[0] if marker.args else "контракт API не сверен с реальным API"
+                item.add_marker(pytest.mark.skip(reason=f"Только с --fake-api: {reason}"))
 
-     Args:
-         request: объект запроса теста
-         authenticated_driver: инициализированный драйвер браузера
-     """
+    if config.shard_plan is None:
+        return
+
+    planned = set(config.shard_plan["nodeids"])
+    deselected = [item for item in items if item.nodeid not in planned]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in planned]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session) -> Optional[bool]:
+    """
+    При запуске с --shards распределяет тесты по процессам-воркерам (LPT по длительностям прошлых запусков,
+    UI-тесты - только воркерам с браузером) и ждет их завершения вместо выполнения тестов в этом процессе.
+    Отчеты о тестах воркеров передаются плагинам этого процесса: итоговая строка, --junitxml и код
+    завершения учитывают все тесты. Кассеты API, записанные воркерами, объединяются в файл --api-cassette-path.
+    """
+    config = session.config
+    shards_option = config.getoption("--shards")
+    if not shards_option or config.shard_plan is not None or config.option.collectonly or not session.items:
+        return None
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        return None
+
+    if shards_option == "auto":
+        requested = os.cpu_count() or 1
+    elif shards_option.isdigit() and int(shards_option) > 0:
+        requested = int(shards_option)
+    else:
+        raise pytest.UsageError(f"--shards: ожидалось положительное число или auto, получено '{shards_option}'")
+    store = DurationStore(Path(settings.SHARD_DIR) / "durations.json")
+    tests = [(item.nodeid, item_kind(item), store.estimate(item.nodeid, item_kind(item))) for item in session.items]
+    ui_tests = sum(1 for _, kind, _ in tests if kind == "ui")
+    browser_workers, api_workers = worker_counts(requested, ui_tests, config.getoption("--browser-ram-mb"))
+    shards = plan_shards(tests, browser_workers, api_workers)
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    write = reporter.write_line if reporter is not None else logger.info
+    write(f"Воркеров: {len(shards)} (с браузером: {sum(shard.browser for shard in shards)}), "
+          f"оценка самого долгого: {max(shard.load for shard in shards):.1f} с")
+
+    runner = ShardRunner(config.invocation_params.args, Path(settings.SHARD_DIR), config.invocation_params.dir,
+                         junitxml=bool(config.option.xmlpath))
+    results = runner.run(shards)
+    for data in runner.collect_reports(results):
+        report = config.hook.pytest_report_from_serializable(config=config, data=data)
+        if report.when == "setup":
+            config.hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+        config.hook.pytest_runtest_logreport(report=report)
+        if report.when == "teardown":
+            config.hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+
+    for result in sorted(results, key=lambda result: result.shard.worker_id):
+        write(f"gw{result.shard.worker_id}: {len(result.shard.nodeids)} тестов, оценка {result.shard.load:.1f} с, "
+              f"фактически {result.seconds:.1f} с - {result.summary or f'код {result.returncode}'} "
+              f"({result.log_path})")
+
+    store.update(runner.collect_durations(results))
+    store.save()
+    if getattr(config, "step_profiler", None) is not None:
+        _update_step_history(config, runner.collect_step_samples(results))
+
+    if config.getoption("--api-cassette") == "record":
+        cassette = Cassette.merge(api_cassette_path(config),
+                                  [runner.cassette_path(f"gw{shard.worker_id}") for shard in shards])
+        cassette.save()
+        write(f"Кассета API воркеров объединена: {cassette.path} ({len(cassette)} записей)")
+
+    # Воркер, завершившийся с ошибкой без отчетов о падениях (например, аварийно), тоже проваливает запуск
+    if combined_exit_code(result.returncode for result in results) and not session.testsfailed:
+        session.testsfailed = sum(1 for result in results if result.returncode not in (0, 5))
+    return True
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    """
+    Выводит метрики повторов запросов к API и статистику ожиданий элементов по итогам сессии,
+    сохраняет отчет профилировщика шагов и длительности тестов для распределения по воркерам.
+    """
+    if retry_metrics.requests:
+        logger.info(retry_metrics.report())
+    if wait_stats:
+        logger.info(wait_stats.report())
+
+    profiler = getattr(session.config, "step_profiler", None)
+    if profiler is not None:
+        worker_id, worker_count = current_worker()
+        name = f"step_profile_gw{worker_id}" if worker_count > 1 else "step_profile"
+        profiler.write(session.config.getoption("--profile-steps-dir"), name)
+        _save_step_samples(session.config, profiler.samples())
+
+    _save_test_durations(session.config)
+
+
+def _save_step_samples(config, samples: dict) -> None:
+    """
+    Воркер записывает длительности методов страниц в файл из плана (их объединяет запуск с --shards),
+    обычный запуск дополняет историю профиля шагов сам.
+    """
+    if not samples:
+        return
+    if config.shard_plan is not None:
+        Path(config.shard_plan["steps"]).write_text(json.dumps(samples), encoding="utf-8")
+        return
+    _update_step_history(config, samples)
 
-    def fin():
-        """
-        Запускается после завершения теста.
-        Если тест завершился с ошибкой, собирает и добавляет скриншот, URL и HTML-код страницы в Allure-отчет.
-        Эта функция добавляется в список финализаторов с помощью `request.addfinalizer(fin)`.
-        """
 
-        if request.node.rep_setup.failed or request.node.rep_call.failed:
-            # Скриншот
-            allure.attach(
-                authenticated_driver.get_screenshot_as_png(),
-                name=f"Скриншот при ошибке: {request.node.name}",
-                attachment_type=allure.attachment_type.PNG)
+def _update_step_history(config, samples: dict) -> None:
+    """
+    Дополняет историю профиля шагов замерами запуска и сохраняет отчет об изменениях относительно
+    прошлого запуска в step_history.txt каталога --profile-steps-dir.
+    """
+    if not samples:
+        return
+    history = StepHistory(Path(settings.STEP_HISTORY_PATH))
+    report = StepHistory.report_text(history.compare(samples))
+    history.add_run(samples)
+    history.save()
 
-            # URL страницы на момент падения
-            allure.attach(
-                authenticated_driver.current_url,
-                name="URL страницы при сбое",
-                attachment_type=allure.attachment_type.TEXT)
+    directory = Path(config.getoption("--profile-steps-dir"))
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "step_history.txt").write_text(report, encoding="utf-8")
+    logger.info(report)
 
-            # HTML страницы
-            allure.attach(
-                authenticated_driver.page_source,
-                name="Источник страницы при сбое",
-                attachment_type=allure.attachment_type.HTML)
 
-            logger.error(f"Тест '{request.node.name}' завершился с ошибкой. Собраны скриншот, URL и HTML страницы")
+def _save_test_durations(config) -> None:
+    """
+    Воркер записывает длительности своих тестов в файл из плана (их объединяет запуск с --shards),
+    обычный запуск обновляет историю сам.
+    """
+    if not config.test_durations:
+        return
+    if config.shard_plan is not None:
+        Path(config.shard_plan["durations"]).write_text(json.dumps(config.test_durations), encoding="utf-8")
+        return
 
-    request.addfinalizer(fin)
+    store = DurationStore(Path(settings.SHARD_DIR) / "durations.json")
+    store.update(config.test_durations)
+    store.save()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -109,19 +520,106 @@ def pytest_runtest_makereport(item, call) -> None:
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    durations = item.config.test_durations.setdefault(item.nodeid, {"kind": item_kind(item), "seconds": 0.0})
+    durations["seconds"] += rep.duration
+
+    # Скриншот, URL и HTML собираются сразу после падения, пока браузер теста открыт,
+    # и прикладываются к отчету в конце teardown, когда фоновая подготовка уже завершена
+    artifacts = item.config.failure_artifacts
+    if rep.failed and rep.when in ("setup", "call"):
+        for driver in _test_drivers(item):
+            artifacts.capture(item.nodeid, driver, item.name)
+    elif rep.when == "teardown":
+        artifacts.attach(item.nodeid)
+
+
+def _test_drivers(item) -> list:
+    """
+    Браузеры, полученные тестом из фикстур.
+    """
+    drivers = []
+    for value in getattr(item, "funcargs", {}).values():
+        if isinstance(value, WebDriver) and value not in drivers:
+            drivers.append(value)
+    return drivers
+
+
+@pytest.fixture(scope="session")
+def slot_allocator() -> SlotAllocator:
+    """
+    Распределитель слотов календаря для текущего воркера.
+    """
+    return SlotAllocator()
+
 
 @pytest.fixture
-def create_personal_event(authorized_api_client) -> dict:
+def event_slot(slot_allocator) -> EventSlot:
+    """
+    Уникальное для теста временное окно и префикс названия события.
+    """
+    return slot_allocator.allocate()
+
+
+@pytest.fixture(scope="session")
+def event_manager(request, api_session_factory, api_token) -> PersonalEventManager:
+    """
+    Менеджер личных событий сессии.
+    Перед тестами удаляет события, оставшиеся от аварийно завершенных запусков
+    (кроме воспроизведения кассеты и локальной замены API), после тестов удаляет все созданные за сессию события.
+    """
+    replaying = is_replaying_api(request.config)
+    client = ApiClient(session=api_session_factory(), token=api_token,
+                       retry_policy=create_retry_policy(rate_limited=not replaying))
+    async_client = AsyncApiClient(session=api_session_factory(pool_maxsize=10), token=api_token,
+                                  retry_policy=create_retry_policy(rate_limited=not replaying))
+    manager = PersonalEventManager(client, async_client)
+    if not replaying and not request.config.getoption("--fake-api"):
+        manager.sweep_orphans()
+
+    yield manager
+
+    manager.remove_all()
+    logger.info(manager.report())
+    async_client.close()
+
+
+@pytest.fixture
+def personal_events(request, event_manager, slot_allocator, event_slot) -> List[PreparedEvent]:
+    """
+    События-предусловия из маркера personal_events(count), созданные пачкой через API до начала теста.
+    Первое событие занимает слот теста event_slot, остальные - дополнительные слоты воркера.
+    """
+    marker = request.node.get_closest_marker("personal_events")
+    count = marker.args[0] if marker is not None and marker.args else 1
+    slots = [event_slot] + [slot_allocator.allocate() for _ in range(count - 1)]
+    return event_manager.prepare(slots)
+
+
+@pytest.fixture(scope="session")
+def schedule_reader(request, api_session_factory, api_token, event_manager) -> ScheduleReader:
+    """
+    Чтение расписания с кэшем по дням. Дни событий, измененных менеджером событий,
+    обновляются при следующем чтении.
+    """
+    client = ApiClient(session=api_session_factory(), token=api_token,
+                       retry_policy=create_retry_policy(rate_limited=not is_replaying_api(request.config)))
+    reader = ScheduleReader(client)
+    reader.watch(event_manager)
+
+    yield reader
+
+    logger.info(f"Чтение расписания: {reader.stats}")
+
+
+@pytest.fixture
+def create_personal_event(event_manager, event_slot) -> CreatedEvent:
     event_data = TestData.get_personal_event(
-        title=f"Событие с валидными данными{TestData.PERSONAL_EVENT_NAME}",
-        date=TestData.date(),
-        start_at=TestData.PERSONAL_EVENT_START_TIME,
-        end_at=TestData.PERSONAL_EVENT_END_TIME
+        title=event_slot.title(f"Событие с валидными данными{TestData.PERSONAL_EVENT_NAME}"),
+        date=event_slot.date,
+        start_at=event_slot.start_time,
+        end_at=event_slot.end_time
     )
 
-    response = authorized_api_client.post(
-        "/createPersonal",
-        data=event_data
-    )
+    response = event_manager.create(event_data)
 
-    return response.json()
+    return CreatedEvent.from_response(response)
@@ -1,6 +1,7 @@
 import pytest
 import allure
 
+from src.api.models import CreatedEvent, UpdatedEvent
 from src.data.test_data import TestData
 from src.utils.logger_utils import logger
 
@@ -10,22 +11,21 @@ from src.utils.logger_utils import logger
 @allure.title("Создание события с валидными данными")
 @pytest.mark.api
 @pytest.mark.positive
-def test_create_personal_event(authorized_api_client):
+def test_create_personal_event(event_manager, event_slot):
     with allure.step("Создание события с валидными данными"):
-        response = authorized_api_client.post(
-            "/createPersonal",
-            data=TestData.get_personal_event(
-                title=f"Событие с валидными данными{TestData.PERSONAL_EVENT_NAME}",
-                date=TestData.date(),
-                start_at="14:00",
-                end_at="14:50"
+        response = event_manager.create(
+            TestData.get_personal_event(
+                title=event_slot.title(f"Событие с валидными данными{TestData.PERSONAL_EVENT_NAME}"),
+                date=event_slot.date,
+                start_at=event_slot.start_time,
+                end_at=event_slot.end_time
             ))
         logger.debug(f"Response: {response.text}")
 
         assert response.status_code == 200
-        event_id = response.json().get('id')
+        event_id = CreatedEvent.from_response(response).id
 
-        return event_id
+        assert event_id is not None, "ID события отсутствует"
 
 
 @allure.feature("API тесты")
@@ -33,32 +33,30 @@ def test_create_personal_event(authorized_api_client):
 @allure.title("Создание двух личных событий на одно время")
 @pytest.mark.api
 @pytest.mark.positive
-def test_create_duplicate_event(authorized_api_client):
+def test_create_duplicate_event(event_manager, event_slot):
     with allure.step("Создание двух личных событий на одно время"):
         with allure.step("Создание первого события"):
-            response1 = authorized_api_client.post(
-                "/createPersonal",
-                data=TestData.get_personal_event(
-                    title=f"Первое событие{TestData.PERSONAL_EVENT_NAME}",
-                    date=TestData.date(),
-                    start_at="14:00",
-                    end_at="14:50"
+            response1 = event_manager.create(
+                TestData.get_personal_event(
+                    title=event_slot.title(f"Первое событие{TestData.PERSONAL_EVENT_NAME}"),
+                    date=event_slot.date,
+                    start_at=event_slot.start_time,
+                    end_at=event_slot.end_time
                 ))
             assert response1.status_code == 200
-            event_id1 = response1.json().get('data').get('payload').get('id')
+            event_id1 = CreatedEvent.from_response(response1).id
 
         with allure.step("Создание второго события"):
-            response2 = authorized_api_client.post(
-                "/createPersonal",
-                data=TestData.get_personal_event(
-                    title=f"Второе событие{TestData.PERSONAL_EVENT_NAME}",
-                    date=TestData.date(),
-                    start_at="14:00",
-                    end_at="14:50"
+            response2 = event_manager.create(
+                TestData.get_personal_event(
+                    title=event_slot.title(f"Второе событие{TestData.PERSONAL_EVENT_NAME}"),
+                    date=event_slot.date,
+                    start_at=event_slot.start_time,
+                    end_at=event_slot.end_time
                 ))
 
             assert response2.status_code == 200
-            event_id2 = response2.json().get('data').get('payload').get('id')
+            event_id2 = CreatedEvent.from_response(response2).id
 
         assert event_id1 != event_id2, "ID событий должны быть разными"
 
@@ -68,13 +66,12 @@ def test_create_duplicate_event(authorized_api_client):
 @allure.title("Создание события без указания даты и времени")
 @pytest.mark.api
 @pytest.mark.negative
-def test_create_event_without_time(authorized_api_client):
+def test_create_event_without_time(event_manager, event_slot):
     with allure.step("Создание события без указания времени"):
-        response = authorized_api_client.post(
-            "/createPersonal",
-            data=TestData.get_personal_event(
-                title=TestData.PERSONAL_EVENT_NAME,
-                date=TestData.date()
+        response = event_manager.create(
+            TestData.get_personal_event(
+                title=event_slot.title(TestData.PERSONAL_EVENT_NAME),
+                date=event_slot.date
             ))
         assert response.json().get('data') is None, "Событие создано без времени"
 
@@ -84,24 +81,23 @@ def test_create_event_without_time(authorized_api_client):
 @allure.title("Редактирование события с изменением всех полей")
 @pytest.mark.api
 @pytest.mark.positive
-def test_edit_event(authorized_api_client, create_personal_event):
+def test_edit_event(event_manager, create_personal_event, slot_allocator):
     with allure.step("Получение id события"):
-        created_event = create_personal_event.get('data')
-        event_id = created_event.get('payload').get('id')
-        event_old_start_at = created_event.get('startAt')
+        event_id = create_personal_event.id
+        event_old_start_at = create_personal_event.start_at
 
         assert event_id is not None, "ID события отсутствует"
 
-        created_event = create_personal_event.get('data')
-        logger.debug(f"Созданное событие: {created_event}")
+        logger.debug(f"Созданное событие: {create_personal_event}")
 
     with allure.step("Редактирование события с изменением всех полей"):
+        new_slot = slot_allocator.allocate()
         test_data = TestData.get_personal_event_by_id(
-            title=f"Редактирование_{TestData.PERSONAL_EVENT_NAME}",
+            title=new_slot.title(f"Редактирование_{TestData.PERSONAL_EVENT_NAME}"),
             event_id=event_id,
-            date=TestData.date(),
-            start_at="15:00",
-            end_at="17:00",
+            date=new_slot.date,
+            start_at=new_slot.start_time,
+            end_at=new_slot.end_time,
             background_color="#FDF2EB",
             color="#B65843",
             description="Обновленное описание",
@@ -110,16 +106,16 @@ def test_edit_event(authorized_api_client, create_personal_event):
         )
         logger.debug(f"Тестовые данные для изменений: {test_data}")
 
-        response = authorized_api_client.post("/updatePersonal", data=test_data)
-        response_data = response.json()
-        response_payload = response_data.get('data').get('payload').get('payload')
-        logger.debug(f'{response_data}, {response_payload}')
-
+        response = event_manager.update(test_data)
         assert response.status_code == 200
-        assert response_payload.get('backgroundColor') == "#FDF2EB"
-        assert response_payload.get('color') == "#B65843"
-        assert response_payload.get('description') == "Обновленное описание"
-        assert response_payload.get('title') == test_data['title']
+
+        response_payload = UpdatedEvent.from_response(response).event.payload
+        logger.debug(f'{response_payload}')
+
+        assert response_payload.background_color == "#FDF2EB"
+        assert response_payload.color == "#B65843"
+        assert response_payload.description == "Обновленное описание"
+        assert response_payload.title == test_data['title']
 
 
 @allure.feature("API тесты")
@@ -127,17 +123,45 @@ def test_edit_event(authorized_api_client, create_personal_event):
 @allure.title("Удаление личного события")
 @pytest.mark.api
 @pytest.mark.positive
-def test_delete_event(authorized_api_client, create_personal_event):
+def test_delete_event(event_manager, create_personal_event, event_slot):
     with allure.step("Получение id события"):
-        event_id = create_personal_event.get('data').get('payload').get('id')
+        event_id = create_personal_event.id
 
         assert event_id is not None
 
     with allure.step("Удаление личного события"):
-        response = authorized_api_client.post(
-            "/removePersonal",
-            data={
-                'id': event_id,
-                'start_at': f"{TestData.date()}T{TestData.PERSONAL_EVENT_START_TIME}:00+03:00"
-            })
+        response = event_manager.remove(event_id, event_slot.start_at)
+        assert response.status_code == 200
+
+
+@allure.feature("API тесты")
+@allure.story("Расписание")
+@allure.title("Получение расписания преподавателя")
+@pytest.mark.api
+@pytest.mark.positive
+@pytest.mark.fake_api_only("/getSchedule с параметрами from/to описан по локальной замене API")
+def test_get_schedule(event_manager, schedule_reader, event_slot):
+    title = event_slot.title(f"Расписание{TestData.PERSONAL_EVENT_NAME}")
+
+    with allure.step("Создание события"):
+        response = event_manager.create(
+            TestData.get_personal_event(
+                title=title,
+                date=event_slot.date,
+                start_at=event_slot.start_time,
+                end_at=event_slot.end_time
+            ))
+        assert response.status_code == 200
+        created_event = CreatedEvent.from_response(response)
+
+    with allure.step("Получение расписания на день события"):
+        event = schedule_reader.find(title, event_slot.date)
+
+        assert event is not None, "Созданное событие отсутствует в расписании"
+        assert event.id == created_event.id
+
+    with allure.step("Удаление события и повторное получение расписания"):
+        response = event_manager.remove(created_event.id, created_event.start_at)
         assert response.status_code == 200
+
+        assert schedule_reader.find(title, event_slot.date) is None, "Удаленное событие осталось в расписании"
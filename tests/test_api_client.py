@@ -0,0 +1,59 @@
+import pytest
+import requests
+
+from requests.adapters import BaseAdapter
+
+from src.api.api_client import ApiClient
+from src.config.config import config
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Транспорт, запоминающий заголовки запросов вместо отправки в сеть.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.headers = []
+
+    def send(self, request, **kwargs):
+        self.headers.append(dict(request.headers))
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_client(token) -> tuple:
+    session = requests.Session()
+    adapter = RecordingAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return ApiClient(session=session, token=token), adapter
+
+
+def test_static_token_sent_from_session_headers():
+    client, adapter = make_client("static")
+
+    client.get("/getSchedule", headers={"If-None-Match": '"etag"'})
+
+    assert adapter.headers[0]["Cookie"] == f"{config.AUTH_COOKIE_NAME}=static"
+    assert adapter.headers[0]["If-None-Match"] == '"etag"'
+
+
+def test_refreshed_token_sent_per_request_without_changing_session():
+    tokens = iter(["first", "first", "second"])
+    client, adapter = make_client(lambda: next(tokens))
+
+    client.post("/createPersonal", data={})
+    client.get("/getSchedule")
+
+    assert [headers["Cookie"] for headers in adapter.headers] == [f"{config.AUTH_COOKIE_NAME}=first",
+                                                                   f"{config.AUTH_COOKIE_NAME}=second"]
+    assert client.session.headers["Cookie"] == f"{config.AUTH_COOKIE_NAME}=first"
+    assert client.token == "second"
@@ -0,0 +1,34 @@
+import pytest
+
+from src.utils import calendar_time
+
+pytestmark = pytest.mark.unit
+
+
+def test_local_iso_uses_offset_of_the_date():
+    assert calendar_time.local_iso("2030-01-02", "10:30", "Europe/Moscow") == "2030-01-02T10:30:00+03:00"
+    assert calendar_time.local_iso("2030-07-02", "10:30", "Europe/Berlin") == "2030-07-02T10:30:00+02:00"
+    assert calendar_time.local_iso("2030-01-02", "10:30", "Europe/Berlin") == "2030-01-02T10:30:00+01:00"
+
+
+def test_iso_slots_match_local_iso():
+    slots = [("2030-01-02", "10:00", "10:30"), ("2030-07-02", "23:30", "23:59")]
+
+    assert calendar_time.iso_slots(slots, "Europe/Berlin") == [
+        (calendar_time.local_iso(date, start, "Europe/Berlin"), calendar_time.local_iso(date, end, "Europe/Berlin"))
+        for date, start, end in slots
+    ]
+
+
+def test_to_zone_iso_and_utc_option_date():
+    assert calendar_time.to_zone_iso("2030-01-02T07:00:00+00:00", "Europe/Moscow") == "2030-01-02T10:00:00+03:00"
+    assert calendar_time.utc_option_date("2030-01-01T22:00:00.000Z", "Europe/Moscow") == "2030-01-02"
+    assert calendar_time.utc_option_date("не дата", "Europe/Moscow") is None
+
+
+def test_tomorrow_is_cached_until_local_midnight(monkeypatch):
+    value = calendar_time.tomorrow("Asia/Tokyo")
+    monkeypatch.setattr(calendar_time, "datetime", None)
+
+    # Повторный вызов до полуночи не пересчитывает дату
+    assert calendar_time.tomorrow("Asia/Tokyo") == value
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+import requests
+
+from src.api.cassette import Cassette, CassetteMismatchError, mount_cassette
+from src.config.config import config
+
+pytestmark = pytest.mark.unit
+
+
+def make_request(endpoint: str, body: dict = None, method: str = "POST") -> requests.PreparedRequest:
+    return requests.Request(method, config.API_URL + endpoint, json=body).prepare()
+
+
+def make_response(body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    response.encoding = "utf-8"
+    return response
+
+
+def event(title: str, start_at: str) -> dict:
+    return {"title": title, "startAt": start_at}
+
+
+def test_key_ignores_volatile_values_and_field_order():
+    first = Cassette.key("post", config.API_URL + "/createPersonal",
+                         json.dumps(event("qa-1a2b0003_Событие_0bd7f3a9", "2030-01-02T10:00:00+03:00")))
+    second = Cassette.key("POST", config.API_URL + "/createPersonal",
+                          json.dumps({"startAt": "2031-05-06T14:30:00+03:00", "title": "qa-ffff0112_Событие_12ab34cd"}))
+
+    assert first == second
+    assert first != Cassette.key("POST", config.API_URL + "/createPersonal",
+                                 json.dumps(event("qa-1a2b0003_Другое_0bd7f3a9", "2030-01-02T10:00:00+03:00")))
+
+
+def test_key_keeps_short_hex_endings_of_titles():
+    assert Cassette.key("POST", config.API_URL + "/createPersonal", json.dumps(event("Событие_ab12", "10:00"))) != \
+        Cassette.key("POST", config.API_URL + "/createPersonal", json.dumps(event("Событие_cd34", "10:00")))
+
+
+def test_key_uses_path_relative_to_api_url_and_sorted_query():
+    key = Cassette.key("GET", config.API_URL + "/getSchedule?to=2030-01-03&from=2030-01-02", None)
+
+    assert json.loads(key)[:3] == ["GET", "/getSchedule", [["from", "<date>"], ["to", "<date>"]]]
+
+
+def test_replay_substitutes_current_values_within_the_test(tmp_path):
+    cassette = Cassette(tmp_path / "api.json.gz")
+    recorded = event("qa-1a2b0000_Событие_0bd7f3a9", "2030-01-02T10:00:00+03:00")
+    cassette.record(make_request("/createPersonal", recorded), make_response({"data": recorded}))
+    cassette.record(make_request("/getSchedule", method="GET"), make_response({"data": {"payload": [recorded]}}))
+
+    current = event("qa-9f8e0000_Событие_12ab34cd", "2031-05-06T14:30:00+03:00")
+    created = cassette.play(make_request("/createPersonal", current))
+    schedule = cassette.play(make_request("/getSchedule", method="GET"))
+
+    assert created.json()["data"] == current
+    # Ответ без тела запроса получает значения, подмененные ранее в сессии
+    assert schedule.json()["data"]["payload"] == [current]
+
+
+def test_substitutions_do_not_leak_between_tests(tmp_path):
+    cassette = Cassette(tmp_path / "api.json.gz")
+    recorded = event("qa-1a2b0000_Событие_0bd7f3a9", "2030-01-02T10:00:00+03:00")
+    for scope in ("test_a", "test_b"):
+        cassette.scope = scope
+        cassette.record(make_request("/createPersonal", recorded), make_response({"data": recorded}))
+        cassette.record(make_request("/getSchedule", method="GET"), make_response({"data": {"payload": [recorded]}}))
+
+    replayed = {}
+    for scope, start_at in (("test_a", "2031-05-06T10:00:00+03:00"), ("test_b", "2032-07-08T10:00:00+03:00")):
+        cassette.scope = scope
+        cassette.play(make_request("/createPersonal", event(recorded["title"], start_at)))
+    for scope in ("test_a", "test_b"):
+        cassette.scope = scope
+        replayed[scope] = cassette.play(make_request("/getSchedule", method="GET")).json()["data"]["payload"][0]
+
+    assert replayed["test_a"]["startAt"] == "2031-05-06T10:00:00+03:00"
+    assert replayed["test_b"]["startAt"] == "2032-07-08T10:00:00+03:00"
+
+
+def test_replay_prefers_responses_recorded_by_the_same_test(tmp_path):
+    cassette = Cassette(tmp_path / "api.json.gz")
+    request = make_request("/createPersonal", event("qa-1a2b0000_Событие_0bd7f3a9", "2030-01-02T10:00:00+03:00"))
+    for scope, event_id in (("test_a", 1), ("test_b", 2)):
+        cassette.scope = scope
+        cassette.record(request, make_response({"data": {"id": event_id}}))
+
+    cassette.scope = "test_b"
+    assert cassette.play(request).json()["data"]["id"] == 2
+    cassette.scope = "test_a"
+    assert cassette.play(request).json()["data"]["id"] == 1
+    # Ответы закончились - повторяется последний
+    assert cassette.play(request).json()["data"]["id"] == 1
+
+
+def test_merge_saves_and_loads_interactions_of_all_workers(tmp_path):
+    sources = []
+    for worker in range(2):
+        cassette = Cassette(tmp_path / f"gw{worker}.json.gz")
+        cassette.record(make_request(f"/endpoint{worker}"), make_response({"worker": worker}))
+        cassette.save()
+        sources.append(cassette.path)
+
+    merged = Cassette.merge(tmp_path / "api.json.gz", sources + [tmp_path / "missing.json.gz"])
+    merged.save()
+    loaded = Cassette(merged.path).load()
+
+    assert len(loaded) == 2
+    assert loaded.play(make_request("/endpoint1")).json() == {"worker": 1}
+
+
+def test_strict_replay_fails_when_recorded_responses_run_out(tmp_path):
+    cassette = Cassette(tmp_path / "api.json.gz")
+    cassette.record(make_request("/getSchedule", method="GET"), make_response({"data": {"payload": []}}))
+    session = requests.Session()
+    mount_cassette(session, cassette, "strict")
+
+    assert session.get(config.API_URL + "/getSchedule").json() == {"data": {"payload": []}}
+    with pytest.raises(CassetteMismatchError):
+        session.get(config.API_URL + "/getSchedule")
@@ -0,0 +1,44 @@
+import pytest
+import requests
+
+from src.api.api_client import ApiClient
+from src.api.event_manager import PersonalEventManager
+from src.config.config import config
+from src.data.test_data import TestData
+from src.stubs.schedule_api import ScheduleApiServer
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def schedule_api(monkeypatch):
+    with ScheduleApiServer() as server:
+        monkeypatch.setattr(config, "API_URL", server.api_url)
+        yield server
+
+
+def make_manager(journal_dir, run_id: str, monkeypatch) -> PersonalEventManager:
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", run_id)
+    return PersonalEventManager(ApiClient(session=requests.Session()), journal_dir=str(journal_dir))
+
+
+def test_sweep_skips_events_removed_or_forgotten_by_tests(schedule_api, tmp_path, monkeypatch):
+    crashed = make_manager(tmp_path, "crashed", monkeypatch)
+    ids = []
+    for hour in (10, 11, 12):
+        response = crashed.create(TestData.get_personal_event(
+            title=f"qa-0000{hour}_Событие", date="2030-01-02", start_at=f"{hour}:00", end_at=f"{hour}:30"))
+        ids.append(response.json()["data"]["payload"]["id"])
+    crashed.remove(ids[0], "2030-01-02T10:00:00+03:00")
+    schedule_api.store.remove(ids[1])
+    crashed.forget(ids[1])
+
+    # Журнал аварийно завершенного процесса: pid в имени не существует
+    crashed.journal_path.rename(crashed.journal_dir / "crashed-0-999999999.jsonl")
+    (tmp_path / "0123456789ab").mkdir()
+
+    sweeper = make_manager(tmp_path, "next", monkeypatch)
+    assert sweeper.sweep_orphans(title_prefix="qa-") == 1
+    assert len(schedule_api.store) == 0
+    assert not (tmp_path / "0123456789ab").exists()
+    assert sweeper.stats["remove"]["calls"] == 1
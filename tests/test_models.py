@@ -0,0 +1,85 @@
+import json
+
+import pytest
+import requests
+
+from src.api.models import CreatedEvent, RemovedEvent, ResponseValidationError, ScheduleListing, UpdatedEvent
+
+pytestmark = pytest.mark.unit
+
+EVENT = {
+    "type": "personal",
+    "startAt": "2030-01-02T10:00:00+03:00",
+    "endAt": "2030-01-02T10:30:00+03:00",
+    "payload": {"id": 7, "title": "Событие", "description": None, "color": "#43B658", "backgroundColor": "#EBFDF2"},
+}
+
+
+def make_response(content: bytes, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    return response
+
+
+def test_created_event_from_response():
+    created = CreatedEvent.from_response(make_response(json.dumps({"data": EVENT}).encode("utf-8")))
+
+    assert created.id == 7
+    assert created.start_at == EVENT["startAt"]
+    assert created.event.payload.background_color == "#EBFDF2"
+    assert created.event.payload.description is None
+
+
+@pytest.mark.parametrize("body, path", [
+    ({"data": dict(EVENT, startAt=None)}, "data.startAt"),
+    ({"data": dict(EVENT, payload={"title": "Событие"})}, "data.payload.id"),
+    ({"data": dict(EVENT, payload=dict(EVENT["payload"], id="7"))}, "data.payload.id"),
+    ({"data": dict(EVENT, payload=dict(EVENT["payload"], id=True))}, "data.payload.id"),
+    ({"data": dict(EVENT, payload=dict(EVENT["payload"], title=None))}, "data.payload.title"),
+])
+def test_created_event_validation_reports_field_path(body, path):
+    with pytest.raises(ResponseValidationError) as error:
+        CreatedEvent.from_body(body)
+
+    assert error.value.path == path
+
+
+def test_error_response_reports_api_errors():
+    with pytest.raises(ResponseValidationError, match="Время окончания"):
+        CreatedEvent.from_body({"data": None, "errors": [{"message": "Время окончания раньше начала"}]})
+
+
+def test_non_json_body_reports_status():
+    with pytest.raises(ResponseValidationError, match="HTTP 502"):
+        CreatedEvent.from_response(make_response(b"<html>Bad gateway</html>", status=502))
+
+
+def test_updated_event_requires_only_event_fields():
+    updated = UpdatedEvent.from_body({"data": {"payload": {"payload": {"title": "Новое", "color": "#B65843"}}}})
+
+    assert updated.event.payload.title == "Новое"
+    assert updated.event.start_at is None
+    assert updated.id is None
+
+
+def test_removed_event_requires_id():
+    assert RemovedEvent.from_body({"data": {"payload": {"id": 7}}}).id == 7
+    with pytest.raises(ResponseValidationError):
+        RemovedEvent.from_body({"data": {"payload": {}}})
+
+
+def test_schedule_listing_validates_events_on_access():
+    items = [EVENT, {"payload": "broken"}, dict(EVENT, payload=dict(EVENT["payload"], id=8, title="Второе"))]
+    listing = ScheduleListing.from_body({"data": {"payload": items}})
+
+    assert len(listing) == 3
+    assert listing.ids() == [7, None, 8]
+    assert listing.find_by_title("Второе").id == 8
+    assert listing[-1].id == 8
+    with pytest.raises(IndexError):
+        listing[-4]
+    with pytest.raises(IndexError):
+        listing[3]
+    with pytest.raises(ResponseValidationError, match=r"data.payload\[1\].payload"):
+        list(listing)
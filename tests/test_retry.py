@@ -0,0 +1,104 @@
+import email.utils
+import time
+
+import pytest
+import requests
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from src.api.retry import RetryMetrics, RetryPolicy, TokenBucket
+
+pytestmark = pytest.mark.unit
+
+
+def make_response(status: int, headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+def run(policy: RetryPolicy, method: str, endpoint: str, outcomes: list) -> tuple:
+    """
+    Выполняет запрос, ответы (или исключения) которого берутся по очереди из outcomes.
+    Возвращает результат и число попыток.
+    """
+    attempts = []
+
+    def send():
+        outcome = outcomes[min(len(attempts), len(outcomes) - 1)]
+        attempts.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return make_response(outcome)
+
+    return policy.execute(method, endpoint, send), len(attempts)
+
+
+@pytest.fixture
+def policy() -> RetryPolicy:
+    return RetryPolicy(max_attempts=3, retry_endpoints=("/updatePersonal",), metrics=RetryMetrics(),
+                       sleep=lambda seconds: None)
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=100, capacity=2)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
+
+
+def test_backoff_is_capped_full_jitter(policy):
+    policy.max_backoff = 1.0
+    delays = [policy.backoff(attempt) for attempt in range(1, 10) for _ in range(20)]
+
+    assert all(0 <= delay <= 1.0 for delay in delays)
+    assert all(policy.backoff(1) <= policy.backoff_factor for _ in range(20))
+
+
+def test_retry_after_seconds_and_http_date():
+    assert RetryPolicy.retry_after(make_response(429, {"Retry-After": "3"})) == 3.0
+    assert RetryPolicy.retry_after(make_response(429)) is None
+
+    retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 < RetryPolicy.retry_after(make_response(503, {"Retry-After": retry_at})) <= 30
+
+
+def test_idempotent_request_retried_on_server_error(policy):
+    response, attempts = run(policy, "GET", "/getSchedule", [500, 200])
+
+    assert response.status_code == 200
+    assert attempts == 2
+
+
+@pytest.mark.parametrize("status", [500, 502, 504])
+def test_allowed_post_not_retried_when_change_may_be_applied(policy, status):
+    response, attempts = run(policy, "POST", "/updatePersonal", [status, 200])
+
+    assert response.status_code == status
+    assert attempts == 1
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_allowed_post_retried_when_not_applied(policy, status):
+    response, attempts = run(policy, "POST", "/updatePersonal", [status, 200])
+
+    assert response.status_code == 200
+    assert attempts == 2
+
+
+def test_allowed_post_retried_only_on_connection_errors(policy):
+    refused = requests.ConnectionError(MaxRetryError(None, "/updatePersonal", NewConnectionError(None, "refused")))
+    response, attempts = run(policy, "POST", "/updatePersonal", [refused, 200])
+    assert response.status_code == 200 and attempts == 2
+
+    with pytest.raises(requests.ReadTimeout):
+        run(policy, "POST", "/updatePersonal", [requests.ReadTimeout(), 200])
+
+
+def test_other_post_never_retried(policy):
+    response, attempts = run(policy, "POST", "/createPersonal", [503, 200])
+
+    assert response.status_code == 503
+    assert attempts == 1
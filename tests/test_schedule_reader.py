@@ -0,0 +1,77 @@
+import pytest
+import requests
+
+from src.api.api_client import ApiClient
+from src.api.schedule_reader import ScheduleReader, _date_range, _digest, _runs
+from src.config.config import config
+from src.stubs.schedule_api import ScheduleApiServer
+
+pytestmark = pytest.mark.unit
+
+
+def test_runs_groups_consecutive_days():
+    dates = ["2030-01-30", "2030-01-31", "2030-02-01", "2030-02-03", "2030-02-05", "2030-02-06"]
+
+    assert _runs(dates) == [("2030-01-30", "2030-02-01"), ("2030-02-03", "2030-02-03"),
+                            ("2030-02-05", "2030-02-06")]
+    assert _runs([]) == []
+
+
+def test_date_range_is_inclusive():
+    assert _date_range("2030-02-27", "2030-03-01") == ["2030-02-27", "2030-02-28", "2030-03-01"]
+    with pytest.raises(ValueError):
+        _date_range("2030-03-01", "2030-02-27")
+
+
+def test_digest_ignores_event_and_key_order():
+    first = {"startAt": "2030-01-02T10:00:00+03:00", "payload": {"id": 1, "title": "Первое"}}
+    second = {"payload": {"title": "Второе", "id": 2}, "startAt": "2030-01-02T11:00:00+03:00"}
+
+    assert _digest([first, second]) == _digest([second, dict(reversed(list(first.items())))])
+    assert _digest([first]) != _digest([first, second])
+    assert _digest([first]) != _digest([dict(first, payload={"id": 1, "title": "Изменено"})])
+
+
+@pytest.fixture
+def schedule_api(monkeypatch):
+    with ScheduleApiServer() as server:
+        monkeypatch.setattr(config, "API_URL", server.api_url)
+        yield server
+
+
+def add_event(server: ScheduleApiServer, title: str, date: str) -> None:
+    server.store.create({"title": title, "startAt": f"{date}T10:00:00+03:00", "endAt": f"{date}T10:30:00+03:00"})
+
+
+def make_reader(max_age: float) -> ScheduleReader:
+    return ScheduleReader(ApiClient(session=requests.Session()), max_age=max_age, zone_name="Europe/Moscow")
+
+
+def test_repeated_read_is_answered_not_modified(schedule_api):
+    add_event(schedule_api, "Первое", "2030-01-02")
+    reader = make_reader(max_age=0)
+
+    first = reader.read("2030-01-01", "2030-01-03")
+    second = reader.read("2030-01-01", "2030-01-03")
+
+    assert reader.stats["requests"] == 2
+    assert reader.stats["not_modified"] == 1
+    assert second["2030-01-02"].ids() == first["2030-01-02"].ids() == [1]
+
+
+def test_only_invalidated_days_are_fetched_again(schedule_api):
+    add_event(schedule_api, "Первое", "2030-01-02")
+    reader = make_reader(max_age=3600)
+    reader.read("2030-01-01", "2030-01-05")
+
+    add_event(schedule_api, "Второе", "2030-01-04")
+    add_event(schedule_api, "Не отмеченное", "2030-01-05")
+    reader.invalidate("2030-01-04")
+    days = reader.read("2030-01-01", "2030-01-05")
+
+    assert reader.stats["requests"] == 2
+    assert reader.stats["days_fetched"] == 6
+    assert reader.stats["days_cached"] == 4
+    assert days["2030-01-04"].find_by_title("Второе") is not None
+    # День без отметки об изменении берется из кэша до истечения max_age
+    assert len(days["2030-01-05"]) == 0
@@ -0,0 +1,66 @@
+import pytest
+
+from src.stubs.schedule_api import ScheduleStore, ScheduleValidationError, event_view
+
+pytestmark = pytest.mark.unit
+
+
+def event(title: str, start: str, end: str) -> dict:
+    return {"title": title, "startAt": f"2030-01-02T{start}:00+03:00", "endAt": f"2030-01-02T{end}:00+03:00"}
+
+
+@pytest.fixture
+def store() -> ScheduleStore:
+    store = ScheduleStore()
+    store.create(event("morning", "09:00", "10:00"))
+    store.create(event("long", "08:00", "12:00"))
+    store.create(event("evening", "18:00", "19:00"))
+    return store
+
+
+def titles(events: list) -> list:
+    return [item["title"] for item in events]
+
+
+def test_between_returns_overlapping_events_in_start_order(store):
+    assert titles(store.between("2030-01-02T09:30:00+03:00", "2030-01-02T11:00:00+03:00")) == ["long", "morning"]
+    # Интервал полуоткрытый: событие, закончившееся в начале интервала, не входит
+    assert titles(store.between("2030-01-02T12:00:00+03:00", "2030-01-02T18:00:00+03:00")) == []
+
+
+def test_update_moves_event_in_index(store):
+    morning = store.between("2030-01-02T09:00:00+03:00", "2030-01-02T09:30:00+03:00")[-1]
+    store.update(dict(event("moved", "20:00", "21:00"), id=morning["id"]))
+
+    assert titles(store.between("2030-01-02T19:30:00+03:00", "2030-01-03T00:00:00+03:00")) == ["moved"]
+    assert "morning" not in titles(store.between("2030-01-02T00:00:00+03:00", "2030-01-03T00:00:00+03:00"))
+
+
+def test_remove_and_unknown_ids(store):
+    removed = store.remove(1)
+
+    assert removed["title"] == "morning"
+    assert len(store) == 2
+    with pytest.raises(KeyError):
+        store.remove(1)
+    with pytest.raises(KeyError):
+        store.update(dict(event("missing", "09:00", "10:00"), id=42))
+
+
+@pytest.mark.parametrize("data", [
+    event("", "09:00", "10:00"),
+    event("backwards", "10:00", "09:00"),
+    {"title": "no dates", "startAt": "tomorrow", "endAt": None},
+])
+def test_invalid_events_rejected(data):
+    with pytest.raises(ScheduleValidationError):
+        ScheduleStore().create(data)
+
+
+def test_event_view_matches_api_format(store):
+    view = event_view(store.between("2030-01-02T18:00:00+03:00", "2030-01-02T18:30:00+03:00")[0])
+
+    assert view["type"] == "personal"
+    assert view["payload"]["id"] == 3
+    assert view["payload"]["title"] == "evening"
+    assert not any(key.startswith("_") for key in view)
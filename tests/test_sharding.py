@@ -0,0 +1,68 @@
+import pytest
+
+from src.utils.sharding import (DurationStore, Shard, ShardResult, ShardRunner, combined_exit_code, plan_shards,
+                                worker_counts)
+
+pytestmark = pytest.mark.unit
+
+
+def test_worker_counts_limited_by_ui_tests_and_memory():
+    assert worker_counts(8, ui_tests=3, browser_ram_mb=1024, memory_mb=16384) == (3, 5)
+    assert worker_counts(8, ui_tests=10, browser_ram_mb=1024, memory_mb=2560) == (2, 6)
+    # Хотя бы один воркер с браузером, если UI-тесты есть
+    assert worker_counts(4, ui_tests=2, browser_ram_mb=1024, memory_mb=512) == (1, 3)
+    assert worker_counts(4, ui_tests=0, browser_ram_mb=1024, memory_mb=512) == (0, 4)
+
+
+def test_plan_shards_balances_longest_first():
+    tests = [("ui_a", "ui", 10.0), ("ui_b", "ui", 6.0), ("ui_c", "ui", 5.0),
+             ("api_a", "api", 4.0), ("api_b", "api", 1.0)]
+    shards = plan_shards(tests, browser_workers=2, api_workers=1)
+
+    assert [shard.nodeids for shard in shards] == [["ui_a"], ["ui_b", "ui_c"], ["api_a", "api_b"]]
+    assert [shard.load for shard in shards] == [10.0, 11.0, 5.0]
+    assert [shard.browser for shard in shards] == [True, True, False]
+
+
+def test_plan_shards_never_gives_ui_tests_to_api_workers():
+    shards = plan_shards([("ui_a", "ui", 1.0), ("ui_b", "ui", 1.0)], browser_workers=1, api_workers=3)
+
+    assert len(shards) == 1
+    assert shards[0].browser and shards[0].nodeids == ["ui_a", "ui_b"]
+    with pytest.raises(ValueError):
+        plan_shards([("ui_a", "ui", 1.0)], browser_workers=0, api_workers=2)
+
+
+def test_empty_workers_dropped_and_renumbered():
+    shards = plan_shards([("api_a", "api", 1.0)], browser_workers=2, api_workers=2)
+
+    assert [(shard.worker_id, shard.nodeids) for shard in shards] == [(0, ["api_a"])]
+
+
+def test_duration_store_smooths_and_estimates(tmp_path):
+    store = DurationStore(tmp_path / "durations.json", smoothing=0.5)
+    store.update({"a": {"kind": "ui", "seconds": 10.0}, "b": {"kind": "ui", "seconds": 20.0}})
+    store.update({"a": {"kind": "ui", "seconds": 20.0}})
+    store.save()
+
+    loaded = DurationStore(tmp_path / "durations.json")
+    assert loaded.estimate("a", "ui") == 15.0
+    # Новый тест - медиана известных тестов того же вида, без истории - значение по умолчанию
+    assert loaded.estimate("new", "ui") == 17.5
+    assert loaded.estimate("new", "api") == 0.5
+
+
+def test_combined_exit_code_ignores_workers_without_tests():
+    assert combined_exit_code([0, 5, 0]) == 0
+    assert combined_exit_code([0, 1, 5]) == 1
+
+
+def test_collect_reports_in_worker_order(tmp_path):
+    runner = ShardRunner([], tmp_path)
+    runner.reports_path("gw0").write_text('{"nodeid": "a"}\n{"nodeid": "b"}\n', encoding="utf-8")
+    runner.reports_path("gw1").write_text('{"nodeid": "c"}\n', encoding="utf-8")
+    results = [ShardResult(Shard(worker_id, False), 0, 1.0, tmp_path / f"gw{worker_id}.log", "")
+               for worker_id in (2, 1, 0)]
+
+    # Воркер без файла отчетов (аварийное завершение) пропускается
+    assert [report["nodeid"] for report in runner.collect_reports(results)] == ["a", "b", "c"]
@@ -0,0 +1,54 @@
+import pytest
+
+from src.data.slot_allocator import SlotAllocator, current_worker
+
+pytestmark = pytest.mark.unit
+
+
+def allocate_all(allocator: SlotAllocator) -> list:
+    slots = []
+    while True:
+        try:
+            slots.append(allocator.allocate())
+        except RuntimeError:
+            return slots
+
+
+def test_workers_get_disjoint_interleaved_slots():
+    workers = [SlotAllocator(days=(1, 2), hours=(10, 12), slot_minutes=30, worker_id=worker_id, worker_count=3,
+                             run_id="abcd")
+               for worker_id in range(3)]
+    slots = [allocate_all(allocator) for allocator in workers]
+
+    # 2 дня по 4 слота: воркеры получают слоты пула 0, 3, 6 / 1, 4, 7 / 2, 5
+    assert [len(worker_slots) for worker_slots in slots] == [3, 3, 2]
+    times = [(slot.date, slot.start_time) for worker_slots in slots for slot in worker_slots]
+    assert len(set(times)) == 8
+    assert (slots[0][0].start_time, slots[1][0].start_time, slots[2][0].start_time) == ("10:00", "10:30", "11:00")
+    assert slots[0][1].start_time == "11:30" and slots[0][1].end_time == "12:00"
+
+
+def test_title_prefix_is_unique_and_keeps_full_name():
+    allocator = SlotAllocator(days=(1,), hours=(10, 11), slot_minutes=30, worker_id=1, worker_count=2,
+                              run_id="abcd")
+    slot = allocator.allocate()
+    name = "Событие с валидными данными_0bd7f3a91c"
+
+    assert slot.title_prefix == "qa-abcd0100_"
+    assert slot.title(name) == f"qa-abcd0100_{name}"
+
+
+def test_allocator_raises_when_worker_slots_exhausted():
+    allocator = SlotAllocator(days=(1,), hours=(10, 11), slot_minutes=30, worker_id=0, worker_count=1)
+    allocator.allocate()
+    allocator.allocate()
+
+    with pytest.raises(RuntimeError):
+        allocator.allocate()
+
+
+def test_current_worker_from_environment(monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+
+    assert current_worker() == (3, 4)
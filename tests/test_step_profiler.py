@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.step_profiler import StepHistory, percentile
+
+pytestmark = pytest.mark.unit
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 95) == 0.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 95) == 4.0
+
+
+def test_history_reports_change_against_previous_run(tmp_path):
+    history = StepHistory(tmp_path / "history.json", max_runs=2)
+    history.add_run({"SchedulePage.open": [1.0, 1.0, 2.0], "LoginPage.login": [3.0]})
+    history.save()
+
+    history = StepHistory(tmp_path / "history.json", max_runs=2)
+    rows = history.compare({"SchedulePage.open": [1.0, 3.0], "LoginPage.login": [3.5], "MainPage.open": [0.5]})
+
+    assert [row["name"] for row in rows] == ["SchedulePage.open", "LoginPage.login", "MainPage.open"]
+    assert rows[0]["delta_p95"] == 1.0
+    assert rows[2]["previous"] is None
+    assert "(новый)" in StepHistory.report_text(rows)
+
+
+def test_history_keeps_last_runs_per_step(tmp_path):
+    history = StepHistory(tmp_path / "history.json", max_runs=2)
+    for seconds in (1.0, 2.0, 3.0):
+        history.add_run({"SchedulePage.open": [seconds]})
+
+    assert [run["p50"] for run in history.runs["SchedulePage.open"]] == [2.0, 3.0]
@@ -0,0 +1,50 @@
+import base64
+import json
+import time
+
+import pytest
+
+from src.config.config import config
+from src.utils.logger_utils import logger
+from src.utils.token_service import TokenService, jwt_expiry
+
+pytestmark = pytest.mark.unit
+
+
+def make_jwt(claims: dict) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii").rstrip("=")
+
+    return f"{encode({'alg': 'HS256'})}.{encode(claims)}.signature"
+
+
+def test_jwt_expiry_reads_exp_claim():
+    assert jwt_expiry(make_jwt({"exp": 1893456000, "sub": "teacher"})) == 1893456000.0
+
+
+@pytest.mark.parametrize("token", [None, "", "not-a-jwt", "a.b.c", make_jwt({"sub": "teacher"}),
+                                   make_jwt({"exp": "soon"})])
+def test_jwt_expiry_none_for_unusable_tokens(token):
+    assert jwt_expiry(token) is None
+
+
+def test_cache_file_is_per_account(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "TOKEN_CACHE_DIR", str(tmp_path))
+    first = TokenService("first@example.com", "password")
+    second = TokenService("second@example.com", "password")
+
+    assert first.cache_path != second.cache_path
+    assert first.cache_path.parent == tmp_path
+    assert TokenService("first@example.com", "other").cache_path == first.cache_path
+
+
+def test_expired_token_without_credentials_warns_once(tmp_path, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(logger, "warning", warnings.append)
+    expired = make_jwt({"exp": time.time() - 60})
+    service = TokenService(None, None, initial_token=expired, cache_path=str(tmp_path / "token.json"),
+                           driver_factory=lambda: pytest.fail("Вход без учетных данных"))
+
+    assert service.get_token() == expired
+    assert service.get_token() == expired
+    assert len(warnings) == 1
@@ -1,11 +1,15 @@
+import time
+
 import allure
 import pytest
 
+from src.config.config import config
 from src.data.test_data import TestData
 from src.pages.main_page import MainPage
 from src.utils.logger_utils import logger
 from src.pages.login_page import LoginPage
 from src.pages.schedule_page import SchedulePage
+from src.stubs.schedule_ui import ScheduleUiServer
 
 
 FEATURE = "UI tests"
@@ -95,10 +99,43 @@ def test_failed_login_invalid_password(browser):
         assert not login_page.is_user_logged_in(), "Пользователь авторизован, хотя не должен был"
 
 
+@pytest.fixture
+def stub_login_url(monkeypatch):
+    """
+    Адрес страницы входа локальной замены кабинета (src/stubs/ui/login.html).
+    """
+    with ScheduleUiServer() as server:
+        monkeypatch.setattr(config, "LOGIN_URL", server.login_url)
+        yield server.login_url
+
+
 @allure.feature(FEATURE)
 @allure.story(STORY_LOGIN)
 @pytest.mark.ui
-def test_create_personal_event(auth):
+@pytest.mark.driver_profile("headless")
+@pytest.mark.parametrize("password, outcome", [(TestData.INVALID_PASSWORD, "login_error"), ("password", "logged_in")])
+def test_login_outcome_on_stub_page(browser, stub_login_url, password, outcome):
+    """
+    Результат входа определяется по первому появившемуся признаку, а не по истечении timeout.
+    Проверяется на локальной замене страницы входа; разметка реальной страницы с ней не сверена.
+    """
+    with allure.step("Отправить форму входа"):
+        login_page = LoginPage(browser)
+        login_page.login("teacher@example.com", password)
+
+    with allure.step(f"Дождаться результата входа: {outcome}"):
+        started = time.monotonic()
+        result = login_page.wait_for_login_outcome(timeout=10)
+        elapsed = time.monotonic() - started
+
+    assert result == outcome
+    assert elapsed < 3, f"Результат входа получен за {elapsed:.1f} с при timeout 10 с"
+
+
+@allure.feature(FEATURE)
+@allure.story(STORY_LOGIN)
+@pytest.mark.ui
+def test_create_personal_event(auth, event_slot):
     """
     Тест создания личного события.
     """
@@ -107,59 +144,92 @@ def test_create_personal_event(auth):
         schedule_page.open()
 
     with allure.step("Создать личное событие"):
+        event_name = event_slot.title(TestData.PERSONAL_EVENT_NAME)
+
         schedule_page.create_personal_event(
-            event_name=TestData.PERSONAL_EVENT_NAME,
+            event_name=event_name,
             event_description=TestData.PERSONAL_EVENT_DESCRIPTION,
-            date=TestData.date(),
-            start_time=TestData.PERSONAL_EVENT_START_TIME,
-            end_time=TestData.PERSONAL_EVENT_END_TIME
+            date=event_slot.date,
+            start_time=event_slot.start_time,
+            end_time=event_slot.end_time,
+            fill_mode="typing"
         )
 
     with allure.step("Проверить создание события"):
-        assert schedule_page.is_personal_event_created(TestData.PERSONAL_EVENT_NAME), \
+        assert schedule_page.is_personal_event_created(event_name), \
             "Событие не найдено в расписании"
 
 
 @allure.feature(FEATURE)
 @allure.story(STORY_SCHEDULE)
 @pytest.mark.ui
-def test_delete_personal_event(auth):
+@pytest.mark.fill_mode("script")
+def test_personal_event_smoke(auth, event_slot, fill_mode):
     """
-    Тест удаления личного события.
+    Smoke-тест создания и удаления личного события. Форма заполняется одним скриптом:
+    посимвольный ввод проверяет test_create_personal_event.
     """
+    event_name = event_slot.title(TestData.PERSONAL_EVENT_NAME)
+
     with allure.step("Открыть страницу с расписанием"):
         schedule_page = SchedulePage(auth)
         schedule_page.open()
 
     with allure.step("Создать личное событие"):
-        event_name = TestData.PERSONAL_EVENT_NAME
-
         schedule_page.create_personal_event(
             event_name=event_name,
             event_description=TestData.PERSONAL_EVENT_DESCRIPTION,
-            date=TestData.date(),
-            start_time=TestData.PERSONAL_EVENT_START_TIME,
-            end_time=TestData.PERSONAL_EVENT_END_TIME
+            date=event_slot.date,
+            start_time=event_slot.start_time,
+            end_time=event_slot.end_time,
+            fill_mode=fill_mode
         )
+        assert schedule_page.is_personal_event_created(event_name), "Событие не найдено в расписании"
+
+    with allure.step("Удалить созданное событие"):
+        event = schedule_page.get_personal_event_from_schedule(event_name, event_slot.start_time, event_slot.end_time)
+        assert event, "Созданное событие не найдено в расписании"
+        schedule_page.scroll_to_element(event)
+        schedule_page.delete_personal_event(event)
+
+    with allure.step("Проверить, что событие удалено"):
+        schedule_page.refresh_page()
+        assert schedule_page.is_doesnt_exist_personal_event(event_name, event_slot.start_time, event_slot.end_time), \
+            "Событие не было удалено"
 
-    # with allure.step("Обновить страницу"):
-    #     schedule_page.driver.refresh()
+
+@allure.feature(FEATURE)
+@allure.story(STORY_SCHEDULE)
+@pytest.mark.ui
+@pytest.mark.personal_events(1)
+def test_delete_personal_event(auth, personal_events, event_manager):
+    """
+    Тест удаления личного события. Событие-предусловие создается через API.
+    """
+    prepared_event = personal_events[0]
+
+    with allure.step("Открыть страницу с расписанием"):
+        schedule_page = SchedulePage(auth)
+        schedule_page.open()
 
     with allure.step("Найти и удалить созданное событие"):
         event = schedule_page.get_personal_event_from_schedule(
-            event_name,
-            TestData.PERSONAL_EVENT_START_TIME,
-            TestData.PERSONAL_EVENT_END_TIME
+            prepared_event.title,
+            prepared_event.slot.start_time,
+            prepared_event.slot.end_time
         )
         logger.debug(event)
-        if event:
-            schedule_page.scroll_to_element(event)
-            schedule_page.delete_personal_event(event)
+        assert event, "Созданное через API событие не найдено в расписании"
+
+        schedule_page.scroll_to_element(event)
+        schedule_page.delete_personal_event(event)
 
     with allure.step("Проверить, что событие удалено"):
-        schedule_page.driver.refresh()
+        schedule_page.refresh_page()
         assert schedule_page.is_doesnt_exist_personal_event(
-            TestData.PERSONAL_EVENT_NAME,
-            TestData.PERSONAL_EVENT_START_TIME,
-            TestData.PERSONAL_EVENT_END_TIME
+            prepared_event.title,
+            prepared_event.slot.start_time,
+            prepared_event.slot.end_time
         ), "Событие не было удалено"
+
+    event_manager.forget(prepared_event.id)